@@ -24,6 +24,7 @@ resources_require = {
         "black==19.3b0",
     ],
     "visibility": ["prctl==1.6.1", "GitPython==2.1.11"],
+    "uvloop": ["uvloop==0.12.2"],
 }
 
 requirements = [
@@ -1,5 +1,12 @@
 class CantSolveDependencies(Exception):
-    pass
+    def __init__(self, message, cycle=None):
+        """
+        Args:
+            message (str): Error message.
+            cycle (list): Nodes of the dependency cycle, the first node is repeated at the end.
+        """
+        super().__init__(message)
+        self.cycle = cycle
 
 
 def resolve_dependency_order(dependency_graph):
@@ -7,31 +14,75 @@ def resolve_dependency_order(dependency_graph):
 
     Args:
         dependency_graph (dict): Dict that represent dependency graph,
-        example a -> b -> c = {"a": ["b"], "b": ["c"], "c":[]}.
+        example a -> b -> c = {"a": ["b"], "b": ["c"], "c":[]}. It isn't modified.
 
     Returns:
         list: Ordered dependencies.
+
+    Raises:
+        CantSolveDependencies: The graph has a cycle or an unknown dependency.
+    """
+    return [node for level in resolve_dependency_levels(dependency_graph) for node in level]
+
+
+def resolve_dependency_levels(dependency_graph):
+    """Group the nodes of a dependency graph in levels, the dependencies of the nodes of a level are in the previous
+    levels. The nodes of the same level don't depend on each other, so they can be started concurrently.
+
+    It is a topological sort (Kahn's algorithm) in O(nodes + dependencies) time. The nodes of each level keep the order
+    of the graph.
+
+    Args:
+        dependency_graph (dict): Dict that represent dependency graph, it isn't modified.
+
+    Returns:
+        list: List of levels, each level is a list of nodes.
+
+    Raises:
+        CantSolveDependencies: The graph has a cycle or an unknown dependency.
+    """
+    pending_dependencies = {}
+    dependents = {node: [] for node in dependency_graph}
+    for node, dependencies in dependency_graph.items():
+        dependencies = set(dependencies)
+        for dependency in dependencies:
+            try:
+                dependents[dependency].append(node)
+            except KeyError:
+                raise CantSolveDependencies(f"Unsolved graph: {node} depends on the unknown node {dependency}")
+        pending_dependencies[node] = len(dependencies)
+
+    levels = []
+    level = [node for node, count in pending_dependencies.items() if count == 0]
+    while level:
+        levels.append(level)
+        next_level = []
+        for node in level:
+            for dependent in dependents[node]:
+                pending_dependencies[dependent] -= 1
+                if pending_dependencies[dependent] == 0:
+                    next_level.append(dependent)
+        level = next_level
+
+    unsolved = {node for node, count in pending_dependencies.items() if count > 0}
+    if unsolved:
+        cycle = _find_cycle(dependency_graph, unsolved)
+        raise CantSolveDependencies(f"Unsolved graph, dependency cycle: {' -> '.join(cycle)}", cycle)
+    return levels
+
+
+def _find_cycle(dependency_graph, unsolved):
+    """Return a dependency cycle among the unsolved nodes.
+
+    Each unsolved node has at least one unsolved dependency, so following them from any unsolved node always reaches
+    an already visited node, the start of a cycle.
     """
-    ordered_deps = []
-    number_of_nodes = len(dependency_graph.keys())
-    solved_something = True
-    while len(ordered_deps) < number_of_nodes and solved_something:
-        solved_something = False
-        for node, dependencies in dependency_graph.items():
-            if not dependencies and node not in ordered_deps:
-                _resolve_one(node, dependency_graph)
-                ordered_deps.append(node)
-                solved_something = True
-
-    if len(ordered_deps) == number_of_nodes:
-        return ordered_deps
-    else:
-        raise CantSolveDependencies(f"Unsolved graph: {dependency_graph}")
-
-
-def _resolve_one(node, dependency_graph):
-    for dependencies in dependency_graph.values():
-        try:
-            dependencies.remove(node)
-        except Exception:
-            pass
+    node = next(node for node in dependency_graph if node in unsolved)
+    path = []
+    visited = {}
+    while node not in visited:
+        visited[node] = len(path)
+        path.append(node)
+        node = next(dependency for dependency in dependency_graph[node] if dependency in unsolved)
+    cycle_start = visited[node]
+    return path[cycle_start:] + [node]
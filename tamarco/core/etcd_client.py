@@ -0,0 +1,223 @@
+import asyncio
+import itertools
+import logging
+import os
+import ssl
+import weakref
+
+import aio_etcd
+import aiohttp
+
+from tamarco.core.patterns import Singleton
+from tamarco.resources.basic.metrics.meters import Counter, Gauge
+
+logger = logging.getLogger("tamarco.etcd")
+
+ETCD_POOL_SIZE = 10
+ETCD_KEEPALIVE_TIMEOUT = 30
+ETCD_REQUEST_TIMEOUT = 10
+ETCD_WATCH_TIMEOUT = 300
+
+
+def get_etcd_pool_configuration_from_environment_variables():
+    """Returns the configuration of the etcd connection pool from the environment variables.
+
+    Returns:
+        dict: Pool size, keep alive timeout, request timeout and round robin configuration.
+    """
+    return {
+        "pool_size": int(os.environ.get("TAMARCO_ETCD_POOL_SIZE", ETCD_POOL_SIZE)),
+        "keepalive_timeout": float(os.environ.get("TAMARCO_ETCD_KEEPALIVE_TIMEOUT", ETCD_KEEPALIVE_TIMEOUT)),
+        "request_timeout": float(os.environ.get("TAMARCO_ETCD_REQUEST_TIMEOUT", ETCD_REQUEST_TIMEOUT)),
+        "round_robin": os.environ.get("TAMARCO_ETCD_ROUND_ROBIN", "false").lower() == "true",
+    }
+
+
+def _create_ssl_context(ssl_verify=ssl.CERT_REQUIRED, cert=None, ca_cert=None):
+    """Return the SSL context of the https connections, configured like the one of aio_etcd.Client.
+
+    Args:
+        ssl_verify: Verify mode of the certificate of the server.
+        cert: Client certificate, a file name or a tuple with the certificate and key file names.
+        ca_cert (str): CA certificate used to validate the server.
+
+    Returns:
+        ssl.SSLContext: SSL context.
+    """
+    ssl_context = ssl.create_default_context()
+    if ssl_verify == ssl.CERT_NONE:
+        ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl_verify
+    if isinstance(cert, tuple):
+        ssl_context.load_cert_chain(*cert)
+    elif cert:
+        ssl_context.load_cert_chain(cert)
+    if ca_cert:
+        ssl_context.load_verify_locations(ca_cert)
+    return ssl_context
+
+
+class PooledEtcdClient(aio_etcd.Client):
+    """Etcd client with a bounded pool of keep alive connections and timeouts in each request.
+
+    With round robin enabled the requests are distributed across the members of the cluster, the member list is
+    read from etcd with the first request.
+    """
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=2379,
+        pool_size=ETCD_POOL_SIZE,
+        keepalive_timeout=ETCD_KEEPALIVE_TIMEOUT,
+        request_timeout=ETCD_REQUEST_TIMEOUT,
+        watch_timeout=ETCD_WATCH_TIMEOUT,
+        round_robin=False,
+        loop=None,
+        **kwargs,
+    ):
+        """
+        Args:
+            host (str): Etcd host.
+            port (int): Etcd port.
+            pool_size (int): Maximum number of connections.
+            keepalive_timeout (float): Seconds that an idle connection is kept open.
+            request_timeout (float): Timeout in seconds of each request.
+            watch_timeout (float): Timeout in seconds of the watch requests, they wait for a change of the key.
+            round_robin (bool): Distribute the requests across the members of the cluster.
+            loop: Event loop of the client.
+            **kwargs: Other aio_etcd.Client arguments.
+        """
+        super().__init__(host=host, port=port, per_host_pool_size=pool_size, loop=loop, **kwargs)
+        default_session = self._client
+        connector_kwargs = {}
+        if self._protocol == "https":
+            connector_kwargs["ssl"] = _create_ssl_context(
+                kwargs.get("ssl_verify", ssl.CERT_REQUIRED), kwargs.get("cert"), kwargs.get("ca_cert")
+            )
+        connector = aiohttp.TCPConnector(
+            limit=pool_size, limit_per_host=pool_size, keepalive_timeout=keepalive_timeout, **connector_kwargs
+        )
+        self._client = aiohttp.ClientSession(connector=connector)
+        default_session.detach()
+
+        self.pool_size = pool_size
+        self.request_timeout = aiohttp.ClientTimeout(total=request_timeout)
+        self.watch_timeout = aiohttp.ClientTimeout(total=watch_timeout, sock_connect=request_timeout)
+        self.round_robin = round_robin
+        self.members = None
+        self.requests_in_flight = 0
+
+        labels = {"etcd": f"{host}:{port}"}
+        self.requests_in_flight_meter = Gauge("etcd_requests_in_flight", "requests", labels=labels)
+        self.requests_meter = Counter("etcd_requests", "requests", labels=labels)
+
+    async def api_execute(self, path, method, params=None, **kw):
+        """Execute a request with the timeout of its type, in the next member of the cluster with round robin."""
+        if self.round_robin:
+            if self.members is None:
+                await self.refresh_members()
+            if self.members:
+                self._base_uri = next(self.members)
+        # aio_etcd passes the timeout of the watches explicitly as None.
+        if kw.get("timeout") is None:
+            is_watch = isinstance(params, dict) and params.get("wait") == "true"
+            kw["timeout"] = self.watch_timeout if is_watch else self.request_timeout
+
+        self.requests_meter.inc()
+        self._update_requests_in_flight(1)
+        try:
+            return await super().api_execute(path, method, params=params, **kw)
+        finally:
+            self._update_requests_in_flight(-1)
+
+    async def refresh_members(self):
+        """Read the members of the cluster used in the round robin. Without members the configured host is used."""
+        try:
+            machines = await self.machines()
+        except Exception:
+            logger.warning("Error reading the members of the etcd cluster, the round robin is disabled", exc_info=True)
+            machines = []
+        self.members = itertools.cycle(machines) if machines else itertools.cycle([self._base_uri])
+
+    def pool_stats(self):
+        """Return the usage of the connection pool.
+
+        Returns:
+            dict: Size of the pool and number of requests in flight, each one uses a connection of the pool.
+        """
+        return {"size": self.pool_size, "in_flight": self.requests_in_flight}
+
+    def _update_requests_in_flight(self, increment):
+        self.requests_in_flight += increment
+        self.requests_in_flight_meter.set(self.requests_in_flight)
+
+    def close(self):
+        """Release the connections of the client."""
+        client, self._client = self._client, None
+        if client is not None and self._loop.is_running():
+            asyncio.ensure_future(client.close(), loop=self._loop)
+
+    async def close_session(self):
+        """Release the connections of the client waiting until they are closed."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.close()
+
+
+class EtcdClientProvider(metaclass=Singleton):
+    """Provider of the etcd clients shared by the settings, their watchers and the resources.
+
+    There is one client per event loop and etcd configuration, so all the etcd requests of the microservice share the
+    same connection pool. The pool is configured with the environment variables TAMARCO_ETCD_POOL_SIZE,
+    TAMARCO_ETCD_KEEPALIVE_TIMEOUT, TAMARCO_ETCD_REQUEST_TIMEOUT and TAMARCO_ETCD_ROUND_ROBIN.
+    """
+
+    def __init__(self):
+        self.clients = weakref.WeakKeyDictionary()
+
+    def get_client(self, etcd_config, loop=None):
+        """Return the etcd client of the configuration in the event loop, creating it the first time. The client must
+        be created from the running event loop.
+
+        Args:
+            etcd_config (dict): Etcd configuration with host and port keys.
+            loop: Event loop of the client, by default the current event loop.
+
+        Returns:
+            PooledEtcdClient: Shared etcd client.
+        """
+        loop = loop or asyncio.get_event_loop()
+        loop_clients = self.clients.setdefault(loop, {})
+        client_key = tuple(sorted(etcd_config.items()))
+        client = loop_clients.get(client_key)
+        if client is None or client._client is None:
+            pool_config = get_etcd_pool_configuration_from_environment_variables()
+            logger.info(f"Creating etcd client for {etcd_config} with {pool_config}")
+            client = PooledEtcdClient(**etcd_config, **pool_config, loop=loop)
+            loop_clients[client_key] = client
+        return client
+
+    def pool_stats(self, loop=None):
+        """Return the usage of the connection pool of each client of the event loop.
+
+        Args:
+            loop: Event loop of the clients, by default the current event loop.
+
+        Returns:
+            dict: Pool stats by etcd configuration.
+        """
+        loop = loop or asyncio.get_event_loop()
+        return {
+            str(dict(client_key)): client.pool_stats() for client_key, client in self.clients.get(loop, {}).items()
+        }
+
+    async def close(self, loop=None):
+        """Close all the clients of the event loop.
+
+        Args:
+            loop: Event loop of the clients, by default the current event loop.
+        """
+        loop = loop or asyncio.get_event_loop()
+        for client in self.clients.pop(loop, {}).values():
+            await client.close_session()
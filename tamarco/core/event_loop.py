@@ -0,0 +1,93 @@
+import asyncio
+import importlib
+import logging
+import os
+
+logger = logging.getLogger("tamarco.event_loop")
+
+EVENT_LOOP_ENVIRONMENT_VARIABLE = "TAMARCO_EVENT_LOOP"
+ASYNCIO_EVENT_LOOP = "asyncio"
+UVLOOP_EVENT_LOOP = "uvloop"
+
+
+def get_event_loop_from_environment_variable():
+    """Return the event loop implementation of the environment variable TAMARCO_EVENT_LOOP.
+
+    Returns:
+        str: Event loop implementation, None if the variable isn't set.
+    """
+    return os.environ.get(EVENT_LOOP_ENVIRONMENT_VARIABLE) or None
+
+
+def _import_policy(path):
+    module_name, _, class_name = path.rpartition(":") if ":" in path else path.rpartition(".")
+    if not module_name:
+        raise ValueError(f"Invalid event loop policy {path}, expected a path like package.module:PolicyClass")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def get_event_loop_policy_class(event_loop):
+    """Return the event loop policy class of an event loop implementation.
+
+    Args:
+        event_loop (str): `asyncio`, `uvloop` or the import path of a policy class, like `package.module:Policy`.
+
+    Returns:
+        Event loop policy class. The default asyncio policy when uvloop is requested but it isn't installed.
+
+    Raises:
+        ValueError: The import path of the policy is invalid.
+        ImportError: The module of the policy can't be imported.
+    """
+    if event_loop == ASYNCIO_EVENT_LOOP:
+        return asyncio.DefaultEventLoopPolicy
+    if event_loop == UVLOOP_EVENT_LOOP:
+        try:
+            import uvloop
+        except ImportError:
+            logger.warning("The uvloop event loop is configured but uvloop isn't installed, using the asyncio loop")
+            return asyncio.DefaultEventLoopPolicy
+        return uvloop.EventLoopPolicy
+    return _import_policy(event_loop)
+
+
+def install_event_loop_policy(event_loop=None):
+    """Install the event loop policy of an event loop implementation. It should be called before creating the event
+    loop, the policy only applies to the loops created after it.
+
+    Args:
+        event_loop (str): Event loop implementation, see get_event_loop_policy_class. By default the environment
+            variable TAMARCO_EVENT_LOOP. Without any of them the current policy is kept.
+
+    Returns:
+        The installed event loop policy, None if the policy wasn't changed.
+    """
+    event_loop = event_loop or get_event_loop_from_environment_variable()
+    if event_loop is None:
+        return None
+    policy_class = get_event_loop_policy_class(event_loop)
+    current_policy = asyncio.get_event_loop_policy()
+    if type(current_policy) is policy_class:
+        return current_policy
+    policy = policy_class()
+    asyncio.set_event_loop_policy(policy)
+    logger.debug(f"Installed the event loop policy {policy_class.__module__}.{policy_class.__name__}")
+    return policy
+
+
+class LazyEventLoop:
+    """Descriptor of the event loop of a class, created the first time it is read.
+
+    The event loop policy of the class attribute `event_loop` (or the environment variable TAMARCO_EVENT_LOOP) is
+    installed before creating the loop, so the implementation of the loop can be configured after importing the class.
+    Assigning the attribute in an instance replaces the loop of that instance.
+    """
+
+    def __init__(self):
+        self.loop = None
+
+    def __get__(self, instance, owner):
+        if self.loop is None or self.loop.is_closed():
+            install_event_loop_policy(getattr(owner, "event_loop", None))
+            self.loop = asyncio.get_event_loop_policy().get_event_loop()
+        return self.loop
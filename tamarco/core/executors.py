@@ -0,0 +1,208 @@
+import asyncio
+import importlib
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial, wraps
+
+from tamarco.core.patterns import Singleton
+from tamarco.resources.basic.metrics.meters import Gauge, Summary
+
+logger = logging.getLogger("tamarco.executors")
+
+THREAD_POOL = "thread"
+PROCESS_POOL = "process"
+
+
+def get_default_pool_size(kind):
+    """Return the default number of workers of a pool, the same defaults as the standard library.
+
+    Args:
+        kind (str): `thread` or `process`.
+
+    Returns:
+        int: Number of workers.
+    """
+    cpus = os.cpu_count() or 1
+    return min(32, cpus + 4) if kind == THREAD_POOL else cpus
+
+
+def _timed_call(submit_time, fn, args, kwargs):
+    """Call the function in a worker of the pool, returning the time that the call waited in the queue of the pool."""
+    wait_time = time.time() - submit_time
+    return wait_time, fn(*args, **kwargs)
+
+
+def _call_by_reference(module_name, qualified_name, args, kwargs):
+    """Call a decorated function in a worker process. The decorated function can't be pickled because its name
+    refers to the decorator wrapper, so the worker imports the wrapper and calls the original function."""
+    fn = importlib.import_module(module_name)
+    for name in qualified_name.split("."):
+        fn = getattr(fn, name)
+    return getattr(fn, "__wrapped__", fn)(*args, **kwargs)
+
+
+class ManagedExecutor:
+    """Thread or process pool with meters of its usage.
+
+    The pool is created the first time it is used if it wasn't started before.
+    """
+
+    executors_classes = {THREAD_POOL: ThreadPoolExecutor, PROCESS_POOL: ProcessPoolExecutor}
+
+    def __init__(self, kind, size=None):
+        """
+        Args:
+            kind (str): `thread` or `process`.
+            size (int): Number of workers, by default the default of the standard library.
+        """
+        self.kind = kind
+        self.size = size or get_default_pool_size(kind)
+        self.executor = None
+        self.in_flight = 0
+        labels = {"executor": kind}
+        self.utilization_meter = Gauge("executor_utilization", "ratio", labels=labels)
+        self.queue_depth_meter = Gauge("executor_queue_depth", "calls", labels=labels)
+        self.queue_wait_time_meter = Summary("executor_queue_wait_time", "seconds", labels=labels)
+
+    def configure(self, size=None):
+        """Set the number of workers, it applies the next time the pool is started.
+
+        Args:
+            size (int): Number of workers, by default the default of the standard library.
+        """
+        self.size = size or get_default_pool_size(self.kind)
+
+    def start(self):
+        if self.executor is None:
+            logger.debug(f"Starting the {self.kind} pool with {self.size} workers")
+            self.executor = self.executors_classes[self.kind](max_workers=self.size)
+
+    async def stop(self):
+        """Stop the pool waiting for the running calls, without blocking the event loop."""
+        executor, self.executor = self.executor, None
+        if executor is not None:
+            logger.debug(f"Stopping the {self.kind} pool")
+            await asyncio.get_event_loop().run_in_executor(None, partial(executor.shutdown, wait=True))
+
+    def _update_meters(self):
+        self.utilization_meter.set(min(self.in_flight, self.size) / self.size)
+        self.queue_depth_meter.set(max(self.in_flight - self.size, 0))
+
+    async def run(self, fn, *args, **kwargs):
+        """Run a function in the pool.
+
+        Args:
+            fn: Function to run, it must be picklable in a process pool.
+            *args: Arguments of the function.
+            **kwargs: Keyword arguments of the function.
+
+        Returns:
+            Result of the function.
+        """
+        self.start()
+        self.in_flight += 1
+        self._update_meters()
+        try:
+            wait_time, result = await asyncio.get_event_loop().run_in_executor(
+                self.executor, _timed_call, time.time(), fn, args, kwargs
+            )
+        finally:
+            self.in_flight -= 1
+            self._update_meters()
+        self.queue_wait_time_meter.observe(wait_time)
+        return result
+
+
+class ExecutorsManager(metaclass=Singleton):
+    """Thread and process pools of the microservice, to run blocking and CPU bound code without blocking the event
+    loop.
+
+    The pools are sized with the settings `system.executors.thread_pool_size` and `system.executors.process_pool_size`,
+    they are started with the settings of the microservice and stopped after the resources.
+    """
+
+    def __init__(self):
+        self.thread_pool = ManagedExecutor(THREAD_POOL)
+        self.process_pool = ManagedExecutor(PROCESS_POOL)
+
+    def configure(self, thread_pool_size=None, process_pool_size=None):
+        """Set the number of workers of the pools.
+
+        Args:
+            thread_pool_size (int): Number of threads, by default min(32, cpus + 4).
+            process_pool_size (int): Number of processes, by default the number of cpus.
+        """
+        self.thread_pool.configure(thread_pool_size)
+        self.process_pool.configure(process_pool_size)
+
+    def start(self):
+        self.thread_pool.start()
+        self.process_pool.start()
+
+    async def stop(self):
+        await asyncio.gather(self.thread_pool.stop(), self.process_pool.stop())
+
+    async def run_cpu(self, fn, *args, **kwargs):
+        """Run a CPU bound function in the process pool, see run_cpu."""
+        return await self.process_pool.run(fn, *args, **kwargs)
+
+    async def run_in_thread(self, fn, *args, **kwargs):
+        """Run a blocking function in the thread pool, see run_in_thread."""
+        return await self.thread_pool.run(fn, *args, **kwargs)
+
+
+async def run_cpu(fn, *args, **kwargs):
+    """Run a CPU bound function in the process pool of the microservice.
+
+    Example::
+
+        digest = await run_cpu(hash_file, path)
+
+    Args:
+        fn: Function to run, it must be picklable (a function defined at the module level).
+        *args: Arguments of the function, they must be picklable.
+        **kwargs: Keyword arguments of the function, they must be picklable.
+
+    Returns:
+        Result of the function.
+    """
+    return await ExecutorsManager().run_cpu(fn, *args, **kwargs)
+
+
+async def run_in_thread(fn, *args, **kwargs):
+    """Run a blocking function in the thread pool of the microservice.
+
+    Args:
+        fn: Function to run.
+        *args: Arguments of the function.
+        **kwargs: Keyword arguments of the function.
+
+    Returns:
+        Result of the function.
+    """
+    return await ExecutorsManager().run_in_thread(fn, *args, **kwargs)
+
+
+def cpu_bound(fn):
+    """Decorator to run a CPU bound function in the process pool of the microservice, the decorated function is a
+    coroutine function.
+
+    Example::
+
+        @cpu_bound
+        def resize(image, size):
+            ...
+
+        thumbnail = await resize(image, (64, 64))
+
+    Args:
+        fn: Function defined at the module level.
+    """
+
+    @wraps(fn)
+    async def wrapper(*args, **kwargs):
+        return await run_cpu(_call_by_reference, fn.__module__, fn.__qualname__, args, kwargs)
+
+    return wrapper
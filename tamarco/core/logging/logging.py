@@ -8,6 +8,7 @@ from .formatters.logstash import LogstashFormatterVersion1
 from .formatters.syslog import SyslogFormatter
 
 PROFILES = {"DEVELOP": {"loglevel": "DEBUG"}, "PRODUCTION": {"loglevel": "INFO"}, "TESTING": {"loglevel": "DEBUG"}}
+PROFILE_WATCH_DEBOUNCE = 0.5
 
 
 class Logging(metaclass=Singleton):
@@ -235,14 +236,15 @@ class Logging(metaclass=Singleton):
         the microservice logging.
         """
 
-        async def watcher_callback(key, setting):
-            """ Callback when the watcher reports that the key `key` has changed in the etcd.
+        async def watcher_callback(changes):
+            """ Callback when the watcher reports that the profile keys have changed in the etcd. The changes of a
+            burst are received together, so the logging is configured again only once.
 
             Args:
-                key (str): etcd key.
-                setting (str): The setting value already formatted.
+                changes (dict): Changed etcd keys and their setting values already formatted.
             """
-            await self.settings.update_internal_settings(key, setting)
+            for key, setting in changes.items():
+                await self.settings.update_internal_settings(key, setting)
             profile = await self.settings.get("profile")
 
             if profile in PROFILES.keys():
@@ -253,4 +255,4 @@ class Logging(metaclass=Singleton):
 
                 logging.config.dictConfig(self.logging_config)
 
-        await self.settings.watch("profile", watcher_callback)
+        await self.settings.watch("profile", watcher_callback, debounce=PROFILE_WATCH_DEBOUNCE, batch=True)
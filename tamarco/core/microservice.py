@@ -1,30 +1,58 @@
 import asyncio
 import logging
+import os
+import signal
 import sys
+import threading
 import time
 import uuid
 from collections import OrderedDict
 from collections.abc import Callable
 from functools import partial
-from threading import Thread
 from typing import Coroutine, Union
 
-from tamarco.core.dependency_resolver import CantSolveDependencies, resolve_dependency_order
+from tamarco.core.dependency_resolver import CantSolveDependencies, resolve_dependency_levels
+from tamarco.core.event_loop import LazyEventLoop
+from tamarco.core.executors import ExecutorsManager
 from tamarco.core.logging.logging import Logging
 from tamarco.core.patterns import Singleton
 from tamarco.core.settings.settings import Settings, SettingsView
-from tamarco.core.signals import SignalsManager
-from tamarco.core.tasks import TasksManager, get_task_wrapper, get_thread_wrapper
+from tamarco.core.signals import SignalsManager, format_stacks
+from tamarco.core.tasks import DRAIN_TIMEOUT, TasksManager, get_task_wrapper, get_thread_wrapper
+from tamarco.core.timers import FIXED_RATE, OVERLAP_SKIP, Timer
 from tamarco.core.utils import Informer, ROOT_SETTINGS, get_fn_full_signature
+from tamarco.core.workers import (
+    WorkersReportServer,
+    WorkersSupervisor,
+    check_workers_ports,
+    get_workers_from_environment_variable,
+)
 from tamarco.resources.bases import BaseResource
+from tamarco.resources.basic.metrics.meters import Gauge
 from tamarco.resources.basic.metrics.resource import MetricsResource
 from tamarco.resources.basic.registry.resource import Registry
 from tamarco.resources.basic.status.resource import StatusResource
+from tamarco.resources.basic.status.status_codes import StatusCodes
 from tamarco.resources.debug.profiler import ProfilerResource
 from tamarco.resources.io.http.resource import HTTPServerResource
 
 logger = logging.getLogger("tamarco")
 
+STARTUP_PHASES = ("bind", "start_settings", "start_logging", "pre_start", "start", "post_start")
+RESOURCES_STARTUP_HOOKS = ("bind", "pre_start", "start", "post_start")
+
+
+async def close_etcd_clients(loop):
+    """Close the etcd clients of the event loop. The etcd client is only imported when the settings or a resource use
+    etcd, otherwise there aren't clients to close.
+
+    Args:
+        loop: Event loop of the clients.
+    """
+    etcd_client = sys.modules.get("tamarco.core.etcd_client")
+    if etcd_client is not None:
+        await etcd_client.EtcdClientProvider().close(loop)
+
 
 class MicroserviceBase(metaclass=Singleton):
     # Name of the microservice, is used by the resources
@@ -42,15 +70,33 @@ class MicroserviceBase(metaclass=Singleton):
     # Loggers to be added by the application code.
     extra_loggers_names = []
 
-    # Main event loop.
-    loop = asyncio.get_event_loop()
+    # Event loop implementation: `asyncio`, `uvloop` or the import path of an event loop policy. By default the
+    # environment variable TAMARCO_EVENT_LOOP or the current policy.
+    event_loop = None
+
+    # Main event loop, created with the configured implementation the first time it is used.
+    loop = LazyEventLoop()
+
+    # Index of the worker process in the worker mode, None in the supervisor or without workers.
+    worker_index = None
 
     # Manager for task.
     tasks_manager = TasksManager()
 
+    # Seconds that the in-flight tasks and the threads have to finish when the microservice stops, before being
+    # cancelled. It can be changed with the setting `system.shutdown.drain_timeout`.
+    drain_timeout = DRAIN_TIMEOUT
+
+    # Seconds that the microservice has to stop gracefully before forcing the exit. It can be changed with the setting
+    # `system.shutdown.stop_timeout`.
+    stop_timeout = 30
+
     # Settings manager.
     settings = Settings()
 
+    # Thread and process pools for blocking and CPU bound code.
+    executors = ExecutorsManager()
+
     # Logging manager.
     logging = Logging()
 
@@ -78,19 +124,23 @@ class MicroserviceBase(metaclass=Singleton):
         }
 
         try:
-            resources_dep_ordered = resolve_dependency_order(dependency_graph)
+            cls.resources_levels = resolve_dependency_levels(dependency_graph)
         except CantSolveDependencies as e:
             print(e, file=sys.stderr)
             exit(12)
         else:
-            for name in resources_dep_ordered:
-                cls.resources[name] = getattr(cls, name)
+            for level in cls.resources_levels:
+                for name in level:
+                    cls.resources[name] = getattr(cls, name)
 
         return super().__new__(cls, *args, **kwargs)
 
     def __init__(self):
         assert self.name is not None, "Error, name should be defined in your microservice class"
         self.logger = None
+        self.resources_lifecycle_times = {}
+        self.resources_lifecycle_failures = {}
+        self.startup_times = OrderedDict()
         self._configure_provisional_logger()
 
     def _configure_provisional_logger(self):
@@ -111,27 +161,114 @@ class MicroserviceBase(metaclass=Singleton):
         await self.settings.bind(self.loop)
 
         for name, resource in self.resources.items():
+            start_time = time.perf_counter()
             try:
                 await resource.bind(self, name)
             except Exception:
                 self.logger.exception(f"Unexpected exception binding the resource {resource}")
                 exit(11)
+            self._record_resource_time(name, "bind", time.perf_counter() - start_time)
 
-    async def run_in_all_resources(self, method):
+    async def run_in_all_resources(self, method, reverse=False):
         """Run the method name in all the resources.
 
+        The resources are run by dependency levels: the resources of a level are run concurrently once the method has
+        finished in all the resources of the previous levels.
+
         Args:
             method (str): Method name to run in all the resources.
+            reverse (bool): Run the levels in reverse dependency order, the resources are stopped before their
+                dependencies.
         """
-        for resource in self.resources.values():
-            self.logger.debug(f"Calling {method} of resource {resource.name}")
-            try:
-                await getattr(resource, method)()
-            except Exception:
-                self.logger.exception(f"Error in {method} of resource {resource}")
-            else:
-                if method == "start":
-                    self.logger.info(f"Started {resource.name} from {self.name}")
+        for level in reversed(self.resources_levels) if reverse else self.resources_levels:
+            await asyncio.gather(*(self._run_in_resource(self.resources[name], method) for name in level))
+
+    async def _run_in_resource(self, resource, method):
+        """Run the method of a resource with the lifecycle timeout of the resource, recording its duration.
+
+        A method that raises an exception or exceeds the timeout is recorded in resources_lifecycle_failures and the
+        status of the resource becomes failed.
+
+        Args:
+            resource (BaseResource): Resource.
+            method (str): Method name to run in the resource.
+        """
+        self.logger.debug(f"Calling {method} of resource {resource.name}")
+        start_time = time.perf_counter()
+        try:
+            await asyncio.wait_for(getattr(resource, method)(), timeout=resource.lifecycle_timeout)
+        except asyncio.TimeoutError:
+            self.logger.error(f"Timeout of {resource.lifecycle_timeout} seconds in {method} of resource {resource}")
+            self._record_resource_failure(resource, method, f"Timeout of {resource.lifecycle_timeout} seconds")
+        except Exception as e:
+            self.logger.exception(f"Error in {method} of resource {resource}")
+            self._record_resource_failure(resource, method, repr(e))
+        else:
+            elapsed_time = time.perf_counter() - start_time
+            self._record_resource_time(resource.name, method, elapsed_time)
+            if method == "start":
+                self.logger.info(f"Started {resource.name} from {self.name} in {elapsed_time:.3f} seconds")
+
+    def _record_resource_time(self, name, method, elapsed_time):
+        self.resources_lifecycle_times.setdefault(name, {})[method] = elapsed_time
+        Gauge("resource_lifecycle_time", "seconds", labels={"resource": name, "method": method}).set(elapsed_time)
+
+    def _record_resource_failure(self, resource, method, reason):
+        self.resources_lifecycle_failures.setdefault(resource.name, {})[method] = reason
+        resource._status = StatusCodes.FAILED
+
+    async def _run_startup_phase(self, phase, method):
+        """Run a phase of the startup, recording its duration.
+
+        Args:
+            phase (str): Name of the phase.
+            method: Coroutine function of the phase.
+        """
+        start_time = time.perf_counter()
+        await method()
+        elapsed_time = time.perf_counter() - start_time
+        self.startup_times[phase] = elapsed_time
+        Gauge("startup_phase_time", "seconds", labels={"phase": phase}).set(elapsed_time)
+
+    def get_startup_report(self):
+        """Report of the duration of the startup, measured with a monotonic clock.
+
+        Returns:
+            dict: Total seconds of the startup, seconds of each phase, seconds of the startup hooks of each
+                resource and the startup hooks that failed.
+        """
+        return {
+            "total": sum(self.startup_times.values()),
+            "phases": dict(self.startup_times),
+            "resources": {
+                name: {method: times[method] for method in RESOURCES_STARTUP_HOOKS if method in times}
+                for name, times in self.resources_lifecycle_times.items()
+            },
+            "failures": {
+                name: {method: failures[method] for method in RESOURCES_STARTUP_HOOKS if method in failures}
+                for name, failures in self.resources_lifecycle_failures.items()
+            },
+        }
+
+    def _log_startup_report(self):
+        report = self.get_startup_report()
+        Gauge("startup_time", "seconds").set(report["total"])
+        phases = ", ".join(f"{phase} {elapsed_time:.3f}" for phase, elapsed_time in report["phases"].items())
+        hooks = [
+            (elapsed_time, f"{name}.{method}")
+            for name, times in report["resources"].items()
+            for method, elapsed_time in times.items()
+        ]
+        slowest_hook = ""
+        if hooks:
+            elapsed_time, hook = max(hooks)
+            slowest_hook = f", slowest resource hook {hook} {elapsed_time:.3f}"
+        self.logger.info(
+            f"Microservice {self.name} started in {report['total']:.3f} seconds (phases: {phases}{slowest_hook})"
+        )
+        failed_hooks = [f"{name}.{method}" for name, failures in report["failures"].items() for method in failures]
+        if failed_hooks:
+            self.logger.error(f"Microservice {self.name} started with failed resource hooks: {', '.join(failed_hooks)}")
 
     async def start_logging(self):
         """Initializes the logging of the microservice."""
@@ -152,12 +289,28 @@ class MicroserviceBase(metaclass=Singleton):
         await self.settings.start()
         self.deploy_name = await self.settings.get(f"{ROOT_SETTINGS}.deploy_name")
         await self._configure_logging_settings()
+        await self._configure_executors_settings()
+        await self._configure_shutdown_settings()
         await self._configure_resource_settings()
 
     async def _configure_logging_settings(self):
         self.logger.info("Configuring logging settings")
         self.logging.configure_settings(SettingsView(self.settings, f"{ROOT_SETTINGS}.logging", self.name))
 
+    async def _configure_executors_settings(self):
+        self.logger.info("Configuring executors settings")
+        executors_settings = SettingsView(self.settings, f"{ROOT_SETTINGS}.executors", self.name)
+        self.executors.configure(
+            thread_pool_size=await executors_settings.get("thread_pool_size", None),
+            process_pool_size=await executors_settings.get("process_pool_size", None),
+        )
+        self.executors.start()
+
+    async def _configure_shutdown_settings(self):
+        shutdown_settings = SettingsView(self.settings, f"{ROOT_SETTINGS}.shutdown", self.name)
+        self.drain_timeout = await shutdown_settings.get("drain_timeout", self.drain_timeout)
+        self.stop_timeout = await shutdown_settings.get("stop_timeout", self.stop_timeout)
+
     async def _configure_resource_settings(self):
         self.logger.info("Configuring resources settings")
         for resource in self.resources.values():
@@ -183,20 +336,22 @@ class MicroserviceContext(MicroserviceBase):
 
     async def start(self):
         self.tasks_manager.set_loop(self.loop)
-        await self.bind()
-        await self.start_settings()
-        await self.start_logging()
-        await self.run_in_all_resources("pre_start")
-        await self.run_in_all_resources("start")
-        await self.run_in_all_resources("post_start")
+        await self._run_startup_phase("bind", self.bind)
+        await self._run_startup_phase("start_settings", self.start_settings)
+        await self._run_startup_phase("start_logging", self.start_logging)
+        for hook in ("pre_start", "start", "post_start"):
+            await self._run_startup_phase(hook, partial(self.run_in_all_resources, hook))
         self._collect_tasks()
         self.tasks_manager.start_all()
+        self._log_startup_report()
 
     async def stop(self):
-        self.tasks_manager.stop_all()
+        await self.tasks_manager.stop_all_gracefully(self.drain_timeout)
         await self.stop_settings()
-        await self.run_in_all_resources("stop")
-        await self.run_in_all_resources("post_stop")
+        await self.run_in_all_resources("stop", reverse=True)
+        await self.run_in_all_resources("post_stop", reverse=True)
+        await self.executors.stop()
+        await close_etcd_clients(self.loop)
 
 
 class Microservice(MicroserviceBase):
@@ -212,8 +367,9 @@ class Microservice(MicroserviceBase):
     # the service when necessary.
     signals_manager = SignalsManager()
 
-    # Default http server resource. It is used by the metrics and status resource to expose information.
-    tamarco_http_report_server = HTTPServerResource()
+    # Default http server resource. It is used by the metrics and status resource to expose information. In the worker
+    # mode each worker has its own report server and the supervisor aggregates them in the configured port.
+    tamarco_http_report_server = HTTPServerResource(shared_between_workers=False)
 
     # Default metric resource.
     metrics = MetricsResource()
@@ -229,11 +385,50 @@ class Microservice(MicroserviceBase):
     # and their IPs to be used by a discovery system.
     registry = Registry()
 
+    # Number of worker processes. By default the environment variable TAMARCO_WORKERS or a single process.
+    workers = None
+
     def __init__(self):
         super().__init__()
+        self.stop_task = None
+        self.reload_task = None
         self.tasks_manager.set_loop(self.loop)
         self.signals_manager.set_loop(self.loop)
 
+    def _register_signals_handlers(self):
+        """Handle the signals of the microservice: SIGTERM stops it gracefully, SIGHUP reloads the settings and SIGUSR2
+        logs the stacks of the tasks and the threads."""
+        self.signals_manager.register_signal(self._stop_on_signal, signal.SIGTERM)
+        self.signals_manager.register_signal(self._reload_settings_on_signal, signal.SIGHUP)
+        self.signals_manager.register_signal(self._dump_stacks_on_signal, signal.SIGUSR2)
+
+    def _stop_on_signal(self, signum, frame):
+        if self.stop_task is None:
+            self.logger.info(f"Received the signal {signum}, stopping the microservice {self.name} gracefully")
+            self.stop_task = asyncio.ensure_future(self.stop_gracefully(), loop=self.loop)
+
+    def _reload_settings_on_signal(self, signum, frame):
+        # The reload runs in its own task, so the timeout of the signal handlers doesn't cancel it halfway.
+        if self.reload_task is not None and not self.reload_task.done():
+            self.logger.info(
+                f"Received the signal {signum}, the settings of the microservice {self.name} are already being "
+                f"reloaded"
+            )
+            return
+        self.logger.info(f"Received the signal {signum}, reloading the settings of the microservice {self.name}")
+        self.reload_task = asyncio.ensure_future(self._reload_settings(), loop=self.loop)
+
+    async def _reload_settings(self):
+        try:
+            await self.settings.reload()
+        except Exception:
+            self.logger.warning(
+                f"Unexpected exception reloading the settings of the microservice {self.name}", exc_info=True
+            )
+
+    def _dump_stacks_on_signal(self, signum, frame):
+        self.logger.info(f"Received the signal {signum}, stacks of the microservice {self.name}:\n{format_stacks()}")
+
     async def pre_start(self):
         """Pre start stage of lifecycle.
         This method can be overwritten by the user to add some logic in the start.
@@ -261,33 +456,43 @@ class Microservice(MicroserviceBase):
         """Stop stage of the lifecycle.
         This method can be overwritten by the user to add some logic to the shut down.
         This method should close all the I/O operations opened by the resources.
+
+        The in-flight tasks and the threads are drained before stopping the resources, that are stopped in reverse
+        dependency order.
         """
         self.logger.info("============ Stopping ============")
-        await self.run_in_all_resources("stop")
+        await self.tasks_manager.stop_all_gracefully(self.drain_timeout)
+        await self.run_in_all_resources("stop", reverse=True)
         await self.stop_settings()
-        self.tasks_manager.stop_all()
 
     async def post_stop(self):
         """Post stop stage of the lifecycle.
         This method can be overwritten by the user to add some logic to the shut down.
         """
         self.logger.info("============ Post Stopping ============")
-        await self.run_in_all_resources("post_stop")
+        await self.run_in_all_resources("post_stop", reverse=True)
+        await self.executors.stop()
+        await close_etcd_clients(self.loop)
 
     async def _setup(self):
-        await self.bind()
-        await self.start_settings()
-        await self.start_logging()
-        await self.pre_start()
-        await self.start()
-        await self.post_start()
+        for phase in STARTUP_PHASES:
+            await self._run_startup_phase(phase, getattr(self, phase))
+        self._log_startup_report()
 
     def run(self):
         """Run a microservice.
         It initializes the main event loop of asyncio, so this function only are going to end when the microservice
         ends its live cycle.
+
+        With more than one worker the process becomes a supervisor of the worker processes, each one running its own
+        event loop.
         """
+        workers = self.workers or get_workers_from_environment_variable() or 1
+        if workers > 1 and self.worker_index is None:
+            self._run_workers(workers)
+            return
         self.logger.info(f"Running microservice {self.name}. Calling setup method")
+        self._register_signals_handlers()
         try:
             self.loop.run_until_complete(self._setup())
             self.loop.run_forever()
@@ -298,47 +503,140 @@ class Microservice(MicroserviceBase):
             )
             self.loop.run_until_complete(self.stop_gracefully())
 
+    def _run_workers(self, workers):
+        """Run the microservice in several worker processes.
+
+        The whole settings tree is loaded once in the supervisor and the workers inherit it in the settings cache, so
+        their reads of the settings don't reach the external backend. The HTTP servers share their port with
+        SO_REUSEPORT, except the report server: each worker has its own one and a process forked by the supervisor
+        serves the metrics and the status of all the workers in the configured port.
+
+        Args:
+            workers (int): Number of workers.
+
+        Raises:
+            WorkersPortsCollision: When the ports of the workers collide with the ports of the HTTP servers.
+        """
+        self.logger.info(f"Running microservice {self.name} with {workers} workers")
+        report_host, report_port, report_ports_base = self.loop.run_until_complete(
+            self._load_settings_for_workers(workers)
+        )
+        report_server = None
+        if report_host is not None and report_port is not None:
+            report_server = WorkersReportServer(report_host, int(report_port), workers, report_ports_base)
+            report_server.start()
+        supervisor = WorkersSupervisor(self._run_worker, workers)
+        try:
+            supervisor.run()
+        finally:
+            if report_server is not None:
+                report_server.stop()
+
+    async def _load_settings_for_workers(self, workers):
+        """Load the whole settings tree in the supervisor, the workers are forked with it in the settings cache. The
+        ports of the HTTP servers are checked against the ports that each worker takes for its own servers.
+
+        Args:
+            workers (int): Number of workers.
+
+        Returns:
+            tuple: Host, port and workers ports base of the report server.
+
+        Raises:
+            WorkersPortsCollision: When the ports of the workers collide with the ports of the HTTP servers.
+        """
+        await self.settings.bind(self.loop)
+        await self.settings.start()
+        await self.settings.get(ROOT_SETTINGS, None)
+        shared_ports, own_ports = {}, {}
+        for name, resource in self.resources.items():
+            if not isinstance(resource, HTTPServerResource):
+                continue
+            server_settings = SettingsView(self.settings, f"{ROOT_SETTINGS}.resources.{name}", self.name)
+            port = await server_settings.get("port", None)
+            if port is None:
+                continue
+            if resource.shared_between_workers:
+                shared_ports[name] = int(port)
+            else:
+                ports_base = await server_settings.get("workers_ports_base", None)
+                own_ports[name] = (int(port), None if ports_base is None else int(ports_base))
+        report_settings = SettingsView(
+            self.settings, f"{ROOT_SETTINGS}.resources.tamarco_http_report_server", self.name
+        )
+        report_host = await report_settings.get("host", None)
+        await self.settings.stop()
+        await close_etcd_clients(self.loop)
+        check_workers_ports(shared_ports, own_ports, workers)
+        report_port, report_ports_base = own_ports.get("tamarco_http_report_server", (None, None))
+        return report_host, report_port, report_ports_base
+
+    def _run_worker(self, worker_index):
+        """Run the microservice in a worker process with a new event loop.
+
+        Args:
+            worker_index (int): Index of the worker.
+        """
+        self.worker_index = worker_index
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.tasks_manager.set_loop(self.loop)
+        self.signals_manager.set_loop(self.loop)
+        self.run()
+
     async def stop_gracefully(self):
         """Stop the microservice gracefully.
-        Shut down the microservice. If after 30 seconds the microservice is not closed gracefully it forces a exit.
+        Shut down the microservice. If after `stop_timeout` seconds the microservice is not closed gracefully it forces
+        a exit.
         """
-
-        thread = Thread(target=self._wait_and_force_exit)
-        thread.start()
+        force_exit_timer = threading.Timer(self.stop_timeout, self._force_exit)
+        force_exit_timer.daemon = True
+        force_exit_timer.start()
         await self.stop()
         await self.post_stop()
+        force_exit_timer.cancel()
         if self.loop.is_running():
             self.loop.stop()
 
-    def _wait_and_force_exit(self):
-        time.sleep(30)
+    def _force_exit(self):
         self.logger.critical("Error stopping all the resources. Forcing exit.")
-        exit(1)
+        os._exit(1)
 
 
-def task(name_or_fn):
+def task(name_or_fn=None, restart_policy=None):
     """Decorator to convert a method of a microservice in a asyncio task.
     The task is started and stopped when the microservice starts and stops respectively.
 
+    Examples:
+        >>> @task
+        >>> async def consume(self):
+        >>>     ...
+
+        >>> @task("consumer", restart_policy=RestartPolicy(max_restarts=5, window=60))
+        >>> async def consume(self):
+        >>>     ...
+
     Args:
         name_or_fn: Name of the task or function. If function the task name is the declared name of the function.
+        restart_policy (RestartPolicy): Restart the task with backoff when it raises an exception. When the task
+            exceeds the restarts of the policy the status of the microservice becomes failed.
     """
 
     def decorator(name, fn):
-        wrapper = get_task_wrapper(fn, name)
+        if not asyncio.iscoroutinefunction(fn):
+            raise Exception(f"Tamarco {fn} task not created! The function is not asynchronous")
+        name = name or get_fn_full_signature(fn)
+        wrapper = get_task_wrapper(fn, name, restart_policy)
         wrapper._mark_task = True
         wrapper._name = name
         return wrapper
 
-    if name_or_fn is str:
-        name = name_or_fn
-        return partial(decorator, name)
+    if isinstance(name_or_fn, str):
+        return partial(decorator, name_or_fn)
+    elif name_or_fn is None:
+        return partial(decorator, None)
     elif callable(name_or_fn):
-        if not asyncio.iscoroutinefunction(name_or_fn):
-            raise Exception(f"Tamarco {name_or_fn} task not created! The function is not asynchronous")
-        fn = name_or_fn
-        name = get_fn_full_signature(fn)
-        return decorator(name, fn)
+        return decorator(None, name_or_fn)
     else:
         raise Exception("task decorator should be used with a parameter (name) that is a str or without parameter")
 
@@ -357,7 +655,7 @@ def thread(name_or_fn):
         wrapper._name = name
         return wrapper
 
-    if name_or_fn is str:
+    if isinstance(name_or_fn, str):
         name = name_or_fn
         return partial(decorator, name)
     elif callable(name_or_fn):
@@ -368,9 +666,21 @@ def thread(name_or_fn):
         raise Exception("task decorator should be used with a parameter (name) that is a str or without parameter")
 
 
-def task_timer(interval=1000, one_shot=False, autostart=False) -> Union[Callable, Coroutine]:
+def task_timer(
+    interval=1000,
+    one_shot=False,
+    autostart=False,
+    mode=FIXED_RATE,
+    jitter=0,
+    overlap=OVERLAP_SKIP,
+    max_queued=1,
+    restart_policy=None,
+) -> Union[Callable, Coroutine]:
     """Decorator to declare a task that should repeated in time intervals.
 
+    The timers of the microservice share a scheduler with the deadlines computed from the event loop clock, so the
+    period doesn't drift with the execution time (see tamarco.core.timers.Timer).
+
     Examples:
         >>> @task_timer()
         >>> async def execute(*arg,**kwargs)
@@ -380,39 +690,58 @@ def task_timer(interval=1000, one_shot=False, autostart=False) -> Union[Callable
         >>> async def execute(*args,**kwargs)
         >>>     print('tick')
 
+        >>> @task_timer(interval=60000, mode="fixed_delay", jitter=5000)
+        >>> async def execute(*args,**kwargs)
+        >>>     print('tick')
+
+        >>> @task_timer(interval=1000, overlap="queue", max_queued=5)
+        >>> async def execute(*args,**kwargs)
+        >>>     print('tick')
+
     Args:
         interval (int): Interval in milliseconds when the task is repeated.
         one_shot (bool): Only runs the task once.
         autostart (bool): Task is automatically initialized with the microservice.
+        mode (str): `fixed_rate` to repeat the task every interval or `fixed_delay` to wait the interval after each
+            execution.
+        jitter (int): Maximum random delay in milliseconds added to each execution.
+        overlap (str): What a fixed rate timer does when the previous execution is still running: `skip` the new one,
+            `queue` it (up to `max_queued` executions wait, the rest are skipped) or run it `concurrent`ly.
+        max_queued (int): Maximum number of executions waiting for the previous one with the `queue` overlap policy.
+        restart_policy (RestartPolicy): Restart the timer when an execution raises an exception, by default the timer
+            is stopped.
     """
 
     def wrapper_task_timer(fn: Union[str, Callable]) -> Union[Callable, Coroutine]:
         """Function that adds timer functionality"""
 
-        async def fn_with_sleep(*args, **kwargs):
+        async def fn_with_timer(*args, **kwargs):
+            timer = Timer(
+                fn,
+                interval / 1000,
+                mode=mode,
+                jitter=jitter / 1000,
+                overlap=overlap,
+                max_queued=max_queued,
+                one_shot=one_shot,
+                name=fn.__name__,
+                args=args,
+                kwargs=kwargs,
+            )
+            logger.debug(
+                f"Starting task timer {fn.__name__} with the params: interval = {interval}, one_shot = {one_shot}, "
+                f"autostart = {autostart}, mode = {mode}, jitter = {jitter}, overlap = {overlap}, "
+                f"max_queued = {max_queued}"
+            )
+            # A one shot timer always waits the interval before the execution.
+            timer.start(delay=0 if autostart and not one_shot else None)
             try:
-                # Interval time in float (seconds transform)
-                interval_seconds = interval / 1000
-
-                # Oneshot param True always first all sleep after that execute and finish
-                execute_task = autostart and not one_shot
-
-                while True:
-                    if execute_task:
-                        logger.debug(
-                            f"Executing task timer {fn.__name__} with the params: interval = {interval}, "
-                            f"one_shot = {one_shot}, autostart = {autostart}"
-                        )
-                        await fn(*args, **kwargs)
-                    if one_shot and execute_task:
-                        break
-                    execute_task = True
-                    await asyncio.sleep(interval_seconds)
-            except Exception:
-                logger.exception(f"Unexpected exception running task timer {fn.__name__}. Timer will not recover")
+                await timer.wait()
+            finally:
+                timer.cancel()
 
         # Change name timer function with original task name
-        fn_with_sleep.__name__ = fn.__name__
-        return task(fn_with_sleep)
+        fn_with_timer.__name__ = fn.__name__
+        return task(restart_policy=restart_policy)(fn_with_timer)
 
     return wrapper_task_timer
@@ -181,14 +181,34 @@ class Proxy:
                 namespace[name] = cls.make_method(name)
         return type(f"{cls.__name__}({the_class.__name__})", (cls,), namespace)
 
+    @classmethod
+    def _get_class_proxy(cls, the_class):
+        """Return the proxy class for the given class, creating it the first time.
+
+        _class_proxy_cache is unique per deriving class (each deriving class must hold its own cache).
+
+        Args:
+            the_class (class): Class type in which we want to use the proxy.
+
+        Returns:
+            class: Proxy class referencing the `the_class` class.
+        """
+        try:
+            cache = cls.__dict__["_class_proxy_cache"]
+        except KeyError:
+            cls._class_proxy_cache = cache = {}
+        try:
+            return cache[the_class]
+        except KeyError:
+            cache[the_class] = class_proxy = cls._create_class_proxy(the_class)
+            return class_proxy
+
     def __new__(cls, obj, *args, **kwargs):
         """Create an proxy instance referencing `obj`.
 
         (obj, *args, **kwargs) are passed to this class' __init__, so deriving classes can define an
         __init__ method of their own.
 
-        _class_proxy_cache is unique per deriving class (each deriving class must hold its own cache).
-
         Args:
             obj (object): Instance of the class in which we want to use the proxy.
             *args: Variable length argument list.
@@ -197,14 +217,7 @@ class Proxy:
         Returns:
             object: New proxy instance referencing `obj`.
         """
-        try:
-            cache = cls.__dict__["_class_proxy_cache"]
-        except KeyError:
-            cls._class_proxy_cache = cache = {}
-        try:
-            the_class = cache[obj.__class__]
-        except KeyError:
-            cache[obj.__class__] = the_class = cls._create_class_proxy(obj.__class__)
+        the_class = cls._get_class_proxy(obj.__class__)
         instance = object.__new__(the_class)
         the_class.__init__(instance, obj, *args, **kwargs)
         return instance
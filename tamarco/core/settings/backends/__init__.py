@@ -1,11 +1,25 @@
 from .dictionary import DictSettingsBackend
-from .etcd import EtcdSettingsBackend
-from .file_based import JsonSettingsBackend, PythonSettingsBackend, YamlSettingsBackend
+from .environment import EnvironmentSettingsBackend
+from .file_based import FileSettingsBackend, JsonSettingsBackend, PythonSettingsBackend, YamlSettingsBackend
+from .layered import LayeredSettingsBackend
 
 __all__ = [
+    "FileSettingsBackend",
     "JsonSettingsBackend",
     "PythonSettingsBackend",
     "YamlSettingsBackend",
     "DictSettingsBackend",
     "EtcdSettingsBackend",
+    "EnvironmentSettingsBackend",
+    "LayeredSettingsBackend",
 ]
+
+
+def __getattr__(name):
+    """The etcd backend is imported the first time it is used, so the microservices without etcd don't import the
+    etcd clients."""
+    if name == "EtcdSettingsBackend":
+        from .etcd import EtcdSettingsBackend
+
+        return EtcdSettingsBackend
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,19 +1,46 @@
 import asyncio
+import threading
 
 from tamarco.core.settings.backends.interface import SettingsInterface, _EmptyArg
+from tamarco.core.settings.utils import dict_deep_update, freeze, thaw
+from tamarco.core.settings.utils.frozen import remove_in, replace_in
 
 
 class DictSettingsBackend(SettingsInterface):
-    """Class to handle settings based in a python dictionary."""
+    """Class to handle settings based in a python dictionary.
+
+    The settings are kept in a frozen tree (see FrozenDict) that is never modified in place. Each write builds a new
+    tree copying only the dictionaries in the path of the key and replaces the root, so the values returned by get
+    are consistent snapshots that can't be modified, and they can be read from other threads without locks.
+    """
 
     def __init__(self, dict_settings, loop=None):
         self.loop = loop
-        self.settings = dict_settings
+        self._settings = freeze(dict_settings)
+        self._write_lock = threading.Lock()
         self.callbacks = {}
 
+    @property
+    def settings(self):
+        """FrozenDict: Root of the current settings tree."""
+        return self._settings
+
+    @settings.setter
+    def settings(self, dict_settings):
+        self._settings = freeze(dict_settings)
+
     def set_loop(self, loop):
         self.loop = loop
 
+    def update(self, dict_settings):
+        """Add new settings to the tree, the existing settings are kept.
+
+        Args:
+            dict_settings (dict): Settings to add.
+        """
+        with self._write_lock:
+            self._settings = freeze(dict_deep_update(thaw(self._settings), thaw(dict_settings)))
+
     async def get(self, key, default=_EmptyArg):
         """Return the setting value.
 
@@ -24,7 +51,7 @@ class DictSettingsBackend(SettingsInterface):
         Returns:
             Setting value.
         """
-        setting = self.settings
+        setting = self._settings
         for token in key.split("."):
             try:
                 setting = setting[token]
@@ -42,14 +69,9 @@ class DictSettingsBackend(SettingsInterface):
             key (str): Path to the setting.
             value: Setting value to set.
         """
-        setting = self.settings
-        tokens = key.split(".")[:-1]
-        last_token = key.split(".")[-1]
-        for token in tokens:
-            if token not in setting or not isinstance(setting[token], dict):
-                setting[token] = {}
-            setting = setting[token]
-        setting[last_token] = value
+        value = freeze(value)
+        with self._write_lock:
+            self._settings = replace_in(self._settings, key.split("."), value)
         await self._trigger_callbacks(key)
 
     async def delete(self, key):
@@ -58,12 +80,8 @@ class DictSettingsBackend(SettingsInterface):
         Args:
             key (str): Path to the setting.
         """
-        setting = self.settings
-        tokens = key.split(".")[:-1]
-        last_token = key.split(".")[-1]
-        for token in tokens:
-            setting = setting[token]
-        del setting[last_token]
+        with self._write_lock:
+            self._settings = remove_in(self._settings, key.split("."))
         await self._trigger_callbacks(key)
 
     async def watch(self, key, callback):
@@ -75,12 +93,18 @@ class DictSettingsBackend(SettingsInterface):
         """
         self.callbacks[key] = self.callbacks.get(key, []) + [callback]
 
+    def cancel_watch_tasks(self):
+        """The dictionary backend hasn't watch tasks, the callbacks are called when the settings are set."""
+
     async def _trigger_callbacks(self, key):
         for callback_key in self.callbacks.keys():
             if callback_key in key:
-                try:
-                    value = await self.get(callback_key)
-                except KeyError:
-                    value = None
-                for callback in self.callbacks[callback_key]:
-                    asyncio.ensure_future(callback(callback_key, value), loop=self.loop)
+                await self._schedule_callbacks(callback_key)
+
+    async def _schedule_callbacks(self, callback_key):
+        try:
+            value = await self.get(callback_key)
+        except KeyError:
+            value = None
+        for callback in self.callbacks[callback_key]:
+            asyncio.ensure_future(callback(callback_key, value), loop=self.loop)
@@ -0,0 +1,59 @@
+import os
+
+import ujson
+
+from tamarco.core.settings.backends.dictionary import DictSettingsBackend
+
+ENVIRONMENT_SETTINGS_PREFIX = "TAMARCO_SETTING__"
+ENVIRONMENT_SETTINGS_SEPARATOR = "__"
+
+
+def parse_environment_settings(environ, prefix=ENVIRONMENT_SETTINGS_PREFIX):
+    """Build a settings dictionary from the environment variables with the prefix.
+
+    The rest of the name of the variable is the path of the setting, with the tokens separated by a double underscore.
+    The values are decoded as json when possible and kept as strings otherwise.
+
+    Example::
+
+        >>> parse_environment_settings({"TAMARCO_SETTING__system__logging__profile": "PRODUCTION"})
+        {'system': {'logging': {'profile': 'PRODUCTION'}}}
+
+    Args:
+        environ (dict): Environment variables.
+        prefix (str): Prefix of the variables with settings.
+
+    Returns:
+        dict: Settings of the environment.
+    """
+    settings = {}
+    for name, raw_value in environ.items():
+        key = name.replace(prefix, "", 1)
+        if not name.startswith(prefix) or not key:
+            continue
+        *tokens, last_token = key.split(ENVIRONMENT_SETTINGS_SEPARATOR)
+        setting = settings
+        for token in tokens:
+            if not isinstance(setting.get(token), dict):
+                setting[token] = {}
+            setting = setting[token]
+        try:
+            setting[last_token] = ujson.loads(raw_value)
+        except ValueError:
+            setting[last_token] = raw_value
+    return settings
+
+
+class EnvironmentSettingsBackend(DictSettingsBackend):
+    """Class to handle settings defined in environment variables, mainly used as the emergency overrides layer of a
+    LayeredSettingsBackend.
+    """
+
+    def __init__(self, prefix=ENVIRONMENT_SETTINGS_PREFIX, loop=None):
+        """
+        Args:
+            prefix (str): Prefix of the environment variables with settings.
+            loop: Event loop.
+        """
+        self.prefix = prefix
+        super().__init__(parse_environment_settings(os.environ, prefix), loop)
@@ -8,8 +8,9 @@ import aio_etcd
 import ujson
 from etcd import EtcdNotDir, EtcdResult
 
+from tamarco.core.etcd_client import EtcdClientProvider
 from tamarco.core.settings.backends.interface import SettingsInterface, _EmptyArg
-from tamarco.core.settings.utils import format_key_to_etcd, parse_dir_response
+from tamarco.core.settings.utils import flatten_settings, format_key_to_etcd, parse_dir_response
 
 Key = NewType("Key", str)
 Value = TypeVar("Value", str, int, float)
@@ -17,6 +18,7 @@ Value = TypeVar("Value", str, int, float)
 logger = logging.getLogger("tamarco.settings")
 
 WATCHER_ERROR_WAIT_TIME = 5
+WRITE_CONCURRENCY = 10
 
 
 class EtcdSettingsBackend(SettingsInterface):
@@ -31,7 +33,7 @@ class EtcdSettingsBackend(SettingsInterface):
 
     def __init__(self, etcd_config, loop=None):
         self.watch_tasks = []
-        self.client = aio_etcd.Client(**etcd_config, loop=loop)
+        self.client = EtcdClientProvider().get_client(etcd_config, loop=loop)
 
     async def check_etcd_health(self):
         """Check if a key specified in the enviroment variable ETCD_CHECK_KEY exists.
@@ -82,42 +84,142 @@ class EtcdSettingsBackend(SettingsInterface):
         else:
             return ujson.loads(response.value)
 
-    async def set(self, key, value, ttl=None):  # noqa: A003
+    async def get_with_index(self, key):
+        """Return the setting value together with the etcd index of the read.
+
+        Args:
+            key (str): Path to the setting.
+
+        Returns:
+            tuple: Setting value and etcd index.
+
+        Raises:
+            KeyError: The key doesn't exist in etcd.
+        """
+        try:
+            response = await self.client.read(key=format_key_to_etcd(key), recursive=True)
+        except aio_etcd.EtcdKeyNotFound:
+            raise KeyError(key)
+
+        if response.dir:
+            value = parse_dir_response(response, key)
+        else:
+            value = ujson.loads(response.value)
+        return value, response.etcd_index
+
+    async def set(self, key, value, ttl=None, compare_and_swap=False):  # noqa: A003
         """Set the setting value.
 
         Args:
             key (str): Path to the setting.
             value: Setting value to set.
+            ttl (int): Time to live of the key in seconds, only used when the value is not a dictionary.
+            compare_and_swap (bool): When the value is a dictionary, write only the keys that changed.
         """
         if isinstance(value, dict):
-            try:
-                await self.mkdir(key)
-            except EtcdNotDir:
-                logger.warning(f"Exception creating the ETCD directory {key}. It is not a directory")
-            return await self.recursive_set(key, value)
+            return await self.recursive_set(key, value, compare_and_swap=compare_and_swap)
         else:
             logger.debug(f"Adding the key {key} with value: {value}")
             value = ujson.dumps(value)
             await self.client.write(key=format_key_to_etcd(key), value=value, ttl=ttl, append=False)
 
-    async def recursive_set(self, base_key, conf_dict):
+    async def recursive_set(self, base_key, conf_dict, compare_and_swap=False):
         """Set a directory recursively in a certain path.
 
+        The keys are written concurrently, with at most WRITE_CONCURRENCY requests in flight over the connection pool
+        of the client. The directories are not created explicitly because etcd creates them with their first key,
+        only the empty dictionaries are written as empty directories.
+
+        In compare and swap mode the current tree is read once and only the keys with a different value are written.
+        Each write is conditioned to the key not being modified since the read, the keys modified concurrently by
+        someone else are skipped.
+
         Args:
             base_key: Path where to write the settings.
             conf_dict: Settings to update.
+            compare_and_swap (bool): Write only the keys that changed.
+
+        Returns:
+            int: Number of written keys.
         """
-        base_key += "/" if base_key != "" else ""
-        for key, value in conf_dict.items():
-            key = base_key + key
-            if isinstance(value, dict):
+        etcd_base_key = format_key_to_etcd(base_key) if base_key else ""
+        leaves, empty_dirs = flatten_settings(conf_dict, etcd_base_key)
+        current_nodes = await self._read_nodes(etcd_base_key) if compare_and_swap else {}
+        semaphore = asyncio.Semaphore(WRITE_CONCURRENCY)
+
+        async def write(key, value, **conditions):
+            async with semaphore:
                 try:
-                    await self.mkdir(key)
+                    if value is None:
+                        await self.mkdir(key)
+                    else:
+                        await self.client.write(key=key, value=value, append=False, **conditions)
                 except EtcdNotDir:
-                    logger.warning(f"Exception creating the ETCD directory {key}. It is not a directory")
-                await self.recursive_set(key, value)
-            else:
-                await self.set(key, value)
+                    logger.warning(f"Exception writing the ETCD key {key}. A parent of the key is not a directory")
+                    return False
+                except aio_etcd.EtcdCompareFailed:
+                    logger.warning(f"The ETCD key {key} has been modified concurrently, skipping its write")
+                    return False
+                return True
+
+        writes = [
+            write(key, value, **conditions)
+            for key, value, conditions in self._plan_writes(leaves, empty_dirs, current_nodes, compare_and_swap)
+        ]
+        logger.debug(f"Writing {len(writes)} keys to ETCD under {base_key}")
+        results = await asyncio.gather(*writes)
+        return sum(results)
+
+    def _plan_writes(self, leaves, empty_dirs, current_nodes, compare_and_swap):
+        """Return the writes needed to store the flattened settings.
+
+        Args:
+            leaves (list): Etcd key and value of the leaves of the settings.
+            empty_dirs (list): Etcd keys of the empty directories of the settings.
+            current_nodes (dict): Current leaf nodes by etcd key, only used in compare and swap mode.
+            compare_and_swap (bool): Plan only the writes of the keys that changed.
+
+        Returns:
+            list: Etcd key, encoded value (None for a directory) and write conditions of each write.
+        """
+        writes = []
+        for key in empty_dirs:
+            key = key.replace(".", "/")
+            if key not in current_nodes:
+                writes.append((key, None, {}))
+        for key, value in leaves:
+            key = key.replace(".", "/")
+            if not compare_and_swap:
+                writes.append((key, ujson.dumps(value), {}))
+                continue
+            node = current_nodes.get(key)
+            if node is None:
+                writes.append((key, ujson.dumps(value), {"prevExist": False}))
+            elif node.dir or self._decode_node_value(node) != value:
+                writes.append((key, ujson.dumps(value), {"prevIndex": node.modifiedIndex}))
+        return writes
+
+    async def _read_nodes(self, etcd_key):
+        """Read the leaf nodes of a etcd directory.
+
+        Args:
+            etcd_key (str): Etcd key of the directory.
+
+        Returns:
+            dict: Leaf nodes by etcd key.
+        """
+        try:
+            response = await self.client.read(key=etcd_key or "/", recursive=True)
+        except aio_etcd.EtcdKeyNotFound:
+            return {}
+        return {node.key: node for node in response.leaves}
+
+    @staticmethod
+    def _decode_node_value(node):
+        try:
+            return ujson.loads(node.value)
+        except (TypeError, ValueError):
+            return node.value
 
     async def mkdir(self, key):
         """Create a etcd directory.
@@ -208,7 +310,6 @@ class EtcdSettingsBackend(SettingsInterface):
     def __del__(self):
         """When the setting object is deleted cancels all the watch tasks."""
         self.cancel_watch_tasks()
-        self.close()
 
     async def _check_servers(self):
         machines = await self.client.machines()
@@ -216,5 +317,4 @@ class EtcdSettingsBackend(SettingsInterface):
         return machines
 
     def close(self):
-        """Close the connections."""
-        self.client.close()
+        """Close the connections. The client is shared, the EtcdClientProvider closes it when the microservice stops."""
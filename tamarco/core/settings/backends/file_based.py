@@ -1,34 +1,119 @@
+import logging
+
 import ujson
 
 from tamarco.core.settings.backends.dictionary import DictSettingsBackend
+from tamarco.core.settings.utils import diff_settings, freeze, keys_overlap
+from tamarco.core.settings.utils.file_watcher import FILE_POLL_INTERVAL, FileWatcher
+
+logger = logging.getLogger("tamarco.settings")
+
+
+class FileSettingsBackend(DictSettingsBackend):
+    """Base class to handle settings that are in a file.
+
+    The file can be watched to reload the settings when it changes. In a reload the old and new settings are diffed and
+    only the watch callbacks of the keys that actually changed are called.
+    """
+
+    def __init__(self, file, loop=None, on_reload=None):
+        """
+        Args:
+            file (str): Path of the settings file.
+            loop: Event loop.
+            on_reload: Coroutine function called with the list of changed keys after each reload of the file, before
+                the watch callbacks.
+        """
+        self.file = file
+        self.on_reload = on_reload
+        self.file_watcher = None
+        super().__init__(self._read_file(), loop)
+
+    def _read_file(self):
+        """Read the settings file.
+
+        Returns:
+            dict: Settings of the file.
+        """
+        raise NotImplementedError
+
+    def watch_file(self, poll_interval=FILE_POLL_INTERVAL):
+        """Start reloading the settings each time that the file changes.
+
+        Args:
+            poll_interval (float): Seconds between checks of the file when inotify is not available.
+        """
+        if self.file_watcher is None:
+            self.file_watcher = FileWatcher(self.file, self.reload, loop=self.loop, poll_interval=poll_interval)
+            self.file_watcher.start()
+
+    async def watch(self, key, callback):
+        """Create a hook in the key to trigger the callback when a setting is changed in the file.
+
+        Args:
+            key (str): Path to the setting.
+            callback: Callback to call when the value of the key change.
+        """
+        await super().watch(key, callback)
+        self.watch_file()
+
+    async def reload(self):
+        """Read again the settings file and trigger the callbacks of the changed keys.
+
+        Returns:
+            list: Dotted keys of the changed settings.
+        """
+        try:
+            new_settings = freeze(self._read_file())
+        except Exception:
+            logger.warning(f"Error reading the settings file {self.file}, keeping the previous settings", exc_info=True)
+            return []
+
+        changed_keys = diff_settings(self.settings, new_settings)
+        self.settings = new_settings
+        if not changed_keys:
+            return changed_keys
+
+        logger.info(f"Settings file {self.file} reloaded, changed settings: {changed_keys}")
+        if self.on_reload is not None:
+            await self.on_reload(changed_keys)
+        for callback_key in self.callbacks.keys():
+            if any(keys_overlap(callback_key, key) for key in changed_keys):
+                await self._schedule_callbacks(callback_key)
+        return changed_keys
+
+    def cancel_watch_tasks(self):
+        """Stop watching the settings file."""
+        if self.file_watcher is not None:
+            self.file_watcher.stop()
+            self.file_watcher = None
 
 
-class JsonSettingsBackend(DictSettingsBackend):
+class JsonSettingsBackend(FileSettingsBackend):
     """Class to handle settings that are in a Json file."""
 
-    def __init__(self, file, loop=None):
-        settings_dict = ujson.load(open(file))
-        super().__init__(settings_dict, loop)
+    def _read_file(self):
+        with open(self.file) as settings_file:
+            return ujson.load(settings_file)
 
 
-class YamlSettingsBackend(DictSettingsBackend):
+class YamlSettingsBackend(FileSettingsBackend):
     """Class to handle settings that are in a Yaml file."""
 
-    def __init__(self, file, loop=None):
+    def _read_file(self):
         import yaml
 
-        settings_dict = yaml.full_load(open(file))
-        super().__init__(settings_dict, loop)
+        with open(self.file) as settings_file:
+            return yaml.full_load(settings_file)
 
 
-class PythonSettingsBackend(DictSettingsBackend):
+class PythonSettingsBackend(FileSettingsBackend):
     """Class to handle settings that are in a Python file."""
 
-    def __init__(self, file, loop=None):
+    def _read_file(self):
         import importlib.util
 
-        spec = importlib.util.spec_from_file_location("settings.python", file)
+        spec = importlib.util.spec_from_file_location("settings.python", self.file)
         settings = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(settings)
-        settings_dict = settings.__dict__
-        super().__init__(settings_dict, loop)
+        return settings.__dict__
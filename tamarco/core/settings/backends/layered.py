@@ -0,0 +1,262 @@
+import asyncio
+import logging
+
+from tamarco.core.settings.backends.interface import SettingsInterface, _EmptyArg
+from tamarco.core.settings.utils import dict_deep_merge, diff_settings, freeze, keys_overlap
+
+logger = logging.getLogger("tamarco.settings")
+
+
+class _Missing:
+    pass
+
+
+class _Shadowed:
+    pass
+
+
+def _lookup(tree, tokens):
+    """Return the value of a path in a tree.
+
+    Returns:
+        The value, _Missing if the path doesn't exist or _Shadowed if one of its ancestors is not a dictionary.
+    """
+    for token in tokens:
+        if not isinstance(tree, dict):
+            return _Shadowed
+        try:
+            tree = tree[token]
+        except KeyError:
+            return _Missing
+    return tree
+
+
+def _replace_subtree(tree, tokens, value):
+    """Return a copy of the tree with the value in the path, copying only the dictionaries in the path.
+
+    Args:
+        tree (dict): Original tree, it is not modified.
+        tokens (list): Path of the value.
+        value: New value, _Missing removes the path.
+
+    Returns:
+        dict: New tree.
+    """
+    if not tokens:
+        return value
+    head, *tail = tokens
+    if value is _Missing and (not isinstance(tree, dict) or head not in tree):
+        return tree
+    new_tree = dict(tree) if isinstance(tree, dict) else {}
+    if value is _Missing and not tail:
+        del new_tree[head]
+    else:
+        new_tree[head] = _replace_subtree(new_tree.get(head, {}), tail, value)
+    return new_tree
+
+
+class LayeredSettingsBackend(SettingsInterface):
+    """Backend that merges several settings backends, each layer overrides the settings of the previous ones.
+
+    Example::
+
+        >>> LayeredSettingsBackend([
+        >>>     YamlSettingsBackend("defaults.yml"),
+        >>>     EtcdSettingsBackend({"host": "127.0.0.1"}),
+        >>>     EnvironmentSettingsBackend(),
+        >>> ], root_key="system")
+
+    The tree of each layer is loaded once and kept updated watching the layer. The merged tree is built when a layer
+    changes, not in every get, and it is never modified in place: a change in a layer only merges again the subtree of
+    the changed key and copies the dictionaries of its path, the rest of the tree is shared with the previous version.
+
+    The keys outside the root key, like the settings of the application, are loaded from every layer and merged the
+    first time that they are read or watched, then they are kept updated like the settings of the root key.
+    """
+
+    def __init__(self, layers, root_key, write_layer=None, loop=None, on_change=None):
+        """
+        Args:
+            layers (list): Settings backends from the lowest to the highest precedence.
+            root_key (str): Key of the settings tree loaded from each layer.
+            write_layer (int): Index of the layer where the settings are set and deleted, by default the last one.
+            loop: Event loop.
+            on_change: Coroutine function called with the list of changed keys after each change of the merged
+                settings, before the watch callbacks.
+        """
+        self.layers = layers
+        self.root_key = root_key
+        self.write_layer = len(layers) - 1 if write_layer is None else write_layer
+        self.loop = loop
+        self.on_change = on_change
+        self.layer_trees = [{} for _ in layers]
+        self.merged = {}
+        self.callbacks = {}
+        self.key_loads = {}
+
+    async def load(self):
+        """Load the settings tree of each layer, merge them and start watching the changes of the layers."""
+        for index, layer in enumerate(self.layers):
+            tree = await layer.get(self.root_key, {})
+            self.layer_trees[index] = freeze(_replace_subtree({}, self.root_key.split("."), tree))
+            await layer.watch(self.root_key, self._layer_callback(index))
+
+        merged = {}
+        for tree in self.layer_trees:
+            merged = dict_deep_merge(merged, tree)
+        self.merged = freeze(merged)
+
+    async def _ensure_loaded(self, key):
+        """Load a key outside the root key from all the layers, unless it or one of its ancestors is already loaded.
+
+        Args:
+            key (str): Path to the setting.
+        """
+        if key == self.root_key or key.startswith(f"{self.root_key}."):
+            return
+        for loaded_key, key_load in self.key_loads.items():
+            if key == loaded_key or key.startswith(f"{loaded_key}."):
+                break
+        else:
+            key_load = self.key_loads[key] = asyncio.ensure_future(self._load_key(key), loop=self.loop)
+        try:
+            await asyncio.shield(key_load)
+        except Exception:
+            if self.key_loads.get(key) is key_load:
+                del self.key_loads[key]
+            raise
+
+    async def _load_key(self, key):
+        tokens = key.split(".")
+        for index, layer in enumerate(self.layers):
+            value = await layer.get(key, _Missing)
+            if value is not _Missing:
+                self.layer_trees[index] = freeze(_replace_subtree(self.layer_trees[index], tokens, freeze(value)))
+            await layer.watch(key, self._layer_callback(index))
+        merged_value = freeze(self._merge_subtree(tokens))
+        if merged_value is not _Missing and merged_value is not _Shadowed:
+            self.merged = freeze(_replace_subtree(self.merged, tokens, merged_value))
+
+    def _layer_callback(self, index):
+        async def callback(key, value):
+            await self.update_layer(index, key, value)
+
+        return callback
+
+    async def update_layer(self, index, key, value):
+        """Update the value of a key in one layer and merge again its subtree.
+
+        Args:
+            index (int): Index of the layer.
+            key (str): Path to the setting.
+            value: New value of the setting, None if it has been deleted.
+
+        Returns:
+            list: Paths to the settings that changed in the merged settings.
+        """
+        tokens = key.split(".")
+        value = _Missing if value is None else freeze(value)
+        self.layer_trees[index] = freeze(_replace_subtree(self.layer_trees[index], tokens, value))
+
+        # The trees are frozen, so the values are compared with the same types than the merged tree.
+        merged_value = freeze(self._merge_subtree(tokens))
+        if merged_value is _Shadowed:
+            return []
+        old_value = _lookup(self.merged, tokens)
+        if isinstance(old_value, dict) and isinstance(merged_value, dict):
+            changed_keys = diff_settings(old_value, merged_value, key)
+        elif old_value != merged_value or type(old_value) is not type(merged_value):
+            changed_keys = [key]
+        else:
+            changed_keys = []
+        if not changed_keys:
+            return changed_keys
+
+        self.merged = freeze(_replace_subtree(self.merged, tokens, merged_value))
+        if self.on_change is not None:
+            await self.on_change(changed_keys)
+        self._trigger_callbacks(changed_keys)
+        return changed_keys
+
+    def _merge_subtree(self, tokens):
+        """Merge the value of a path in all the layers.
+
+        Returns:
+            The merged value, _Missing if no layer has it or _Shadowed if a value of a higher layer replaces one of its
+            ancestors.
+        """
+        merged = _Missing
+        for tree in self.layer_trees:
+            value = _lookup(tree, tokens)
+            if value is _Missing:
+                continue
+            if isinstance(value, dict) and isinstance(merged, dict):
+                merged = dict_deep_merge(merged, value)
+            else:
+                merged = value
+        return merged
+
+    def _trigger_callbacks(self, changed_keys):
+        for callback_key, callbacks in self.callbacks.items():
+            if any(keys_overlap(callback_key, key) for key in changed_keys):
+                value = _lookup(self.merged, callback_key.split("."))
+                if value is _Missing or value is _Shadowed:
+                    value = None
+                for callback in callbacks:
+                    asyncio.ensure_future(callback(callback_key, value), loop=self.loop)
+
+    async def get(self, key, default=_EmptyArg):
+        """Return the setting value from the merged settings.
+
+        The merged tree is frozen, so the dictionaries and lists are returned without copying them.
+
+        Args:
+            key (str): Path to the setting.
+            default: Default value to return if the key does not exist.
+
+        Returns:
+            Setting value.
+        """
+        await self._ensure_loaded(key)
+        value = _lookup(self.merged, key.split("."))
+        if value is _Missing or value is _Shadowed:
+            if default != _EmptyArg:
+                return default
+            raise KeyError(key)
+        return value
+
+    async def set(self, key, value):  # noqa: A003
+        """Set the setting value in the write layer.
+
+        Args:
+            key (str): Path to the setting.
+            value: Setting value to set.
+        """
+        await self._ensure_loaded(key)
+        await self.layers[self.write_layer].set(key, value)
+        await self.update_layer(self.write_layer, key, value)
+
+    async def delete(self, key):
+        """Delete a setting from the write layer.
+
+        Args:
+            key (str): Path to the setting.
+        """
+        await self._ensure_loaded(key)
+        await self.layers[self.write_layer].delete(key)
+        await self.update_layer(self.write_layer, key, None)
+
+    async def watch(self, key, callback):
+        """Create a hook in the key to trigger the callback when the merged setting is changed.
+
+        Args:
+            key (str): Path to the setting.
+            callback: Callback to call when the value of the key change.
+        """
+        await self._ensure_loaded(key)
+        self.callbacks.setdefault(key, []).append(callback)
+
+    def cancel_watch_tasks(self):
+        """Cancel the watch tasks of all the layers."""
+        for layer in self.layers:
+            layer.cancel_watch_tasks()
@@ -0,0 +1,171 @@
+from tamarco.core.settings.backends.interface import _EmptyArg, _Undefined
+from tamarco.core.settings.settings import SettingNotFound
+
+UNDEFINED = _Undefined
+
+_TRUE_STRINGS = {"true", "yes", "on", "1"}
+_FALSE_STRINGS = {"false", "no", "off", "0"}
+
+
+class InvalidSetting(Exception):
+    def __init__(self, key, message):
+        super().__init__(f"Invalid setting {key}: {message}")
+        self.key = key
+
+
+class SettingField:
+    """Declaration of one setting of a settings schema.
+
+    Example::
+
+        >>> SettingField(int, default=8080)
+        >>> SettingField(bool, key="handlers.carbon.enabled", default=False)
+    """
+
+    __slots__ = ("type", "default", "key", "overridable")
+
+    def __init__(self, type_=None, default=_EmptyArg, key=None, overridable=True):
+        """
+        Args:
+            type_: Expected type (or tuple of types) of the setting. None disables the validation.
+            default: Value used when the setting doesn't exist. Without default the setting is required.
+            key (str): Dotted path of the setting relative to the settings view. By default it is the field name.
+            overridable (bool): If True, a value under `system.microservices.<name>` takes precedence over the
+                general one.
+        """
+        self.type = type_
+        self.default = default
+        self.key = key
+        self.overridable = overridable
+
+    def validate(self, key, value):
+        """Check the type of a value, converting the strings and numbers to the declared scalar type if possible.
+
+        Args:
+            key (str): Path of the setting, used in the error messages.
+            value: Value to validate.
+
+        Returns:
+            The validated value.
+
+        Raises:
+            InvalidSetting: The value doesn't match the declared type.
+        """
+        if self.type is None or value is None or isinstance(value, self.type):
+            return value
+        if self.type is bool and isinstance(value, str) and value.lower() in _TRUE_STRINGS | _FALSE_STRINGS:
+            return value.lower() in _TRUE_STRINGS
+        if self.type in (int, float, str) and isinstance(value, (int, float, str)) and not isinstance(value, bool):
+            try:
+                return self.type(value)
+            except ValueError:
+                pass
+        raise InvalidSetting(key, f"expected {self.type} and got {value!r}")
+
+
+class ResolvedSettings:
+    """Base class of the read only objects returned by a SettingsSchema."""
+
+    __slots__ = ()
+    _fields = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"The resolved settings are read only, can't set {name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"The resolved settings are read only, can't delete {name}")
+
+    def as_dict(self):
+        """Return the resolved settings as a dictionary.
+
+        Returns:
+            dict: Field name and value of all the settings.
+        """
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __eq__(self, other):
+        return isinstance(other, ResolvedSettings) and self.as_dict() == other.as_dict()
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"<ResolvedSettings {values}>"
+
+
+def _lookup(tree, tokens):
+    for token in tokens:
+        try:
+            tree = tree[token]
+        except (KeyError, TypeError):
+            return UNDEFINED
+    return tree
+
+
+class SettingsSchema:
+    """Declarative description of the settings of a resource.
+
+    The schema is resolved once when the resource receives its settings view, reading the whole settings subtree of
+    the view in a single pass. The result is a frozen object with one slot per field, so the reads in the hot paths of
+    the resource are plain attribute lookups instead of an awaited settings get.
+
+    Example::
+
+        >>> class MyResource(BaseResource):
+        >>>     settings_schema = SettingsSchema(
+        >>>         host=SettingField(str),
+        >>>         port=SettingField(int, default=8080),
+        >>>     )
+        >>>
+        >>>     async def start(self):
+        >>>         await connect(self.config.host, self.config.port)
+    """
+
+    def __init__(self, **fields):
+        """
+        Args:
+            **fields (SettingField): Fields of the schema, the keyword is the attribute name in the resolved object.
+        """
+        self.fields = fields
+        self._tokens = {name: (field.key or name).split(".") for name, field in fields.items()}
+        self._resolved_class = type(
+            "ResolvedSettings", (ResolvedSettings,), {"__slots__": tuple(fields), "_fields": tuple(fields)}
+        )
+
+    async def resolve(self, settings):
+        """Resolve and validate all the fields of the schema.
+
+        Args:
+            settings (SettingsView): Settings view of the resource.
+
+        Returns:
+            ResolvedSettings: Frozen object with the value of each field as an attribute.
+
+        Raises:
+            SettingNotFound: A required setting doesn't exist.
+            InvalidSetting: A setting has a wrong type.
+        """
+        general_tree = await settings.get(settings.prefix, {}, raw=True)
+        microservice_tree = {}
+        if settings.microservice_name:
+            microservice_tree = await settings.get(settings.microservice_prefix, {}, raw=True)
+
+        resolved = self._resolved_class.__new__(self._resolved_class)
+        for name, field in self.fields.items():
+            tokens = self._tokens[name]
+            key = ".".join(tokens)
+            value = _lookup(microservice_tree, tokens) if field.overridable else UNDEFINED
+            if value is UNDEFINED:
+                value = _lookup(general_tree, tokens)
+            if value is UNDEFINED:
+                # The cached subtree can be partial, the single key read falls back to the external backend.
+                if field.overridable:
+                    value = await settings.get(key, UNDEFINED)
+                else:
+                    value = await settings.get(f"{settings.prefix}.{key}", UNDEFINED, raw=True)
+            if value is UNDEFINED:
+                if field.default is _EmptyArg:
+                    raise SettingNotFound(f"{settings.prefix}.{key}")
+                value = field.default
+            else:
+                value = field.validate(key, value)
+            object.__setattr__(resolved, name, value)
+        return resolved
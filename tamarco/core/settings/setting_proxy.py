@@ -56,6 +56,59 @@ class SettingProxy(Proxy):
         return method
 
 
+_get_proxied_object = Proxy._obj.__get__
+
+
+class ResolvedSettingProxy(Proxy):
+    """Proxy of a setting that is already loaded.
+
+    When the settings are loaded the class of every SettingProxy is swapped to this one, so the accesses after the
+    load skip the SettingsNotLoadedYet check and the special methods call directly the method of the type of the
+    setting value.
+    """
+
+    def __getattribute__(self, name):
+        return getattr(_get_proxied_object(self), name)
+
+    @classmethod
+    def _create_class_proxy(cls, the_class):
+        """Create a proxy class whose special methods are the unbound methods of `the_class`.
+
+        Args:
+            the_class (class): Type of the setting value.
+
+        Returns:
+            class: Proxy class referencing the `the_class` class.
+        """
+
+        def make_method(method):
+            def proxied_method(self, *args, **kw):
+                return method(_get_proxied_object(self), *args, **kw)
+
+            return proxied_method
+
+        namespace = {}
+        for name in cls._special_names:
+            method = getattr(the_class, name, None)
+            if method is not None:
+                namespace[name] = make_method(method)
+        return type(f"{cls.__name__}({the_class.__name__})", (cls,), namespace)
+
+
+def resolve_setting_proxy(proxy, value):
+    """Point a SettingProxy to the value of its setting.
+
+    The proxy instance is kept, so all the references returned by when_loaded_setting see the value, but its class is
+    replaced by a ResolvedSettingProxy of the type of the value.
+
+    Args:
+        proxy (SettingProxy): Proxy to resolve.
+        value: Value of the setting.
+    """
+    object.__setattr__(proxy, "_obj", value)
+    object.__setattr__(proxy, "__class__", ResolvedSettingProxy._get_class_proxy(value.__class__))
+
+
 def when_loaded_setting(key):
     """Helper function that returns a proxy that when the settings is loaded
       the object behind the proxy is the value of the key passed to the function
@@ -1,16 +1,31 @@
+import asyncio
 import logging
 import os
+import time
+from functools import partial
 from typing import NewType, TypeVar
 
 from tamarco.core.patterns import Singleton
-from tamarco.core.settings.backends import DictSettingsBackend, EtcdSettingsBackend, YamlSettingsBackend
+from tamarco.core.settings.backends import (
+    DictSettingsBackend,
+    EnvironmentSettingsBackend,
+    FileSettingsBackend,
+    LayeredSettingsBackend,
+    YamlSettingsBackend,
+)
+from tamarco.core.settings.backends.environment import ENVIRONMENT_SETTINGS_PREFIX
 from tamarco.core.settings.backends.interface import SettingsInterface, _EmptyArg, _Undefined
-from tamarco.core.settings.utils import dict_deep_update
-from tamarco.core.utils import get_etcd_configuration_from_environment_variables
+from tamarco.core.settings.snapshot import SettingsSnapshot
+from tamarco.core.settings.tracing import SettingsTracer, get_caller_module, is_settings_tracing_enabled
+from tamarco.core.settings.utils import FrozenDict, freeze
+from tamarco.core.settings.utils.debounce import DebouncedCallback
+from tamarco.core.utils import ROOT_SETTINGS, get_etcd_configuration_from_environment_variables
 
 UNDEFINED = _Undefined
 logger = logging.getLogger("tamarco.settings")
 
+SNAPSHOT_RECONCILE_RETRY_SECONDS = 5
+
 
 class SettingsNotLoadedYet(Exception):
     pass
@@ -30,6 +45,15 @@ def get_yml_file_from_enviroment_variable():
     return tamarco_yml_file
 
 
+def get_snapshot_file_from_environment_variable():
+    tamarco_snapshot_file = os.environ.get("TAMARCO_SETTINGS_SNAPSHOT_FILE", None)
+    return tamarco_snapshot_file
+
+
+def has_environment_settings():
+    return any(name.startswith(ENVIRONMENT_SETTINGS_PREFIX) for name in os.environ)
+
+
 class Settings(SettingsInterface, metaclass=Singleton):
     """Core settings class, here is the unique True of settings all the settings values are cached by this class in his
     internal_backend, all of the other settings are views of the data that this class holds.
@@ -45,6 +69,26 @@ class Settings(SettingsInterface, metaclass=Singleton):
         self.external_backend = None
         self.loop = None
         self.etcd_external = False
+        self.snapshot = None
+        self.reconcile_task = None
+        self.debounced_callbacks = []
+        self.external_gets = {}
+        self.cache_version = 0
+        self.tracer = SettingsTracer() if is_settings_tracing_enabled() else None
+
+    def enable_tracing(self):
+        """Start recording the reads of the settings, see SettingsTracer.
+
+        Returns:
+            SettingsTracer: Tracer with the recorded reads.
+        """
+        if self.tracer is None:
+            self.tracer = SettingsTracer()
+        return self.tracer
+
+    def disable_tracing(self):
+        """Stop recording the reads of the settings."""
+        self.tracer = None
 
     def update_internal(self, dict_settings):
         """Update the internal cache with new settings.
@@ -52,7 +96,19 @@ class Settings(SettingsInterface, metaclass=Singleton):
         Args:
             dict_settings (dict): Settings to add to the internal backend.
         """
-        dict_deep_update(self.internal_backend.settings, dict_settings)
+        self._invalidate_external_gets()
+        self.internal_backend.update(dict_settings)
+
+    def cached_settings(self):
+        """Return the settings cached in the internal backend.
+
+        The cached settings are a frozen tree that is replaced, never modified, in each write. The snapshot is
+        consistent and read only, so it can be read from the threads without locks and without awaiting.
+
+        Returns:
+            FrozenDict: Root of the cached settings tree.
+        """
+        return self.internal_backend.settings
 
     async def bind(self, loop):
         """Binds the settings to one event loop.
@@ -75,21 +131,158 @@ class Settings(SettingsInterface, metaclass=Singleton):
     async def _load_external_backend(self):
         """Loads a external backend either etcd or yaml file in that order.
         To load it uses the environment variables TAMARCO_ETCD_HOST, TAMARCO_ETCD_PORT and TAMARCO_YAML_FILE.
+
+        When there are several sources (the yaml file and etcd or settings in environment variables) they are combined
+        in a LayeredSettingsBackend.
+
+        When the environment variable TAMARCO_SETTINGS_SNAPSHOT_FILE is set and a snapshot of a previous etcd load
+        exists, the settings are served from the snapshot right away and the reconciliation with etcd is made in
+        background, so the microservice can boot without waiting for etcd (or even with etcd down).
         """
         yaml_file = get_yml_file_from_enviroment_variable()
         etcd_config = get_etcd_configuration_from_environment_variables()
+        snapshot_file = get_snapshot_file_from_environment_variable()
+
+        if (etcd_config and yaml_file) or has_environment_settings():
+            await self._load_layered_backend(yaml_file, etcd_config)
+            if snapshot_file:
+                logger.warning("The settings snapshot is only used when etcd is the unique settings source")
+        elif etcd_config:
+            from tamarco.core.settings.backends.etcd import EtcdSettingsBackend
 
-        if etcd_config:
             self.external_backend = EtcdSettingsBackend(etcd_config=etcd_config, loop=self.loop)
-            await self.external_backend.check_etcd_health()
             self.etcd_external = True
+            if snapshot_file:
+                self.snapshot = SettingsSnapshot(snapshot_file)
+                if self._load_snapshot():
+                    self.reconcile_task = asyncio.ensure_future(self._reconcile_with_etcd(), loop=self.loop)
+                    return
+            await self.external_backend.check_etcd_health()
+            if self.snapshot:
+                self.reconcile_task = asyncio.ensure_future(self._reconcile_with_etcd(), loop=self.loop)
         elif yaml_file:
-            self.external_backend = YamlSettingsBackend(file=yaml_file, loop=self.loop)
+            self.external_backend = YamlSettingsBackend(
+                file=yaml_file, loop=self.loop, on_reload=self._update_internal_from_external
+            )
+            self.external_backend.watch_file()
         else:
             logger.warning("Could not get any settings external backend from the environment")
 
+    async def _load_layered_backend(self, yaml_file, etcd_config):
+        """Load a layered external backend. The yaml file has the defaults, overridden by the etcd settings, and
+        the settings of the environment variables override both.
+
+        Args:
+            yaml_file (str): Path of the yaml file, None if there isn't.
+            etcd_config (dict): Etcd configuration, empty if there isn't.
+        """
+        layers = []
+        if yaml_file:
+            layers.append(YamlSettingsBackend(file=yaml_file, loop=self.loop))
+        if etcd_config:
+            from tamarco.core.settings.backends.etcd import EtcdSettingsBackend
+
+            etcd_backend = EtcdSettingsBackend(etcd_config=etcd_config, loop=self.loop)
+            self.etcd_external = True
+            await etcd_backend.check_etcd_health()
+            layers.append(etcd_backend)
+        write_layer = len(layers) - 1 if layers else None
+        layers.append(EnvironmentSettingsBackend(loop=self.loop))
+
+        self.external_backend = LayeredSettingsBackend(
+            layers,
+            ROOT_SETTINGS,
+            write_layer=write_layer,
+            loop=self.loop,
+            on_change=self._update_internal_from_external,
+        )
+        await self.external_backend.load()
+
+    def _load_snapshot(self):
+        """Load the settings snapshot in the internal backend.
+
+        Returns:
+            bool: True if the snapshot was loaded.
+        """
+        snapshot = self.snapshot.load()
+        if snapshot is None:
+            return False
+        snapshot_settings, etcd_index = snapshot
+        self.update_internal(snapshot_settings)
+        logger.info(f"Settings loaded from the snapshot {self.snapshot.file_path} with etcd index {etcd_index}")
+        return True
+
+    async def _reconcile_with_etcd(self):
+        """Read the whole settings tree from etcd, replace the settings of the internal backend with it and save a new
+        snapshot. It retries until etcd is reachable.
+        """
+        while True:
+            try:
+                await self.external_backend.check_etcd_health()
+                etcd_settings, etcd_index = await self.external_backend.get_with_index(ROOT_SETTINGS)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning(
+                    f"Error reading the settings from etcd to reconcile the settings snapshot. Retrying in "
+                    f"{SNAPSHOT_RECONCILE_RETRY_SECONDS} seconds",
+                    exc_info=True,
+                )
+                await asyncio.sleep(SNAPSHOT_RECONCILE_RETRY_SECONDS)
+            else:
+                break
+
+        # The tree is replaced, not merged, so the settings deleted in etcd after the snapshot are removed.
+        self._invalidate_external_gets()
+        await self.internal_backend.set(ROOT_SETTINGS, etcd_settings)
+        logger.info(f"Settings reconciled with etcd at etcd index {etcd_index}")
+        try:
+            self.snapshot.save({ROOT_SETTINGS: etcd_settings}, etcd_index)
+        except Exception:
+            logger.warning(f"Error saving the settings snapshot {self.snapshot.file_path}", exc_info=True)
+
+    async def reload(self):
+        """Read again the settings of the external backend, it is called when the microservice receives a SIGHUP.
+
+        The settings files are read again, updating the changed settings and calling their watch callbacks. When etcd
+        is the only external backend the whole settings tree is read again from it.
+        """
+        if self.external_backend is None:
+            logger.warning("Trying to reload the settings without external backend")
+            return
+        for backend in getattr(self.external_backend, "layers", [self.external_backend]):
+            if isinstance(backend, FileSettingsBackend):
+                await backend.reload()
+        if self.etcd_external and not isinstance(self.external_backend, LayeredSettingsBackend):
+            etcd_settings = await self.external_backend.get(ROOT_SETTINGS, {})
+            # The tree is replaced, not merged, so the settings deleted in etcd are removed.
+            self._invalidate_external_gets()
+            await self.internal_backend.set(ROOT_SETTINGS, etcd_settings)
+        logger.info("Settings reloaded")
+
+    async def _update_internal_from_external(self, changed_keys):
+        """Update the settings cached in the internal backend that changed in the external backend.
+
+        The keys that aren't cached are ignored, the next get reads them from the external backend.
+
+        Args:
+            changed_keys (list): Paths to the changed settings.
+        """
+        self._invalidate_external_gets()
+        for key in changed_keys:
+            parent_key, _, _ = key.rpartition(".")
+            if parent_key and not isinstance(await self.internal_backend.get(parent_key, None), dict):
+                continue
+            value = await self.external_backend.get(key, UNDEFINED)
+            if value is not UNDEFINED:
+                await self.internal_backend.set(key, value)
+            elif await self.internal_backend.get(key, UNDEFINED) is not UNDEFINED:
+                await self.internal_backend.delete(key)
+
     async def _resolve_promised_settings(self):
         """Set all the settings proxies with his correspondent values."""
+        from tamarco.core.settings.setting_proxy import resolve_setting_proxy
+
         for key, proxies in self.promised_settings.items():
             try:
                 setting_value = await self.get(key)
@@ -97,7 +290,7 @@ class Settings(SettingsInterface, metaclass=Singleton):
                 logger.warning(f"Error loading promised setting : {key}")
             else:
                 for proxy in proxies:
-                    object.__setattr__(proxy, "_obj", setting_value)
+                    resolve_setting_proxy(proxy, setting_value)
 
     def register_promised_setting(self, key, promised_setting):
         """Register a SettingProxy to be resolved when the settings are loaded.
@@ -106,14 +299,16 @@ class Settings(SettingsInterface, metaclass=Singleton):
             key (str): setting key to register.
             promised_setting: setting proxy to register.
         """
-        self.promised_settings[key].setdefault([]).append(promised_setting)
+        self.promised_settings.setdefault(key, []).append(promised_setting)
 
-    async def get(self, key, default=_EmptyArg):
+    async def get(self, key, default=_EmptyArg, caller=None):
         """Get a setting value for a key.
 
         Args:
             key(str): Path to the setting.
             default: Default value in the case that it doesn't exists.
+            caller (str): Name of the resource that reads the setting, only used by the tracing. By default it is the
+                module of the calling function.
 
         Raises:
             SettingNotFound: The setting can't be resolved and it hasn't default value.
@@ -121,24 +316,42 @@ class Settings(SettingsInterface, metaclass=Singleton):
         Returns:
             Setting value.
         """
-        logger.debug(f"Getting the setting: {key}")
+        tracer = self.tracer
+        if tracer is not None and caller is None:
+            caller = get_caller_module()
         try:
             value = await self.internal_backend.get(key)
             if value != UNDEFINED:
+                if tracer is not None:
+                    tracer.record_hit(key, caller)
                 return value
         except KeyError:
             if self.external_backend:
                 logger.debug(f"Setting {key} not found in internal cache, searching in external backend")
-                return await self.get_external(key, default)
+                if tracer is None:
+                    return await self.get_external(key, default)
+                return await self._get_external_traced(key, default, caller)
 
+        if tracer is not None:
+            tracer.record_miss(key, caller)
         if default != _EmptyArg:
             return default
         else:
             raise SettingNotFound(key)
 
+    async def _get_external_traced(self, key, default, caller):
+        start_time = time.perf_counter()
+        try:
+            return await self.get_external(key, default)
+        finally:
+            self.tracer.record_miss(key, caller, time.perf_counter() - start_time)
+
     async def get_external(self, key, default=_EmptyArg):
         """Get the setting from the external backend updating the internal one with the value of the external.
 
+        The concurrent gets of the same key share a single request to the external backend. A setting that doesn't
+        exist is cached as undefined, so the next gets don't request it again.
+
         Args:
             key (str): Path to the setting.
             default: Default value in case that the setting doesn't exists in the external backend.
@@ -146,14 +359,40 @@ class Settings(SettingsInterface, metaclass=Singleton):
         Returns:
             Setting value.
         """
+        external_get = self.external_gets.get(key)
+        if external_get is None:
+            external_get = asyncio.ensure_future(self._fetch_external(key, self.cache_version), loop=self.loop)
+            external_get.add_done_callback(partial(self._forget_external_get, key))
+            self.external_gets[key] = external_get
+        # The shield keeps the request alive for the other waiters when one of them is cancelled.
+        value = await asyncio.shield(external_get)
+        if value is not UNDEFINED:
+            return value
+        if default != _EmptyArg:
+            return default
+        logger.warning(f"Setting {key} not found in external backend")
+        raise SettingNotFound(key)
+
+    async def _fetch_external(self, key, cache_version):
         try:
-            value = await self.external_backend.get(key, default)
+            value = await self.external_backend.get(key, UNDEFINED)
         except Exception:
-            logger.warning(f"Setting {key} not found in external backend")
+            logger.warning(f"Error getting the setting {key} from the external backend", exc_info=True)
             raise SettingNotFound(key)
-        else:
+        value = freeze(value)
+        # A write during the request can have changed the setting, then the value read can be outdated.
+        if cache_version == self.cache_version:
             await self.internal_backend.set(key, value)
-            return value
+        return value
+
+    def _forget_external_get(self, key, external_get):
+        if self.external_gets.get(key) is external_get:
+            del self.external_gets[key]
+
+    def _invalidate_external_gets(self):
+        """Discard the requests to the external backend in progress, called in each write of the cached settings."""
+        self.cache_version += 1
+        self.external_gets.clear()
 
     async def set(self, key, value):  # noqa: A003
         """Set a setting value.
@@ -164,6 +403,7 @@ class Settings(SettingsInterface, metaclass=Singleton):
         """
         logger.info(f"Changing the value of the setting: {key}")
 
+        self._invalidate_external_gets()
         await self.internal_backend.set(key, value)
         if self.external_backend:
             await self.external_backend.set(key, value)
@@ -176,22 +416,48 @@ class Settings(SettingsInterface, metaclass=Singleton):
         """
         logger.info(f"Deleting the setting: {key}")
 
+        self._invalidate_external_gets()
         await self.internal_backend.delete(key)
         if self.external_backend:
             await self.external_backend.delete(key)
 
-    async def watch(self, key, callback):
-        """Schedule a callback for when a setting is changed in the etcd backend.
+    async def watch(self, key, callback, debounce=None, batch=False, max_wait=None):
+        """Schedule a callback for when a setting is changed in the external backend (etcd or settings file).
 
         Args:
             key (str): Path to the setting.
             callback: function or coroutine to be called when the setting changes, it should have with two input
                 arguments, one for the setting path and other for the setting value.
+            debounce (float): If not None, the changes are coalesced and the callback is called once the key has not
+                changed for `debounce` seconds, with the last value of each changed key.
+            batch (bool): Call the callback once per burst of changes with a dictionary of the changed keys and their
+                values. It implies a debounce of 0 seconds if no debounce is given.
+            max_wait (float): Maximum seconds that a debounced callback is delayed during a long burst of changes, None
+                to not limit it.
         """
-        if self.etcd_external:
+        if debounce is not None or batch:
+            callback = self.debounce_callback(callback, debounce or 0, batch, max_wait)
+        if self.external_backend is not None:
             await self.external_backend.watch(key, callback)
         else:
-            logger.warning(f"Trying to watch the setting {key} when it is not in the ETCD backend")
+            logger.warning(f"Trying to watch the setting {key} without external backend")
+
+    def debounce_callback(self, callback, debounce=0, batch=False, max_wait=None):
+        """Wrap a watch callback to coalesce the bursts of changes. The pending calls are cancelled when the settings
+        stop.
+
+        Args:
+            callback: Watch callback.
+            debounce (float): Seconds without changes before calling the callback.
+            batch (bool): Call the callback once per burst with a dictionary of the changed keys.
+            max_wait (float): Maximum seconds to delay the callback during a long burst, None to not limit it.
+
+        Returns:
+            DebouncedCallback: Callback to register in the watch.
+        """
+        debounced_callback = DebouncedCallback(callback, debounce, batch, max_wait)
+        self.debounced_callbacks.append(debounced_callback)
+        return debounced_callback
 
     async def update_internal_settings(self, key, value):
         """Update an specific internal setting.
@@ -200,6 +466,7 @@ class Settings(SettingsInterface, metaclass=Singleton):
             key (str): Path to the setting.
             value: Setting value.
         """
+        self._invalidate_external_gets()
         await self.internal_backend.set(key, value)
         logger.debug(f"The internal setting {key} has changed")
 
@@ -209,21 +476,77 @@ class Settings(SettingsInterface, metaclass=Singleton):
         Args:
             key (str):  Path to the setting.
         """
-        if self.etcd_external:
+        if self.external_backend is not None:
             await self.external_backend.watch(key, self.update_internal_settings)
         else:
-            logger.warning(f"Trying to watch the setting {key} when it is not in the ETCD backend")
+            logger.warning(f"Trying to watch the setting {key} without external backend")
 
     async def stop(self):
         """Perform all the needed tasks in order to stop the Settings."""
+        if self.reconcile_task is not None and not self.reconcile_task.done():
+            self.reconcile_task.cancel()
         await self.cancel_watch_tasks()
 
     async def cancel_watch_tasks(self):
-        """Cancel all the pending watcher tasks of the settings in the etcd backend."""
-        if self.etcd_external:
+        """Cancel all the pending watcher tasks of the settings in the external backend."""
+        for debounced_callback in self.debounced_callbacks:
+            debounced_callback.cancel()
+        if self.external_backend is not None:
             self.external_backend.cancel_watch_tasks()
         else:
-            logger.warning(f"Trying to cancel all settings watcher tasks, but not ETCD backend found. Doing nothing")
+            logger.warning("Trying to cancel all settings watcher tasks, but not external backend found. Doing nothing")
+
+
+def _lookup_cached(tree, tokens):
+    for token in tokens:
+        try:
+            tree = tree[token]
+        except (KeyError, TypeError):
+            return UNDEFINED
+    return tree
+
+
+def _is_cached_or_absent(tree, tokens):
+    """Return whether a setting is cached or it is known that it doesn't exist, because the setting or one of its
+    parents is cached as undefined or as a value that isn't a dictionary.
+
+    Args:
+        tree (dict): Cached settings tree.
+        tokens (list): Path to the setting.
+
+    Returns:
+        bool: False when the setting can exist in the external backend without being cached.
+    """
+    for token in tokens:
+        if not isinstance(tree, dict):
+            return True
+        try:
+            tree = tree[token]
+        except KeyError:
+            return False
+    return True
+
+
+def _merge_override(general, override):
+    """Merge the microservice settings over the general ones, ignoring the misses cached as UNDEFINED.
+
+    Args:
+        general (dict): General settings.
+        override (dict): Settings of the microservice.
+
+    Returns:
+        FrozenDict: Merged settings.
+    """
+    merged = dict(general)
+    for key, value in override.items():
+        if value is UNDEFINED:
+            continue
+        general_value = merged.get(key)
+        if isinstance(value, dict):
+            merged[key] = _merge_override(general_value if isinstance(general_value, dict) else {}, value)
+        else:
+            merged[key] = value
+    return FrozenDict(merged)
 
 
 class SettingsView(SettingsInterface):
@@ -242,31 +565,81 @@ class SettingsView(SettingsInterface):
         self.prefix = prefix
         self.settings = settings
         self.microservice_name = microservice_name
+        self.caller = prefix.rpartition(".")[2]
         if microservice_name:
             framework_prefix, *setting_route = prefix.split(".")
             self.microservice_prefix = f"{framework_prefix}.microservices.{microservice_name}.{'.'.join(setting_route)}"
+        self._merged_root = None
+        self._merged_settings = None
+
+    def _get_merged_settings(self):
+        """Return the microservice settings of the view merged over the general ones.
+
+        The merge is made from the cached settings and it is only made again when they change. The cached settings
+        are replaced in each write, so a new root means that the merged settings are outdated.
+
+        Returns:
+            FrozenDict: Merged settings, None when the settings aren't the main settings object.
+        """
+        if not isinstance(self.settings, Settings):
+            return None
+        root = self.settings.cached_settings()
+        if root is not self._merged_root:
+            general = _lookup_cached(root, self.prefix.split("."))
+            override = _lookup_cached(root, self.microservice_prefix.split("."))
+            self._merged_settings = _merge_override(
+                general if isinstance(general, dict) else {}, override if isinstance(override, dict) else {}
+            )
+            self._merged_root = root
+        return self._merged_settings
 
     async def get(self, key, default=_EmptyArg, raw=False):
         """Get setting.
 
+        With a microservice name the settings of `system.microservices.<name>` take precedence over the general ones.
+        The cached settings of both are merged once per change of the settings, so a cached setting is resolved with
+        a single lookup in the merged settings. The dictionaries are merged, the microservice keys override the
+        general keys. The merged settings are only used when both settings are cached or it is known that they don't
+        exist, otherwise a cached general setting could hide a microservice setting that isn't cached yet. The settings
+        that aren't cached are read and merged in the same way, so the result doesn't depend on the cache.
+
         Args:
             key (str): Path to the setting.
             default: Default value in case that the setting doesn't exists in the external backend.
             raw: if True no prefix is used so is not a view.
         """
+        # The caller is only passed when the tracing is enabled, the settings object can be another view.
+        trace_kwargs = {"caller": self.caller} if getattr(self.settings, "tracer", None) is not None else {}
         if not raw:
             general_key = f"{self.prefix}.{key}"
             if self.microservice_name:
+                merged_settings = self._get_merged_settings()
+                microservice_tokens = f"{self.microservice_prefix}.{key}".split(".")
+                if merged_settings is not None and (
+                    self.settings.external_backend is None
+                    or (
+                        _is_cached_or_absent(self.settings.cached_settings(), microservice_tokens)
+                        and _is_cached_or_absent(self.settings.cached_settings(), general_key.split("."))
+                    )
+                ):
+                    value = _lookup_cached(merged_settings, key.split("."))
+                    if value is not UNDEFINED:
+                        if self.settings.tracer is not None:
+                            self.settings.tracer.record_hit(general_key, self.caller)
+                        return value
                 microservice_key = f"{self.microservice_prefix}.{key}"
-                value = await self.settings.get(microservice_key, UNDEFINED)
+                value = await self.settings.get(microservice_key, UNDEFINED, **trace_kwargs)
+                if isinstance(value, dict):
+                    general_value = await self.settings.get(general_key, UNDEFINED, **trace_kwargs)
+                    return _merge_override(general_value if isinstance(general_value, dict) else {}, value)
                 if value != UNDEFINED:
                     return value
                 logger.warning(
                     f"Setting {microservice_key} not found in external backend, it will use {general_key} instead."
                 )
-            return await self.settings.get(general_key, default)
+            return await self.settings.get(general_key, default, **trace_kwargs)
         else:
-            return await self.settings.get(key, default)
+            return await self.settings.get(key, default, **trace_kwargs)
 
     async def set(self, key, value, raw=False):  # noqa: A003
         """Set a setting value.
@@ -294,14 +667,20 @@ class SettingsView(SettingsInterface):
             key = f"{self.prefix}.{key}"
         return await self.settings.delete(key)
 
-    async def watch(self, key, callback, raw=False):
+    async def watch(self, key, callback, raw=False, debounce=None, batch=False, max_wait=None):
         """Schedule a callback for when a setting is changed in the etcd backend.
 
         Args:
             key (str): Path to the setting.
             callback: Callback to run whenever the `key` changes.
             raw: If True no prefix is used so is not a view.
+            debounce (float): If not None, coalesce the changes until the key has not changed for `debounce` seconds.
+            batch (bool): Call the callback once per burst with a dictionary of the changed keys and their values.
+            max_wait (float): Maximum seconds that a debounced callback is delayed during a long burst of changes.
         """
+        if debounce is not None or batch:
+            # The same wrapper watches the general and the microservice key, so their changes are coalesced together.
+            callback = self.settings.debounce_callback(callback, debounce or 0, batch, max_wait)
         key_microservice = key
         if not raw:
             if self.microservice_name:
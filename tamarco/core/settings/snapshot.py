@@ -0,0 +1,67 @@
+import logging
+import os
+import tempfile
+
+import ujson
+
+logger = logging.getLogger("tamarco.settings")
+
+
+class SettingsSnapshot:
+    """Local on-disk copy of the last settings tree successfully loaded from the external backend.
+
+    The snapshot is a compact json document with the settings tree and the etcd index of the read that produced it.
+    It is written to a temporary file in the same directory and moved over the previous snapshot with an atomic
+    rename, so a crash in the middle of a write never leaves a truncated snapshot behind.
+    """
+
+    def __init__(self, file_path):
+        """
+        Args:
+            file_path (str): Path of the snapshot file.
+        """
+        self.file_path = file_path
+
+    def load(self):
+        """Read the snapshot from disk.
+
+        Returns:
+            tuple: Settings tree (dict) and etcd index (int or None), or None when there isn't a valid snapshot.
+        """
+        try:
+            with open(self.file_path, "r") as snapshot_file:
+                snapshot = ujson.load(snapshot_file)
+            settings = snapshot["settings"]
+        except FileNotFoundError:
+            logger.info(f"There isn't any settings snapshot in {self.file_path}")
+            return None
+        except Exception:
+            logger.warning(f"Error reading the settings snapshot {self.file_path}. Ignoring it", exc_info=True)
+            return None
+        if not isinstance(settings, dict):
+            logger.warning(f"Invalid settings snapshot {self.file_path}. Ignoring it")
+            return None
+        return settings, snapshot.get("etcd_index")
+
+    def save(self, settings, etcd_index=None):
+        """Atomically replace the snapshot in disk.
+
+        Args:
+            settings (dict): Settings tree to persist.
+            etcd_index (int): Etcd index of the read that returned the settings tree.
+        """
+        directory = os.path.dirname(os.path.abspath(self.file_path))
+        file_descriptor, tmp_path = tempfile.mkstemp(prefix=".settings_snapshot_", dir=directory)
+        try:
+            with os.fdopen(file_descriptor, "w") as tmp_file:
+                ujson.dump({"etcd_index": etcd_index, "settings": settings}, tmp_file)
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+            os.replace(tmp_path, self.file_path)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        logger.debug(f"Saved settings snapshot {self.file_path} with etcd index {etcd_index}")
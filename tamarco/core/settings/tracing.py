@@ -0,0 +1,136 @@
+import os
+import sys
+
+from tamarco.resources.basic.metrics.meters import Counter, Summary
+
+SETTINGS_TRACING_ENVIRONMENT_VARIABLE = "TAMARCO_SETTINGS_TRACING"
+UNKNOWN_CALLER = "unknown"
+
+
+def is_settings_tracing_enabled():
+    return os.environ.get(SETTINGS_TRACING_ENVIRONMENT_VARIABLE, "false").lower() == "true"
+
+
+def get_caller_module(depth=2):
+    """Return the module name of a function in the call stack, used as caller of the direct settings reads.
+
+    Args:
+        depth (int): Number of frames above the caller of this function.
+
+    Returns:
+        str: Module name of the caller.
+    """
+    try:
+        return sys._getframe(depth).f_globals.get("__name__", UNKNOWN_CALLER)
+    except ValueError:
+        return UNKNOWN_CALLER
+
+
+class SettingAccessStats:
+    """Reads of one setting key."""
+
+    __slots__ = ("key", "reads", "hits", "misses", "external_time", "external_max_time", "callers", "_meters")
+
+    def __init__(self, key):
+        self.key = key
+        self.reads = 0
+        self.hits = 0
+        self.misses = 0
+        self.external_time = 0.0
+        self.external_max_time = 0.0
+        self.callers = {}
+        self._meters = None
+
+    @property
+    def meters(self):
+        if self._meters is None:
+            labels = {"key": self.key}
+            self._meters = (
+                Counter("settings_reads", "reads", labels={**labels, "cache": "hit"}),
+                Counter("settings_reads", "reads", labels={**labels, "cache": "miss"}),
+                Summary("settings_external_read_time", "seconds", labels=labels),
+            )
+        return self._meters
+
+    def as_dict(self):
+        return {
+            "key": self.key,
+            "reads": self.reads,
+            "hits": self.hits,
+            "misses": self.misses,
+            "external_time": self.external_time,
+            "external_max_time": self.external_max_time,
+            "external_mean_time": self.external_time / self.misses if self.misses else 0.0,
+            "callers": dict(sorted(self.callers.items(), key=lambda item: -item[1])),
+        }
+
+
+class SettingsTracer:
+    """Records the reads of the settings: number of reads of each key, hits and misses of the internal cache, time
+    spent reading the external backend and who made the read (the resource of the settings view or the module).
+
+    It is disabled by default, the environment variable TAMARCO_SETTINGS_TRACING=true enables it. The report is useful
+    to find the settings read in the hot paths, that should be cached or resolved with a settings schema.
+    """
+
+    def __init__(self):
+        self.stats = {}
+
+    def _get_stats(self, key):
+        try:
+            return self.stats[key]
+        except KeyError:
+            stats = self.stats[key] = SettingAccessStats(key)
+            return stats
+
+    def record_hit(self, key, caller):
+        """Record a read served by the internal cache.
+
+        Args:
+            key (str): Path to the setting.
+            caller (str): Resource or module that read the setting.
+        """
+        stats = self._get_stats(key)
+        stats.reads += 1
+        stats.hits += 1
+        stats.callers[caller] = stats.callers.get(caller, 0) + 1
+        stats.meters[0].inc()
+
+    def record_miss(self, key, caller, external_time=0.0):
+        """Record a read not found in the internal cache.
+
+        Args:
+            key (str): Path to the setting.
+            caller (str): Resource or module that read the setting.
+            external_time (float): Seconds spent reading the external backend.
+        """
+        stats = self._get_stats(key)
+        stats.reads += 1
+        stats.misses += 1
+        stats.external_time += external_time
+        stats.external_max_time = max(stats.external_max_time, external_time)
+        stats.callers[caller] = stats.callers.get(caller, 0) + 1
+        _, misses_meter, external_time_meter = stats.meters
+        misses_meter.inc()
+        external_time_meter.observe(external_time)
+
+    def report(self, limit=None):
+        """Return the stats of the settings reads, the most read keys first.
+
+        Args:
+            limit (int): Maximum number of keys in the report, all of them by default.
+
+        Returns:
+            dict: Total reads, hits and misses and the stats of each key.
+        """
+        keys = sorted(self.stats.values(), key=lambda stats: -stats.reads)[:limit]
+        return {
+            "reads": sum(stats.reads for stats in self.stats.values()),
+            "hits": sum(stats.hits for stats in self.stats.values()),
+            "misses": sum(stats.misses for stats in self.stats.values()),
+            "keys": [stats.as_dict() for stats in keys],
+        }
+
+    def reset(self):
+        """Discard the recorded reads."""
+        self.stats = {}
@@ -1,2 +1,20 @@
-from .etcd_tool import EtcdTool  # noqa: F401
-from .utils import _format_key_from_etcd, dict_deep_update, format_key_to_etcd, parse_dir_response  # noqa: F401
+from .frozen import FrozenDict, FrozenList, freeze, thaw  # noqa: F401
+from .utils import (  # noqa: F401
+    _format_key_from_etcd,
+    dict_deep_merge,
+    dict_deep_update,
+    diff_settings,
+    flatten_settings,
+    format_key_to_etcd,
+    keys_overlap,
+    parse_dir_response,
+)
+
+
+def __getattr__(name):
+    """The etcd tool is imported the first time it is used, it imports the synchronous etcd client."""
+    if name == "EtcdTool":
+        from .etcd_tool import EtcdTool
+
+        return EtcdTool
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
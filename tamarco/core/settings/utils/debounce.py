@@ -0,0 +1,71 @@
+import asyncio
+import logging
+
+logger = logging.getLogger("tamarco.settings")
+
+
+class DebouncedCallback:
+    """Wrapper of a watch callback that coalesces the changes of a burst in a single call.
+
+    Each change restarts the debounce window, when there are no more changes during the window the callback is called
+    with the last value of each changed key. The changes that arrive while the callback is running are delivered in
+    the next call, so the callback never runs concurrently with itself.
+    """
+
+    def __init__(self, callback, debounce=0, batch=False, max_wait=None):
+        """
+        Args:
+            callback: Coroutine function to call. It receives the arguments (key, value) once per changed key, or a
+                dictionary with the value of each changed key in batch mode.
+            debounce (float): Seconds without changes before calling the callback.
+            batch (bool): Call the callback once per burst with all the changed keys.
+            max_wait (float): Maximum seconds to delay the callback during a long burst, None to not limit it.
+        """
+        self.callback = callback
+        self.debounce = debounce
+        self.batch = batch
+        self.max_wait = max_wait
+        self.pending = {}
+        self.first_change = None
+        self.last_change = None
+        self.flush_task = None
+
+    async def __call__(self, key, value):
+        loop = asyncio.get_event_loop()
+        self.last_change = loop.time()
+        if not self.pending:
+            self.first_change = self.last_change
+        self.pending.pop(key, None)
+        self.pending[key] = value
+        if self.flush_task is None or self.flush_task.done():
+            self.flush_task = asyncio.ensure_future(self._flush())
+
+    async def _flush(self):
+        loop = asyncio.get_event_loop()
+        while self.pending:
+            while True:
+                deadline = self.last_change + self.debounce
+                if self.max_wait is not None:
+                    deadline = min(deadline, self.first_change + self.max_wait)
+                delay = deadline - loop.time()
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+
+            changes, self.pending = self.pending, {}
+            try:
+                if self.batch:
+                    await self.callback(changes)
+                else:
+                    for key, value in changes.items():
+                        await self.callback(key, value)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning(f"Error in the settings watch callback {self.callback}", exc_info=True)
+
+    def cancel(self):
+        """Cancel the pending call of the callback."""
+        if self.flush_task is not None and not self.flush_task.done():
+            self.flush_task.cancel()
+        self.pending = {}
@@ -1,9 +1,15 @@
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import etcd
 import ujson
 import yaml
 
+from .utils import flatten_settings
+
+LOAD_CONCURRENCY = 10
+
 
 class EtcdTool:
     """Utility to load settings to an etcd server from a yml file source.
@@ -20,20 +26,25 @@ class EtcdTool:
             protocol (str): Protocol to use with the etcd server.
             encode (str): Json to encode the values with a json encoder.
         """
-        self.client = etcd.Client(host, port, protocol)
+        self.client_arguments = (host, port, protocol)
+        self.client = etcd.Client(*self.client_arguments)
         self.encode = encode
 
-    def write(self, key, value):
+    def write(self, key, value, **conditions):
         """Set one etcd key with the value.
 
         Args:
             key (str): Path to the setting.
             value: Key value.
+            **conditions: Compare and swap conditions of the write (prevValue, prevIndex, prevExist).
         """
+        self._write(self.client, key, value, **conditions)
+
+    def _write(self, client, key, value, **conditions):
         try:
             if self.encode == "json":
                 value = ujson.dumps(value)
-            self.client.write(key, value)
+            client.write(key, value, **conditions)
         except Exception:
             logging.error(f"Error writing key {key} to etcd.")
             raise
@@ -75,33 +86,80 @@ class EtcdTool:
             logging.error(f"Error deleting key {key}.")
             raise
 
-    def load_items(self, yml_dictionary, path=""):
+    def load_items(self, yml_dictionary, path="", compare_and_swap=False, concurrency=LOAD_CONCURRENCY):
         """Write a dictionary recursively in a certain path of etcd.
 
+        The keys are written concurrently from a pool of threads, each thread with its own client because the etcd
+        client isn't thread safe. The parent directories are created implicitly by etcd with their first key.
+
         Args:
             yml_dictionary (dict): dictionary that represents the settings to load in etcd.
             path (str): path where to write the yml_dictionary.
-        """
-        for key, value in yml_dictionary.items():
-            new_path = path + "/" + key
-            if isinstance(value, dict):
-                self.load_items(value, new_path)
-            else:
-                if self.encode == "json":
-                    value = ujson.dumps(value)
-                self.write(new_path, value)
+            compare_and_swap (bool): Read the current values first and write only the keys that changed, each write
+                conditioned to the key not being modified since the read.
+            concurrency (int): Maximum number of writes in flight.
 
-    def load(self, yml_file):
+        Returns:
+            int: Number of written keys.
+        """
+        leaves, empty_dirs = flatten_settings(yml_dictionary, path)
+        current_nodes = self._read_nodes(path) if compare_and_swap else {}
+        thread_clients = threading.local()
+
+        def write(key, value, **conditions):
+            client = getattr(thread_clients, "client", None)
+            if client is None:
+                client = thread_clients.client = etcd.Client(*self.client_arguments)
+            try:
+                if value is None:
+                    client.write(key, None, dir=True)
+                else:
+                    self._write(client, key, value, **conditions)
+            except etcd.EtcdCompareFailed:
+                logging.warning(f"The key {key} has been modified concurrently, skipping its write.")
+                return False
+            return True
+
+        writes = [(key, None, {}) for key in empty_dirs if key not in current_nodes]
+        for key, value in leaves:
+            if not compare_and_swap:
+                writes.append((key, value, {}))
+                continue
+            node = current_nodes.get(key)
+            if node is None:
+                writes.append((key, value, {"prevExist": False}))
+            elif node.dir or node.value != self._encode_value(value):
+                writes.append((key, value, {"prevIndex": node.modifiedIndex}))
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [executor.submit(write, key, value, **conditions) for key, value, conditions in writes]
+            return sum(future.result() for future in futures)
+
+    def _read_nodes(self, path):
+        try:
+            response = self.client.read(path or "/", recursive=True)
+        except etcd.EtcdKeyNotFound:
+            return {}
+        return {node.key: node for node in response.leaves}
+
+    def _encode_value(self, value):
+        """Return the value as it is stored in etcd."""
+        if self.encode == "json":
+            return ujson.dumps(value)
+        return str(value)
+
+    def load(self, yml_file, compare_and_swap=False):
         """Load and convert a yml file to a dictionary then it saves the dictionary in etcd, mapping the dictionary's
         keys to settings paths.
 
         Args:
             yml_file (str): path the the yml file to read.
+            compare_and_swap (bool): Write only the keys that changed.
         """
         logging.info(f"Loading file: {yml_file}")
         try:
             yml_dictionary = yaml.full_load(open(yml_file))
-            self.load_items(yml_dictionary)
+            self.load_items(yml_dictionary, compare_and_swap=compare_and_swap)
         except Exception:
             logging.error(f"Error reading file {yml_file}.")
             raise
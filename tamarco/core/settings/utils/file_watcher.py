@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import os
+
+logger = logging.getLogger("tamarco.settings")
+
+FILE_POLL_INTERVAL = 1
+INOTIFY_SETTLE_TIME = 0.05
+
+# IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF |
+# IN_MOVE_SELF
+INOTIFY_MASK = 0x002 | 0x004 | 0x008 | 0x040 | 0x080 | 0x100 | 0x200 | 0x400 | 0x800
+
+
+class FileWatcher:
+    """Detect the changes of a file, with inotify when it is available or polling its modification time otherwise.
+
+    The directory of the file is watched instead of the file, so the atomic replacements are also detected, like the
+    symlink swap made by Kubernetes when a mounted ConfigMap is updated. Any event in the directory only triggers a
+    stat of the file, the callback is called when the inode, modification time or size of the file change.
+    """
+
+    def __init__(self, path, callback, loop=None, poll_interval=FILE_POLL_INTERVAL):
+        """
+        Args:
+            path (str): Path of the file to watch.
+            callback: Coroutine function without arguments called after each change of the file.
+            loop: Event loop where the watch task runs.
+            poll_interval (float): Seconds between checks of the file when inotify is not available.
+        """
+        self.path = path
+        self.callback = callback
+        self.loop = loop
+        self.poll_interval = poll_interval
+        self.inotify_fd = None
+        self.task = None
+        self._events = None
+        self._signature = self._file_signature()
+
+    def start(self):
+        """Start watching the file."""
+        loop = self.loop or asyncio.get_event_loop()
+        self._events = asyncio.Event()
+        if self._start_inotify(loop):
+            logger.info(f"Watching the settings file {self.path} with inotify")
+        else:
+            logger.info(f"Watching the settings file {self.path} polling it every {self.poll_interval} seconds")
+        self.task = asyncio.ensure_future(self._watch(), loop=loop)
+
+    def stop(self):
+        """Stop watching the file."""
+        if self.task is not None and not self.task.done():
+            self.task.cancel()
+        if self.inotify_fd is not None:
+            (self.loop or asyncio.get_event_loop()).remove_reader(self.inotify_fd)
+            os.close(self.inotify_fd)
+            self.inotify_fd = None
+
+    def _start_inotify(self, loop):
+        """Watch the directory of the file with inotify.
+
+        Returns:
+            bool: True if inotify is available and watching the directory.
+        """
+        try:
+            import ctypes
+            import ctypes.util
+
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            inotify_init1 = libc.inotify_init1
+            inotify_add_watch = libc.inotify_add_watch
+        except (OSError, AttributeError):
+            return False
+
+        inotify_fd = inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if inotify_fd < 0:
+            return False
+        directory = os.path.dirname(os.path.abspath(self.path))
+        if inotify_add_watch(inotify_fd, os.fsencode(directory), INOTIFY_MASK) < 0:
+            os.close(inotify_fd)
+            return False
+        loop.add_reader(inotify_fd, self._read_inotify_events)
+        self.inotify_fd = inotify_fd
+        return True
+
+    def _read_inotify_events(self):
+        try:
+            while os.read(self.inotify_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        self._events.set()
+
+    async def _watch(self):
+        while True:
+            if self.inotify_fd is not None:
+                await self._events.wait()
+                self._events.clear()
+                # A write usually generates several events, wait for the burst to end.
+                await asyncio.sleep(INOTIFY_SETTLE_TIME)
+            else:
+                await asyncio.sleep(self.poll_interval)
+
+            signature = self._file_signature()
+            if signature == self._signature:
+                continue
+            self._signature = signature
+            try:
+                await self.callback()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning(f"Error handling the change of the settings file {self.path}", exc_info=True)
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,128 @@
+class FrozenDict(dict):
+    """Read only dictionary of a settings tree.
+
+    It is a dict subclass, so the reads have the speed of a plain dictionary and the values can be serialized as
+    json, but all the methods that modify it raise a TypeError. The frozen trees are never modified in place, a write
+    builds a new tree that shares with the previous one all the nodes outside the path of the changed key, so any
+    reference to a tree is a consistent snapshot of the settings.
+    """
+
+    __slots__ = ()
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("The settings tree is read only, use thaw() to get a mutable copy")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return f"FrozenDict({dict.__repr__(self)})"
+
+
+class FrozenList(list):
+    """Read only list of a settings tree, see FrozenDict."""
+
+    __slots__ = ()
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("The settings tree is read only, use thaw() to get a mutable copy")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = extend = insert = remove = pop = clear = sort = reverse = _immutable
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return f"FrozenList({list.__repr__(self)})"
+
+
+def freeze(value):
+    """Return a read only version of a settings value, the dictionaries and lists are frozen recursively.
+
+    The values that are already frozen are returned as they are, so a frozen subtree is shared instead of copied.
+
+    Args:
+        value: Setting value.
+
+    Returns:
+        The frozen value.
+    """
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(child)) for key, child in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(child) for child in value)
+    return value
+
+
+def thaw(value):
+    """Return a mutable deep copy of a frozen settings value.
+
+    Args:
+        value: Setting value.
+
+    Returns:
+        The value with plain dictionaries and lists.
+    """
+    if isinstance(value, dict):
+        return {key: thaw(child) for key, child in value.items()}
+    if isinstance(value, list):
+        return [thaw(child) for child in value]
+    return value
+
+
+def replace_in(tree, tokens, value):
+    """Return a copy of a frozen tree with the value in the path. Only the dictionaries of the path are copied, the
+    values that aren't dictionaries in the path are replaced by a new dictionary.
+
+    Args:
+        tree (FrozenDict): Original tree, it is not modified.
+        tokens (list): Path of the value.
+        value: New value, it should be frozen.
+
+    Returns:
+        FrozenDict: New tree.
+    """
+    head, *tail = tokens
+    new_tree = dict(tree) if isinstance(tree, dict) else {}
+    new_tree[head] = replace_in(new_tree.get(head), tail, value) if tail else value
+    return FrozenDict(new_tree)
+
+
+def remove_in(tree, tokens):
+    """Return a copy of a frozen tree without the path, copying only the dictionaries of the path.
+
+    Args:
+        tree (FrozenDict): Original tree, it is not modified.
+        tokens (list): Path to remove.
+
+    Returns:
+        FrozenDict: New tree.
+
+    Raises:
+        KeyError: The path doesn't exist.
+    """
+    head, *tail = tokens
+    new_tree = dict(tree)
+    if tail:
+        new_tree[head] = remove_in(tree[head], tail)
+    else:
+        del new_tree[head]
+    return FrozenDict(new_tree)
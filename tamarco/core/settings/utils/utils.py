@@ -13,6 +13,37 @@ def format_key_to_etcd(key):
     return "/" + key.replace(".", "/")
 
 
+def flatten_settings(settings, base_key=""):
+    """Flatten a settings dictionary into the etcd keys of its leaves.
+
+    Only the leaves are returned because etcd creates the parent directories implicitly. The empty dictionaries are
+    returned apart because they only can be created as an empty directory.
+
+    Args:
+        settings (dict): Settings to flatten.
+        base_key (str): Etcd key where the settings are written, "" is the root.
+
+    Returns:
+        tuple: List of (key, value) of the leaves and list of keys of the empty directories.
+    """
+    leaves = []
+    empty_dirs = []
+    pending = [(base_key, settings)]
+    while pending:
+        path, tree = pending.pop()
+        if not tree:
+            if path:
+                empty_dirs.append(path)
+            continue
+        for key, value in tree.items():
+            key = f"{path}/{key}"
+            if isinstance(value, dict):
+                pending.append((key, value))
+            else:
+                leaves.append((key, value))
+    return leaves, empty_dirs
+
+
 def _format_key_from_etcd(queried_key, response_key):
     """Format a key from etcd format to a subkey in dotted format."""
     queried_key = format_key_to_etcd(queried_key)
@@ -25,6 +56,9 @@ def _format_key_from_etcd(queried_key, response_key):
 def parse_dir_response(response, queried_key):
     """Parse a response that is a dir to a python dict.
 
+    The leaves of the response are walked once, building the nested dictionaries from the path of each key, and each
+    value is decoded on its own.
+
     Args:
         response: Etcd response.
         queried_key: Key of the query in the etcd response.
@@ -33,23 +67,19 @@ def parse_dir_response(response, queried_key):
         dict: Dictionary with the parsed response.
     """
     setting = {}
-    for result in response.children:
-        if result.value is None:
-            break
-        if result.dir:
-            setting.update({_format_key_from_etcd(queried_key, result.key): parse_dir_response(result, queried_key)})
-        else:
-            sub_key = _format_key_from_etcd(queried_key, result.key)
-            if "/" in sub_key:
-                sub_keys = sub_key.split("/")[:-1]
-                last_key = sub_key.split("/")[-1:][0]
-                sub_setting = setting
-                for key in sub_keys:
-                    sub_setting[key] = sub_setting.get(key, {})
-                    sub_setting = sub_setting[key]
-                sub_setting.update({last_key: ujson.loads(result.value)})
-            else:
-                setting.update({sub_key: ujson.loads(result.value)})
+    prefix_length = len(format_key_to_etcd(queried_key).rstrip("/")) + 1
+    for node in response.leaves:
+        if node.key is None or len(node.key) < prefix_length:
+            # The leaves of an empty dir are the dir itself.
+            continue
+        *parents, name = node.key[prefix_length:].split("/")
+        parent = setting
+        for parent_name in parents:
+            parent = parent.setdefault(parent_name, {})
+        if node.dir:
+            parent.setdefault(name, {})
+        elif node.value is not None:
+            parent[name] = ujson.loads(node.value)
     return setting
 
 
@@ -68,3 +98,69 @@ def dict_deep_update(target, update):
         elif isinstance(value, dict):
             target[key] = dict_deep_update(value, target[key])
     return target
+
+
+def dict_deep_merge(base, override):
+    """Merge recursively two dicts in a new one, the values of override take precedence over the values of base.
+    Neither of the input dictionaries is modified.
+
+    Args:
+        base (dict): Dictionary with the values of lower precedence.
+        override (dict): Dictionary with the values of higher precedence.
+
+    Returns:
+        dict: Merged dictionary.
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        base_value = merged.get(key)
+        if isinstance(value, dict) and isinstance(base_value, dict):
+            merged[key] = dict_deep_merge(base_value, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+class _Missing:
+    pass
+
+
+def keys_overlap(key, other_key):
+    """Return True if one of the dotted keys is the other one or a subkey of it.
+
+    Args:
+        key (str): Path to a setting.
+        other_key (str): Path to other setting.
+
+    Returns:
+        bool: True if the keys overlap.
+    """
+    return key == other_key or key.startswith(other_key + ".") or other_key.startswith(key + ".")
+
+
+def diff_settings(old, new, prefix=""):
+    """Return the keys that are different between two settings trees.
+
+    Only the changed branches are visited. A subtree that is added, removed or replaced by a value is reported with
+    its own key instead of with the keys of all its leaves.
+
+    Args:
+        old (dict): Previous settings.
+        new (dict): Current settings.
+        prefix (str): Dotted key of the trees.
+
+    Returns:
+        list: Dotted keys of the changed settings.
+    """
+    changed = []
+    for key in old.keys() | new.keys():
+        full_key = f"{prefix}.{key}" if prefix else key
+        old_value = old.get(key, _Missing)
+        new_value = new.get(key, _Missing)
+        if old_value is new_value:
+            continue
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            changed.extend(diff_settings(old_value, new_value, full_key))
+        elif old_value != new_value or type(old_value) is not type(new_value):
+            changed.append(full_key)
+    return changed
@@ -1,6 +1,10 @@
 import asyncio
+import io
 import logging
 import signal
+import sys
+import threading
+import traceback
 
 from tamarco.core.patterns import Singleton
 
@@ -28,58 +32,120 @@ def signal_handler(signal_number):
     return wrapper
 
 
+def format_stacks(loop=None):
+    """Format the stack of all the threads of the process and of all the tasks of the event loop.
+
+    Args:
+        loop: Event loop of the tasks, by default the running event loop.
+
+    Returns:
+        str: Stacks of the threads and the tasks.
+    """
+    lines = []
+    frames = sys._current_frames()
+    for thread in threading.enumerate():
+        lines.append(f"Thread {thread.name} (ident: {thread.ident}, daemon: {thread.daemon}):")
+        frame = frames.get(thread.ident)
+        if frame is not None:
+            lines.extend(line.rstrip("\n") for line in traceback.format_stack(frame))
+
+    all_tasks = getattr(asyncio, "all_tasks", None) or asyncio.Task.all_tasks
+    for task in all_tasks(loop):
+        task_stack = io.StringIO()
+        task.print_stack(file=task_stack)
+        lines.append(task_stack.getvalue().rstrip("\n"))
+    return "\n".join(lines)
+
+
 class SignalsManager(metaclass=Singleton):
-    """Class responsible of the handling of unix signals."""
+    """Class responsible of the handling of unix signals.
+
+    The handlers are always called from the event loop, never in the middle of the code interrupted by the signal: the
+    signals are received with `loop.add_signal_handler` and, when the loop doesn't implement it, a minimal signal
+    handler wakes up the loop through its self-pipe with `call_soon_threadsafe`, so it also works with a loop that
+    runs in another thread. A signal received while the handlers of the previous one are still running is coalesced
+    with it.
+    """
 
     handlers = {}
 
     def __init__(self):
         self.loop = None
         self.async_timeout_seconds = 5
+        self.dispatch_tasks = {}
 
     def set_loop(self, loop):
-        """Declares the event loop used for handlers that are coroutines.
+        """Declares the event loop used for handlers that are coroutines. The signals already registered start to be
+        received in this loop.
 
         Args:
             loop: asyncio event loop where to launch coroutines.
         """
-        self.loop = loop
+        previous_loop, self.loop = self.loop, loop
+        if previous_loop is loop:
+            return
+        self.dispatch_tasks = {}
+        for signal_number in self.handlers:
+            if previous_loop is not None and not previous_loop.is_closed():
+                self._remove_loop_signal_handler(previous_loop, signal_number)
+            self._install_signal(signal_number)
 
     def register_signal(self, handler, signal_number):
         """Register a handler for a signal.
 
         Args:
-            handler: function or coroutine to handle the signal_number.
+            handler: function or coroutine function to handle the signal_number, it is called with the signal number
+                and a frame that is always None.
             signal_number (int): number of the signal_number to be handled.
         """
         if signal_number not in self.handlers:
             self.handlers[signal_number] = []
-            signal.signal(signal_number, self._dispatch_signal)
+            self._install_signal(signal_number)
         self.handlers[signal_number].append(handler)
 
-    async def _cancellation_wrapper(self, task):
+    def _install_signal(self, signal_number):
+        if self.loop is None or self.loop.is_closed():
+            return
+        try:
+            self.loop.add_signal_handler(signal_number, self._receive_signal, signal_number)
+        except (ValueError, RuntimeError, NotImplementedError):
+            try:
+                signal.signal(signal_number, self._wake_up_loop)
+            except ValueError:
+                logger.warning(f"The signal {signal_number} can only be handled from the main thread")
+
+    @staticmethod
+    def _remove_loop_signal_handler(loop, signal_number):
+        try:
+            loop.remove_signal_handler(signal_number)
+        except (ValueError, RuntimeError, NotImplementedError):
+            pass
+
+    def _wake_up_loop(self, signum, frame):
+        """Signal handler of the fallback, it only schedules the handlers in the event loop."""
+        self.loop.call_soon_threadsafe(self._receive_signal, signum)
+
+    def _receive_signal(self, signum):
+        """Start the handlers of a signal, it is called from the event loop."""
+        dispatch_task = self.dispatch_tasks.get(signum)
+        if dispatch_task is not None and not dispatch_task.done():
+            logger.debug(f"Coalescing the signal {signum}, its handlers are still running")
+            return
+        self.dispatch_tasks[signum] = asyncio.ensure_future(self._dispatch_signal(signum), loop=self.loop)
+
+    async def _dispatch_signal(self, signum):
+        await asyncio.gather(*(self._call_handler(handler, signum) for handler in self.handlers.get(signum, [])))
+
+    async def _call_handler(self, handler, signum):
         try:
-            await asyncio.wait_for(task, self.async_timeout_seconds)
-        except asyncio.CancelledError:
-            logger.warning(f"Timeout triggered calling {task} in async signal_number handler", exc_info=True)
-
-    def _dispatch_signal(self, signum, frame):
-        for handler in self.handlers[signum]:
             if asyncio.iscoroutinefunction(handler):
-                try:
-                    asyncio.ensure_future(self._cancellation_wrapper(task=handler(signum, frame)), loop=self.loop)
-                except Exception:
-                    logger.warning(
-                        f"Error trying to execute the async signal_number handler {handler} of the "
-                        f"signal_number: {signum}",
-                        exc_info=True,
-                    )
+                await asyncio.wait_for(handler(signum, None), self.async_timeout_seconds)
             else:
-                try:
-                    handler(signum, frame)
-                except Exception:
-                    logger.warning(
-                        f"Unexpected exception in the signal_number handler {handler} of the "
-                        f"signal_number: {signum}",
-                        exc_info=True,
-                    )
+                handler(signum, None)
+        except asyncio.TimeoutError:
+            logger.warning(f"Timeout calling {handler} in async signal_number handler of the signal_number: {signum}")
+        except Exception:
+            logger.warning(
+                f"Unexpected exception in the signal_number handler {handler} of the signal_number: {signum}",
+                exc_info=True,
+            )
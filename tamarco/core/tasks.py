@@ -1,14 +1,20 @@
 import asyncio
+import inspect
 import logging
+import time
+from collections import deque
 from functools import partial, wraps
-from threading import Thread
+from threading import Event, Thread, current_thread
 from typing import Callable, Coroutine
 
 from tamarco.core.utils import is_awaitable
+from tamarco.resources.basic.metrics.meters import Counter, Gauge, Summary
 
 logger = logging.getLogger("tamarco.tasks")
 
 THREAD_STOP_TIMEOUT = 3
+DRAIN_TIMEOUT = 10
+ALL_TASKS_GROUP = "all"
 
 
 async def observe_exceptions(coro, name):
@@ -28,32 +34,139 @@ async def observe_exceptions(coro, name):
         raise
 
 
-def get_task_wrapper(coro_fn, name):
+class RestartPolicy:
+    """Restart policy of a supervised task.
+
+    A task that raises an exception is restarted after an exponential backoff. If it crashes more than
+    `max_restarts` times within `window` seconds it isn't restarted again and the failure is escalated.
+    """
+
+    def __init__(self, max_restarts=5, window=60, backoff=0.5, backoff_factor=2, max_backoff=30):
+        """
+        Args:
+            max_restarts (int): Maximum number of restarts within the window.
+            window (float): Seconds of the window where the crashes are counted.
+            backoff (float): Seconds before the first restart.
+            backoff_factor (float): Factor applied to the backoff in each crash within the window.
+            max_backoff (float): Maximum seconds before a restart.
+        """
+        self.max_restarts = max_restarts
+        self.window = window
+        self.backoff = backoff
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+
+    def get_backoff(self, crashes):
+        """Return the seconds before restarting a task.
+
+        Args:
+            crashes (int): Number of crashes of the task within the window.
+
+        Returns:
+            float: Seconds before the restart.
+        """
+        return min(self.backoff * self.backoff_factor ** (crashes - 1), self.max_backoff)
+
+
+class TaskRestartsExceeded(Exception):
+    """A supervised task crashed more times than allowed by its restart policy."""
+
+    def __init__(self, name, crashes, window):
+        super().__init__(f"The task {name} crashed {crashes} times in {window} seconds")
+        self.name = name
+
+
+async def supervise(coro_fn, name, restart_policy, *args, **kwargs):
+    """Run a coroutine function restarting it when it raises an exception, following a restart policy.
+
+    Args:
+        coro_fn: Coroutine function to supervise.
+        name (str): Task name.
+        restart_policy (RestartPolicy): Restart policy of the task.
+        *args: Arguments of the coroutine function.
+        **kwargs: Keyword arguments of the coroutine function.
+
+    Returns:
+        The result of the coroutine function.
+
+    Raises:
+        TaskRestartsExceeded: The task crashed more times than allowed by the restart policy.
+    """
+    labels = {"task": name}
+    crashes_meter = Counter("task_crashes", "crashes", labels=labels)
+    restarts_meter = Counter("task_restarts", "restarts", labels=labels)
+    crashes = deque()
+    while True:
+        try:
+            return await observe_exceptions(coro_fn(*args, **kwargs), name)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            crashes_meter.inc()
+            now = time.monotonic()
+            crashes.append(now)
+            while crashes[0] <= now - restart_policy.window:
+                crashes.popleft()
+            if len(crashes) > restart_policy.max_restarts:
+                logger.critical(f"Tamarco task {name} crashed {len(crashes)} times, it is not going to be restarted")
+                raise TaskRestartsExceeded(name, len(crashes), restart_policy.window) from exception
+            backoff = restart_policy.get_backoff(len(crashes))
+            logger.warning(f"Restarting Tamarco task {name} in {backoff} seconds")
+            await asyncio.sleep(backoff)
+            restarts_meter.inc()
+
+
+def get_task_wrapper(coro_fn, name, restart_policy=None):
     """Returns a coroutine that prints unexpected exceptions to the logging.
 
     Args:
         coro_fn: Coroutine to wrap.
         name (str): Task name.
+        restart_policy (RestartPolicy): Restart the coroutine when it raises an exception, by default it isn't
+            restarted.
     """
 
     @wraps(coro_fn)
     async def wrapper(*args, **kwargs):
+        if restart_policy is not None:
+            return await supervise(coro_fn, name, restart_policy, *args, **kwargs)
         coro = coro_fn(*args, **kwargs)
         return await observe_exceptions(coro, name)
 
     return wrapper
 
 
+def get_stop_event():
+    """Return the stop token of the current thread, it is set when the thread should stop.
+
+    Returns:
+        threading.Event: Stop token, None if the current thread isn't a thread of the tasks manager.
+    """
+    return getattr(current_thread(), "stop_event", None)
+
+
+def _accepts_stop_event(fn):
+    try:
+        return "stop_event" in inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return False
+
+
 def get_thread_wrapper(target, name):
     """Returns a target thread that prints unexpected exceptions to the logging.
 
+    If the target has a `stop_event` parameter, it receives the stop token of the thread.
+
     Args:
         target: Func or coroutine to wrap.
         name(str): Task name.
     """
+    accepts_stop_event = _accepts_stop_event(target)
 
     @wraps(target)
     def wrapper(*args, **kwargs):
+        if accepts_stop_event and "stop_event" not in kwargs:
+            kwargs["stop_event"] = get_stop_event()
         try:
             result = target(*args, **kwargs)
         except Exception:
@@ -70,6 +183,98 @@ def get_thread_wrapper(target, name):
     return wrapper
 
 
+class StoppableThread(Thread):
+    """Thread with a stop token, a threading.Event set when the thread should stop.
+
+    The workers can wait on the token instead of sleeping, so they stop as soon as it is set. The attribute `stop` is
+    kept for the workers that poll it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stop_event = Event()
+
+    @property
+    def stop(self):
+        return self.stop_event.is_set()
+
+    @stop.setter
+    def stop(self, value):
+        if value:
+            self.stop_event.set()
+        else:
+            self.stop_event.clear()
+
+
+class TasksLimiter:
+    """Limit of concurrent tasks of a group, the tasks waiting to start are admitted in FIFO order.
+
+    A finished task hands its slot to the first waiting task, so the waiting tasks are started as soon as there is room
+    for them and a new task can't overtake the waiting ones.
+    """
+
+    def __init__(self, group, limit=None):
+        """
+        Args:
+            group (str): Name of the group of tasks.
+            limit (int): Maximum number of concurrent tasks, None or 0 for no limit.
+        """
+        self.group = group
+        self.limit = limit
+        self.running = 0
+        self.waiters = deque()
+        labels = {"group": group}
+        self.running_meter = Gauge("tasks_running", "tasks", labels=labels)
+        self.queue_depth_meter = Gauge("tasks_queue_depth", "tasks", labels=labels)
+        self.wait_time_meter = Summary("tasks_admission_wait_time", "seconds", labels=labels)
+
+    def has_room(self):
+        return not self.limit or self.running < self.limit
+
+    def take(self):
+        """Take a slot without waiting, even if the limit is reached."""
+        self.running += 1
+        self.running_meter.set(self.running)
+
+    async def acquire(self, loop=None):
+        """Wait for a slot, the waiters are admitted in FIFO order.
+
+        Args:
+            loop: Event loop of the waiter, by default the current event loop.
+        """
+        if not self.waiters and self.has_room():
+            self.take()
+            return
+        waiter = (loop or asyncio.get_event_loop()).create_future()
+        self.waiters.append(waiter)
+        self.queue_depth_meter.set(len(self.waiters))
+        start_time = time.perf_counter()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if not waiter.cancelled():
+                # The slot was handed to this waiter before its cancellation, it is passed to the next one.
+                self.release()
+            elif waiter in self.waiters:
+                # A release can have already discarded the cancelled waiter.
+                self.waiters.remove(waiter)
+            raise
+        finally:
+            self.queue_depth_meter.set(len(self.waiters))
+            self.wait_time_meter.observe(time.perf_counter() - start_time)
+
+    def release(self):
+        """Release a slot, handing it to the first waiter."""
+        self.running -= 1
+        while self.waiters and self.has_room():
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                self.running += 1
+                waiter.set_result(None)
+        self.running_meter.set(self.running)
+        self.queue_depth_meter.set(len(self.waiters))
+
+
 class TasksManager:
     """Helper class to handle asyncio tasks and threads.
     The class is responsible of the start and stop of the tasks/threads.
@@ -80,11 +285,48 @@ class TasksManager:
         self.threads_fns = {}
         self.tasks = {}
         self.threads = {}
-        self.loop = asyncio.get_event_loop()
-        self.task_limit = task_limit
+        self.loop = None
+        self.limiter = TasksLimiter(ALL_TASKS_GROUP, task_limit)
+        self.groups_limiters = {}
+        self.in_flight_tasks = set()
+        self.failure_callbacks = []
+
+    @property
+    def task_limit(self):
+        """Maximum number of concurrent tasks when they are started with wait_for_start_task."""
+        return self.limiter.limit
+
+    @task_limit.setter
+    def task_limit(self, task_limit):
+        self.limiter.limit = task_limit
+
+    def add_failure_callback(self, callback):
+        """Add a function called when a supervised task exceeds the restarts of its restart policy.
+
+        Args:
+            callback: Function called with the task name and the TaskRestartsExceeded exception.
+        """
+        if callback not in self.failure_callbacks:
+            self.failure_callbacks.append(callback)
+
+    def set_group_limit(self, group, limit):
+        """Set the maximum number of concurrent tasks of a group, started with wait_for_start_task.
+
+        Args:
+            group (str): Name of the group.
+            limit (int): Maximum number of concurrent tasks of the group, None for no limit.
+        """
+        self._get_group_limiter(group).limit = limit
+
+    def _get_group_limiter(self, group):
+        try:
+            return self.groups_limiters[group]
+        except KeyError:
+            limiter = self.groups_limiters[group] = TasksLimiter(group)
+            return limiter
 
     def set_loop(self, loop):
-        """Sets the loop where the asyncio tasks are going to run.
+        """Sets the loop where the asyncio tasks are going to run. By default they run in the current event loop.
 
         Args:
             loop: Asyncio event loop.
@@ -142,49 +384,87 @@ class TasksManager:
             self.start_task(task_name)
         self.tasks_coros.clear()
 
-    def start_task(self, name, task_coro=None):
+    def start_task(self, name, task_coro=None, drain=False):
         """Start a single task.
 
         Args:
             name (str): Name of task. For identification purposes.
             task_coro: Coroutine or function that is going to be wrapped by the task.
+            drain (bool): The task is in-flight work that is allowed to finish when the tasks are stopped gracefully,
+                instead of being cancelled.
 
         Returns:
             Asyncio future with the result of the task.
         """
-        assert name not in self.tasks, f"Name {name} is already taken for a task"
-        if not task_coro:
-            task_coro = self.tasks_coros[name]
-        logger.debug(f"Starting the task {name}")
-        self.tasks[name] = asyncio.ensure_future(task_coro, loop=self.loop)
-        self.tasks[name].add_done_callback(partial(self._delete_task, name))
-        return self.tasks[name]
+        self.limiter.take()
+        return self._start_task(name, task_coro, [self.limiter], drain)
 
-    async def wait_for_start_task(self, name, task_coro):
-        """Start task waiting to open it if the number of concurrent tasks exceeds the task limit.
+    def _start_task(self, name, task_coro, limiters, drain):
+        try:
+            assert name not in self.tasks, f"Name {name} is already taken for a task"
+            if not task_coro:
+                task_coro = self.tasks_coros[name]
+            logger.debug(f"Starting the task {name}")
+            task = asyncio.ensure_future(task_coro, loop=self.loop)
+        except Exception:
+            self._release(limiters)
+            raise
+        self.tasks[name] = task
+        if drain:
+            self.in_flight_tasks.add(task)
+        task.add_done_callback(partial(self._delete_task, name, limiters))
+        return task
+
+    async def wait_for_start_task(self, name, task_coro, group=None):
+        """Start task waiting to open it if the number of concurrent tasks exceeds the task limit or the limit of its
+        group. The waiting tasks are started in FIFO order as soon as a task finishes. The task is in-flight work that
+        is allowed to finish when the tasks are stopped gracefully.
 
         Args:
             name (str): Name of task. For identification purposes.
             task_coro: Coroutine or function that is going to be wrapped by the task.
+            group (str): Group of the task, with its own limit of concurrent tasks (see set_group_limit).
 
         Returns:
             Asyncio future with the result of the task.
         """
-        if self.task_limit:
-            while True:
-                if len(self.tasks) < self.task_limit:
-                    return self.start_task(name, task_coro)
-                logger.debug("Limit number of coroutines reached in Tamarco task manager, waiting to open a new one")
-                await asyncio.sleep(0.1, loop=self.loop)
-        else:
-            return self.start_task(name, task_coro)
-
-    def _delete_task(self, name, future):
+        assert name not in self.tasks, f"Name {name} is already taken for a task"
+        limiters = [self._get_group_limiter(group)] if group is not None else []
+        limiters.append(self.limiter)
+        acquired = []
         try:
+            for limiter in limiters:
+                if not limiter.has_room() or limiter.waiters:
+                    logger.debug(f"Limit of concurrent tasks of {limiter.group} reached, waiting to start {name}")
+                await limiter.acquire(self.loop)
+                acquired.append(limiter)
+        except BaseException:
+            self._release(acquired)
+            raise
+        return self._start_task(name, task_coro, limiters, drain=True)
+
+    def _delete_task(self, name, limiters, future):
+        self._release(limiters)
+        self.in_flight_tasks.discard(future)
+        if not future.cancelled() and isinstance(future.exception(), TaskRestartsExceeded):
+            self._escalate_failure(name, future.exception())
+        if self.tasks.get(name) is future:
             del self.tasks[name]
-        except KeyError:
+        else:
             logger.debug(f"Task {name} was already removed from the task manager when the done callback is called")
 
+    def _escalate_failure(self, name, exception):
+        for callback in self.failure_callbacks:
+            try:
+                callback(name, exception)
+            except Exception:
+                logger.warning(f"Unexpected exception escalating the failure of the task {name}", exc_info=True)
+
+    @staticmethod
+    def _release(limiters):
+        for limiter in limiters:
+            limiter.release()
+
     def start_thread(self, name) -> Thread:
         """Start a thread by name.
 
@@ -196,8 +476,7 @@ class TasksManager:
         """
         assert name not in self.threads, f"Name {name} is already taken for a task"
         logger.debug(f"Starting the thread {name}")
-        self.threads[name] = Thread(target=self.threads_fns[name], name=name)
-        self.threads[name].stop = False
+        self.threads[name] = StoppableThread(target=self.threads_fns[name], name=name)
         self.threads[name].start()
         return self.threads[name]
 
@@ -212,6 +491,41 @@ class TasksManager:
 
         self.threads.clear()
 
+    async def stop_all_gracefully(self, timeout=DRAIN_TIMEOUT):
+        """Stop all threads and tasks letting them finish their work before a deadline.
+
+        The stop token of the threads is set and the tasks that aren't in-flight work (the long running tasks of the
+        microservice) are cancelled, so no new work is started. Then the in-flight tasks and the threads have until the
+        deadline to finish, the tasks still running after it are cancelled and the threads are abandoned.
+
+        Args:
+            timeout (float): Seconds to wait for the in-flight tasks and the threads.
+        """
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
+        for name, thread in self.threads.items():
+            logger.debug(f"Stopping thread {name}")
+            thread.stop = True
+        for name, task in list(self.tasks.items()):
+            if task not in self.in_flight_tasks:
+                self.stop_task(name)
+
+        if self.in_flight_tasks:
+            logger.info(f"Waiting up to {timeout} seconds for {len(self.in_flight_tasks)} in-flight tasks")
+            _, pending = await asyncio.wait(set(self.in_flight_tasks), timeout=timeout)
+            if pending:
+                logger.warning(f"{len(pending)} in-flight tasks didn't finish in {timeout} seconds, cancelling them")
+
+        threads, self.threads = self.threads, {}
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(None, partial(self._join_thread, name, thread, max(deadline - loop.time(), 0)))
+                for name, thread in threads.items()
+            )
+        )
+        for task_name in list(self.tasks.keys()):
+            self.stop_task(task_name)
+
     def stop_task(self, name):
         """Stop a task by name.
 
@@ -235,8 +549,8 @@ class TasksManager:
         del self.threads[name]
 
     @staticmethod
-    def _join_thread(name: str, thread) -> None:
-        thread.join(timeout=THREAD_STOP_TIMEOUT)
+    def _join_thread(name: str, thread, timeout=THREAD_STOP_TIMEOUT) -> None:
+        thread.join(timeout=timeout)
         if thread.is_alive():
             logger.warning(f"Trying to stop thread {name}, but did not join")
         else:
@@ -0,0 +1,242 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import weakref
+
+from tamarco.resources.basic.metrics.meters import Counter, Summary
+
+logger = logging.getLogger("tamarco.timers")
+
+FIXED_RATE = "fixed_rate"
+FIXED_DELAY = "fixed_delay"
+
+OVERLAP_SKIP = "skip"
+OVERLAP_QUEUE = "queue"
+OVERLAP_CONCURRENT = "concurrent"
+
+_schedulers = weakref.WeakKeyDictionary()
+
+
+def get_timers_scheduler(loop=None):
+    """Return the timers scheduler of an event loop, there is one scheduler per loop.
+
+    Args:
+        loop: Event loop, by default the current event loop.
+
+    Returns:
+        TimersScheduler: Scheduler of the loop.
+    """
+    loop = loop or asyncio.get_event_loop()
+    try:
+        return _schedulers[loop]
+    except KeyError:
+        scheduler = _schedulers[loop] = TimersScheduler(loop)
+        return scheduler
+
+
+class TimersScheduler:
+    """Scheduler of the timers of an event loop.
+
+    The next deadline of each timer is kept in a heap, a single task sleeps until the earliest deadline and fires the
+    due timers, so the number of timers doesn't add sleeping coroutines to the loop. The task ends when there are no
+    timers and it is started again with the next one.
+    """
+
+    def __init__(self, loop):
+        """
+        Args:
+            loop: Event loop of the timers.
+        """
+        self.loop = loop
+        self.heap = []
+        self.sequence = itertools.count()
+        self.scheduler_task = None
+        self.wakeup = None
+
+    def schedule(self, timer, deadline):
+        """Schedule the next firing of a timer.
+
+        Args:
+            timer (Timer): Timer to fire.
+            deadline (float): Time of the event loop clock when the timer is fired.
+        """
+        heapq.heappush(self.heap, (deadline, next(self.sequence), timer))
+        if self.scheduler_task is None or self.scheduler_task.done():
+            self.scheduler_task = asyncio.ensure_future(self._run(), loop=self.loop)
+        elif self.heap[0][2] is timer:
+            self._wake_up()
+
+    def _wake_up(self):
+        if self.wakeup is not None and not self.wakeup.done():
+            self.wakeup.set_result(None)
+
+    async def _run(self):
+        while self.heap:
+            deadline, _, timer = self.heap[0]
+            if deadline <= self.loop.time():
+                heapq.heappop(self.heap)
+                if not timer.cancelled:
+                    timer.fire(deadline)
+                continue
+            self.wakeup = self.loop.create_future()
+            handle = self.loop.call_at(deadline, self._wake_up)
+            try:
+                await self.wakeup
+            finally:
+                handle.cancel()
+        self.scheduler_task = None
+
+
+class Timer:
+    """Function called periodically by the timers scheduler of the event loop.
+
+    The deadlines are computed from the event loop clock, so the period doesn't drift with the execution time of the
+    function:
+
+    * fixed_rate: the function is called every interval, counted from the previous deadline. The deadlines missed
+      because the loop was blocked are skipped.
+    * fixed_delay: the function is called an interval after the end of the previous call.
+
+    A random jitter between 0 and `jitter` seconds is added to each deadline to avoid that the timers of several
+    instances fire at the same time. In fixed rate, when a deadline arrives while the previous call is still running,
+    the overlap policy decides: `skip` the call, `queue` it until the previous one ends or run it `concurrent`ly. The
+    queue holds at most `max_queued` calls, the calls that don't fit in it are skipped.
+    """
+
+    def __init__(
+        self,
+        fn,
+        interval,
+        mode=FIXED_RATE,
+        jitter=0,
+        overlap=OVERLAP_SKIP,
+        max_queued=1,
+        one_shot=False,
+        name=None,
+        args=(),
+        kwargs=None,
+        loop=None,
+    ):
+        """
+        Args:
+            fn: Coroutine function called by the timer.
+            interval (float): Interval in seconds.
+            mode (str): `fixed_rate` or `fixed_delay`.
+            jitter (float): Maximum random delay in seconds added to each deadline.
+            overlap (str): `skip`, `queue` or `concurrent`, policy of the fixed rate timers when a call is still
+                running at the next deadline.
+            max_queued (int): Maximum number of calls waiting for the previous one with the `queue` overlap policy.
+            one_shot (bool): Call the function only once.
+            name (str): Name of the timer, used in the logs and meters. By default the name of the function.
+            args: Arguments of the function.
+            kwargs: Keyword arguments of the function.
+            loop: Event loop of the timer, by default the current event loop.
+        """
+        assert mode in (FIXED_RATE, FIXED_DELAY), f"Invalid timer mode {mode}"
+        assert overlap in (OVERLAP_SKIP, OVERLAP_QUEUE, OVERLAP_CONCURRENT), f"Invalid timer overlap policy {overlap}"
+        self.fn = fn
+        self.interval = interval
+        self.mode = mode
+        self.jitter = jitter
+        self.overlap = overlap
+        self.max_queued = max_queued
+        self.one_shot = one_shot
+        self.name = name or getattr(fn, "__qualname__", repr(fn))
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.loop = loop or asyncio.get_event_loop()
+        self.scheduler = get_timers_scheduler(self.loop)
+        self.base_deadline = None
+        self.running = set()
+        self.queued = []
+        self.cancelled = False
+        self.exception = None
+        self.finished = self.loop.create_future()
+        labels = {"timer": self.name}
+        self.lag_meter = Summary("timer_lag", "seconds", labels=labels)
+        self.skipped_meter = Counter("timer_skipped_calls", "calls", labels=labels)
+
+    def _jitter(self):
+        return random.uniform(0, self.jitter) if self.jitter else 0
+
+    def start(self, delay=None):
+        """Schedule the first call of the timer.
+
+        Args:
+            delay (float): Seconds until the first call, by default the interval.
+        """
+        self.base_deadline = self.loop.time() + (self.interval if delay is None else delay)
+        self.scheduler.schedule(self, self.base_deadline + self._jitter())
+
+    def cancel(self):
+        """Stop the timer, cancelling the running calls."""
+        self.cancelled = True
+        self.queued.clear()
+        for call in list(self.running):
+            call.cancel()
+        if not self.finished.done():
+            self.finished.set_result(None)
+
+    async def wait(self):
+        """Wait until the timer is cancelled or its only call ends in a one shot timer.
+
+        Raises:
+            Exception: The exception of the call that stopped the timer.
+        """
+        await asyncio.shield(self.finished)
+        if self.exception is not None:
+            raise self.exception
+
+    def fire(self, deadline):
+        """Call the function, it is called by the scheduler in the deadline.
+
+        Args:
+            deadline (float): Scheduled time of the call.
+        """
+        if self.mode == FIXED_RATE and not self.one_shot:
+            self._schedule_next_rate()
+        if self.running and self.overlap != OVERLAP_CONCURRENT:
+            if self.overlap == OVERLAP_QUEUE and len(self.queued) < self.max_queued:
+                self.queued.append(deadline)
+            else:
+                logger.debug(f"Skipping a call of the timer {self.name}, the previous call is still running")
+                self.skipped_meter.inc()
+            return
+        self._call(deadline)
+
+    def _schedule_next_rate(self):
+        self.base_deadline += self.interval
+        now = self.loop.time()
+        if self.base_deadline < now:
+            missed_deadlines = int((now - self.base_deadline) // self.interval) + 1
+            logger.warning(f"The timer {self.name} missed {missed_deadlines} deadlines, the event loop was blocked")
+            self.skipped_meter.inc(missed_deadlines)
+            self.base_deadline += missed_deadlines * self.interval
+        self.scheduler.schedule(self, self.base_deadline + self._jitter())
+
+    def _call(self, deadline):
+        call = asyncio.ensure_future(self._run_call(deadline), loop=self.loop)
+        self.running.add(call)
+        call.add_done_callback(self._call_done)
+
+    async def _run_call(self, deadline):
+        self.lag_meter.observe(self.loop.time() - deadline)
+        logger.debug(f"Executing the timer {self.name}")
+        await self.fn(*self.args, **self.kwargs)
+
+    def _call_done(self, call):
+        self.running.discard(call)
+        if self.cancelled or call.cancelled():
+            return
+        if call.exception() is not None:
+            logger.error(f"Unexpected exception running the timer {self.name}, stopping it", exc_info=call.exception())
+            self.exception = call.exception()
+            self.cancel()
+        elif self.one_shot:
+            self.cancel()
+        elif self.queued:
+            self._call(self.queued.pop(0))
+        elif self.mode == FIXED_DELAY:
+            self.scheduler.schedule(self, self.loop.time() + self.interval + self._jitter())
@@ -7,8 +7,6 @@ import sys
 import threading
 from pprint import pformat
 
-import aiohttp
-
 logger = logging.getLogger("tamarco")
 
 ROOT_SETTINGS = "system"
@@ -137,6 +135,8 @@ class QueueTimeout(asyncio.Queue):
 async def check_connection_http_url(url, loop=None, retries=3):
     if not url:
         return False
+    import aiohttp
+
     for i in range(1, retries + 1):
         print(f"Checking connection #{i} from URL={url}")
         async with aiohttp.ClientSession(loop=loop) as client:
@@ -0,0 +1,427 @@
+import json
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+from tamarco.resources.basic.metrics.settings import PROMETHEUS_METRICS_HTTP_ENDPOINT
+from tamarco.resources.basic.status.settings import STATUS_HTTP_ENDPOINT
+
+logger = logging.getLogger("tamarco.workers")
+
+WORKERS_ENVIRONMENT_VARIABLE = "TAMARCO_WORKERS"
+WORKER_RESTART_DELAY = 1
+WORKERS_STOP_TIMEOUT = 30
+WORKERS_POLL_INTERVAL = 0.2
+WORKER_REPORT_TIMEOUT = 2
+
+
+def get_workers_from_environment_variable():
+    """Return the number of worker processes of the environment variable TAMARCO_WORKERS.
+
+    Returns:
+        int: Number of workers, None if the variable isn't set.
+    """
+    workers = os.environ.get(WORKERS_ENVIRONMENT_VARIABLE)
+    return int(workers) if workers else None
+
+
+class WorkersPortsCollision(Exception):
+    pass
+
+
+def get_worker_port(port, worker_index, ports_base=None):
+    """Return the port of a server that isn't shared between the workers, like the report server of each worker.
+
+    Args:
+        port (int): Port of the server in the supervisor.
+        worker_index (int): Index of the worker.
+        ports_base (int): Port of the server in the first worker, by default the port of the supervisor plus one.
+
+    Returns:
+        int: Port of the server in the worker.
+    """
+    if ports_base is None:
+        ports_base = port + 1
+    return ports_base + worker_index
+
+
+def check_workers_ports(shared_ports, own_ports, workers):
+    """Check that the ports of the HTTP servers don't collide with the ports that each worker takes for its own
+    servers, so the workers don't fail binding them.
+
+    Args:
+        shared_ports (dict): Port of each server shared between the workers, by name of the server.
+        own_ports (dict): Port in the supervisor and ports base of each server with its own port in each worker, by
+            name of the server.
+        workers (int): Number of workers.
+
+    Raises:
+        WorkersPortsCollision: When two servers use the same port.
+    """
+    used_ports = {}
+
+    def use_port(port, server):
+        if port in used_ports:
+            raise WorkersPortsCollision(
+                f"The port {port} of {server} collides with {used_ports[port]}, set the workers_ports_base setting of "
+                f"the servers with a port in each worker to a free range of ports"
+            )
+        used_ports[port] = server
+
+    for name, port in shared_ports.items():
+        use_port(port, f"the server {name}")
+    for name, (port, ports_base) in own_ports.items():
+        use_port(port, f"the server {name}")
+        for worker_index in range(workers):
+            use_port(get_worker_port(port, worker_index, ports_base), f"the server {name} of the worker {worker_index}")
+
+
+def create_reuse_port_socket(host, port, backlog=100):
+    """Create a listening socket with SO_REUSEPORT, so each worker listens in the same port and the kernel
+    balances the connections between them.
+
+    Args:
+        host (str): Host to bind.
+        port (int): Port to bind.
+        backlog (int): Maximum number of pending connections.
+
+    Returns:
+        socket.socket: Listening socket.
+    """
+    if not hasattr(socket, "SO_REUSEPORT"):
+        raise RuntimeError("The worker mode needs SO_REUSEPORT to share the listening sockets between the workers")
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind((host, port))
+        sock.listen(backlog)
+        sock.setblocking(False)
+    except Exception:
+        sock.close()
+        raise
+    return sock
+
+
+def _split_sample(line):
+    """Split a Prometheus sample line in metric name, labels and value."""
+    name, _, value = line.partition(" ")
+    if "{" not in name:
+        return name, "", value
+    name, _, rest = line.partition("{")
+    labels, _, value = rest.rpartition("}")
+    return name, labels, value.lstrip()
+
+
+def merge_prometheus_metrics(workers_metrics):
+    """Merge the Prometheus reports of the workers in one report, with the label `worker` in each sample.
+
+    Args:
+        workers_metrics (dict): Prometheus text report of each worker index.
+
+    Returns:
+        str: Merged Prometheus text report.
+    """
+    families = OrderedDict()
+    for worker_index, metrics in workers_metrics.items():
+        family_name = None
+        for line in metrics.splitlines():
+            if not line.strip():
+                continue
+            if line.startswith("#"):
+                tokens = line.split(None, 3)
+                if len(tokens) >= 3 and tokens[1] in ("HELP", "TYPE"):
+                    family_name = tokens[2]
+                    comments, _ = families.setdefault(family_name, ([], []))
+                    if line not in comments:
+                        comments.append(line)
+                continue
+            name, labels, value = _split_sample(line)
+            if family_name is None or not name.startswith(family_name):
+                family_name = name
+            _, samples = families.setdefault(family_name, ([], []))
+            worker_label = f'worker="{worker_index}"'
+            samples.append(f"{name}{{{labels + ',' if labels else ''}{worker_label}}} {value}")
+
+    lines = []
+    for comments, samples in families.values():
+        lines += comments
+        lines += samples
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def aggregate_workers_status(workers_status):
+    """Aggregate the status reports of the workers.
+
+    Args:
+        workers_status (dict): Tuple of HTTP status and status report (None if it wasn't reachable) by worker index.
+
+    Returns:
+        tuple: HTTP status and report of all the workers. The status is 200 if all the workers are 200, 500 if any
+            worker is failed or unreachable and 102 otherwise.
+    """
+    report = {}
+    statuses = []
+    for worker_index, (status, body) in workers_status.items():
+        report[str(worker_index)] = body if body is not None else {"error": "The worker is unreachable"}
+        statuses.append(status)
+    if all(status == 200 for status in statuses):
+        return 200, report
+    if any(status is None or status >= 500 for status in statuses):
+        return 500, report
+    return 102, report
+
+
+def _fetch(url, timeout=WORKER_REPORT_TIMEOUT):
+    """Make a GET request.
+
+    Returns:
+        tuple: HTTP status and body, (None, None) if the server is unreachable.
+    """
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return response.status, response.read().decode("utf-8")
+    except urllib.error.HTTPError as error:
+        return error.code, error.read().decode("utf-8")
+    except Exception:
+        logger.warning(f"Error requesting {url} to a worker", exc_info=True)
+        return None, None
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class WorkersReportServer:
+    """HTTP server of the supervisor with the metrics and status of all the workers.
+
+    Each worker serves its own report server in the port given by get_worker_port, the supervisor requests them
+    and merges the responses.
+    """
+
+    def __init__(self, host, port, workers, workers_ports_base=None):
+        """
+        Args:
+            host (str): Host of the report server.
+            port (int): Port of the report server.
+            workers (int): Number of workers.
+            workers_ports_base (int): Port of the report server of the first worker, see get_worker_port.
+        """
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.workers_ports_base = workers_ports_base
+        self.server = None
+        self.pid = None
+
+    def _worker_url(self, worker_index, path):
+        host = "127.0.0.1" if self.host in ("0.0.0.0", "") else self.host
+        return f"http://{host}:{get_worker_port(self.port, worker_index, self.workers_ports_base)}{path}"
+
+    def metrics(self):
+        """Return the merged Prometheus report of the reachable workers.
+
+        Returns:
+            str: Prometheus text report.
+        """
+        workers_metrics = OrderedDict()
+        for worker_index in range(self.workers):
+            status, body = _fetch(self._worker_url(worker_index, PROMETHEUS_METRICS_HTTP_ENDPOINT))
+            if status == 200:
+                workers_metrics[worker_index] = body
+        return merge_prometheus_metrics(workers_metrics)
+
+    def status(self):
+        """Return the aggregated status of the workers.
+
+        Returns:
+            tuple: HTTP status and status report.
+        """
+        workers_status = OrderedDict()
+        for worker_index in range(self.workers):
+            status, body = _fetch(self._worker_url(worker_index, STATUS_HTTP_ENDPOINT))
+            try:
+                workers_status[worker_index] = (status, json.loads(body) if body else None)
+            except ValueError:
+                workers_status[worker_index] = (status, None)
+        return aggregate_workers_status(workers_status)
+
+    def _handler_class(self):
+        report_server = self
+
+        class ReportHandler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802
+                path = self.path.split("?", 1)[0]
+                if path == PROMETHEUS_METRICS_HTTP_ENDPOINT:
+                    self._respond(200, report_server.metrics(), "text/plain; charset=utf-8")
+                elif path == STATUS_HTTP_ENDPOINT:
+                    status, report = report_server.status()
+                    self._respond(status, json.dumps(report), "application/json")
+                else:
+                    self._respond(404, "Not found", "text/plain; charset=utf-8")
+
+            def _respond(self, status, body, content_type):
+                body = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):  # noqa: A002
+                logger.debug(f"Report server request: {format % args}")
+
+        return ReportHandler
+
+    def start(self):
+        """Start serving in a forked process.
+
+        The supervisor forks the workers again when they die, so it must not run any thread: a forked child only has
+        the thread that forked it and the locks held by the other threads stay locked forever in the child.
+        """
+        self.server = _ThreadingHTTPServer((self.host, self.port), self._handler_class())
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 0
+            try:
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                self.server.serve_forever()
+            except BaseException:
+                logger.critical("Unexpected exception in the workers report server", exc_info=True)
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+        self.pid = pid
+        # Only the report server process keeps the listening socket, the workers must not inherit it.
+        self.server.server_close()
+        self.server = None
+        logger.info(f"Workers report server listening in {self.host}:{self.port} with pid {pid}")
+
+    def stop(self):
+        """Stop the report server process."""
+        if self.pid is not None:
+            try:
+                os.kill(self.pid, signal.SIGTERM)
+                os.waitpid(self.pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+            self.pid = None
+
+
+class WorkersSupervisor:
+    """Supervisor of the worker processes of a microservice.
+
+    The workers are forked from the supervisor, so they inherit everything loaded before, like the settings. A worker
+    that dies is forked again after a delay. The supervisor stops the workers with SIGTERM and kills them if they are
+    alive after the stop timeout.
+    """
+
+    def __init__(
+        self,
+        worker_target,
+        workers,
+        restart_delay=WORKER_RESTART_DELAY,
+        stop_timeout=WORKERS_STOP_TIMEOUT,
+        close_in_workers=None,
+    ):
+        """
+        Args:
+            worker_target: Function called with the worker index in each worker process, the worker exits when it
+                returns.
+            workers (int): Number of workers.
+            restart_delay (float): Seconds before forking again a dead worker.
+            stop_timeout (float): Seconds that the workers have to stop before being killed.
+            close_in_workers (list): Sockets of the supervisor that the workers inherit and must close.
+        """
+        self.worker_target = worker_target
+        self.close_in_workers = close_in_workers or []
+        self.workers_number = workers
+        self.restart_delay = restart_delay
+        self.stop_timeout = stop_timeout
+        self.workers = {}
+        self.restarts = 0
+        self.stop_event = threading.Event()
+
+    def _spawn(self, worker_index):
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 0
+            try:
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                for sock in self.close_in_workers:
+                    sock.close()
+                self.worker_target(worker_index)
+            except BaseException:
+                logger.critical(f"Unexpected exception in the worker {worker_index}", exc_info=True)
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+        logger.info(f"Started worker {worker_index} with pid {pid}")
+        self.workers[pid] = worker_index
+
+    def start(self):
+        """Fork all the workers."""
+        for worker_index in range(self.workers_number):
+            self._spawn(worker_index)
+
+    def supervise(self):
+        """Wait for the dead workers and fork them again until the supervisor is stopped, then stop the workers."""
+        while not self.stop_event.is_set():
+            pid, exit_status = os.waitpid(-1, os.WNOHANG) if self.workers else (0, 0)
+            if pid == 0:
+                self.stop_event.wait(WORKERS_POLL_INTERVAL)
+                continue
+            worker_index = self.workers.pop(pid, None)
+            if worker_index is None:
+                continue
+            logger.warning(f"Worker {worker_index} with pid {pid} died with status {exit_status}, restarting it")
+            if not self.stop_event.wait(self.restart_delay):
+                self.restarts += 1
+                self._spawn(worker_index)
+        self._stop_workers()
+
+    def stop(self, *args):
+        """Stop the supervision, it can be used as a signal handler."""
+        self.stop_event.set()
+
+    def _stop_workers(self):
+        for pid in self.workers:
+            self._kill(pid, signal.SIGTERM)
+        deadline = time.monotonic() + self.stop_timeout
+        while self.workers and time.monotonic() < deadline:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                time.sleep(WORKERS_POLL_INTERVAL)
+            else:
+                self.workers.pop(pid, None)
+        for pid, worker_index in list(self.workers.items()):
+            logger.critical(f"Worker {worker_index} with pid {pid} didn't stop in time, killing it")
+            self._kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        self.workers = {}
+
+    @staticmethod
+    def _kill(pid, signal_number):
+        try:
+            os.kill(pid, signal_number)
+        except ProcessLookupError:
+            pass
+
+    def run(self):
+        """Fork the workers and supervise them until SIGTERM or SIGINT."""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        self.start()
+        self.supervise()
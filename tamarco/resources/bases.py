@@ -23,10 +23,19 @@ class BaseResource:
     depends_on = []
     loggers_names = []
 
+    # Maximum seconds of each lifecycle method (pre_start, start, post_start, stop and post_stop), None (the default)
+    # disables it.
+    lifecycle_timeout = None
+
+    # Optional SettingsSchema, when it is declared the settings are resolved in configure_settings and the result is
+    # available in the config attribute.
+    settings_schema = None
+
     def __init__(self):
         self.name = None
         self.microservice = None
         self.settings = None
+        self.config = None
         self._status = StatusCodes.NOT_STARTED
 
     async def bind(self, microservice, name):
@@ -47,6 +56,8 @@ class BaseResource:
             settings (SettingsView): Settings view of the resource.
         """
         self.settings = settings
+        if self.settings_schema is not None:
+            self.config = await self.settings_schema.resolve(settings)
 
     async def pre_start(self):
         """Pre start stage of the resource lifecycle."""
@@ -1,8 +1,6 @@
 import logging
 from random import choice
 
-from sanic.response import text
-
 from tamarco.resources.basic.metrics.reporters.base import CarbonBaseHandler
 
 logger = logging.getLogger("tamarco.metrics")
@@ -30,6 +28,8 @@ class PrometheusHandler(CarbonBaseHandler):
         Returns:
             object: Response object with body in text format.
         """
+        from sanic.response import text
+
         return text(body=self.http_body, status=200)
 
     def write(self, meters):
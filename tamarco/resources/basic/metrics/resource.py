@@ -1,7 +1,7 @@
 import logging
 import socket
 
-from tamarco.core.settings.settings import SettingNotFound
+from tamarco.core.settings.schema import SettingField, SettingsSchema
 from tamarco.resources.bases import BaseResource
 from tamarco.resources.basic.metrics.manager import MetersManager
 from tamarco.resources.basic.metrics.reporters.carbon import CarbonHandler
@@ -18,6 +18,17 @@ class MetricsResource(BaseResource):
 
     depends_on = ["tamarco_http_report_server"]
     loggers_names = ["tamarco.metrics"]
+    settings_schema = SettingsSchema(
+        carbon_enabled=SettingField(bool, key="handlers.carbon.enabled", default=None),
+        carbon_host=SettingField(str, key="handlers.carbon.host", default=None),
+        carbon_port=SettingField(int, key="handlers.carbon.port", default=None),
+        file_enabled=SettingField(bool, key="handlers.file.enabled", default=None),
+        file_path=SettingField(str, key="handlers.file.path", default=None),
+        stdout_enabled=SettingField(bool, key="handlers.stdout.enabled", default=None),
+        stdout_prefix=SettingField(str, key="handlers.stdout.prefix", default=None),
+        prometheus_enabled=SettingField(bool, key="handlers.prometheus.enabled", default=None),
+        collect_frequency=SettingField((int, float), default=None),
+    )
 
     def __init__(self, *args, **kwargs):
         """Initialize the metrics resource.
@@ -57,97 +68,71 @@ class MetricsResource(BaseResource):
 
     async def _configure_carbon_handler(self):
         """Load the Carbon handler configuration settings and adds the handler to the Meters Manager."""
-        try:
-            enabled = await self.settings.get("handlers.carbon.enabled")
-        except SettingNotFound:
+        if self.config.carbon_enabled is None:
             self.logger.warning("Metrics carbon handler cannot be configured because the enabled setting is missing")
-        else:
-            if enabled:
-                try:
-                    host = await self.settings.get("handlers.carbon.host")
-                    port = await self.settings.get("handlers.carbon.port")
-                except SettingNotFound:
-                    self.logger.warning(
-                        "Metrics carbon handler cannot be configured because the host and/or port "
-                        "settings are missing."
-                    )
-                else:
-                    carbon_handler = CarbonHandler(host, port, self.metric_prefix)
-                    MetersManager.add_handler(carbon_handler)
+        elif self.config.carbon_enabled:
+            if self.config.carbon_host is None or self.config.carbon_port is None:
+                self.logger.warning(
+                    "Metrics carbon handler cannot be configured because the host and/or port settings are missing."
+                )
             else:
-                self.logger.info("Metrics carbon handler is disabled")
+                carbon_handler = CarbonHandler(self.config.carbon_host, self.config.carbon_port, self.metric_prefix)
+                MetersManager.add_handler(carbon_handler)
+        else:
+            self.logger.info("Metrics carbon handler is disabled")
 
     async def _configure_file_handler(self):
         """Load the File handler configuration settings and adds the handler to the Meters Manager."""
-        try:
-            enabled = await self.settings.get("handlers.file.enabled")
-        except SettingNotFound:
+        if self.config.file_enabled is None:
             self.logger.warning("Metrics file handler cannot be configured because the enabled setting is missing")
-        else:
-            if enabled:
-                try:
-                    file_path = await self.settings.get("handlers.file.path")
-                    file_handler = FileHandler(file_path=file_path)
-                except SettingNotFound:
-                    self.logger.warning("Metrics file handler cannot be configured because the path setting is missing")
-                else:
-                    MetersManager.add_handler(file_handler)
+        elif self.config.file_enabled:
+            if self.config.file_path is None:
+                self.logger.warning("Metrics file handler cannot be configured because the path setting is missing")
             else:
-                self.logger.info("Metrics file handler is disabled")
+                MetersManager.add_handler(FileHandler(file_path=self.config.file_path))
+        else:
+            self.logger.info("Metrics file handler is disabled")
 
     async def _configure_stdout_handler(self):
         """Load the Standard Output handler configuration settings and adds the handler to the Meters Manager."""
-        try:
-            enabled = await self.settings.get("handlers.stdout.enabled")
-        except SettingNotFound:
+        if self.config.stdout_enabled is None:
             self.logger.warning("Metrics stdout handler cannot be configured because the enabled setting is missing")
-        else:
-            if enabled:
-                try:
-                    stdout_prefix = await self.settings.get("handlers.stdout.prefix")
-                except SettingNotFound:
-                    self.logger.warning(
-                        "Metrics stdout handler cannot be configured because the prefix setting is " "missing"
-                    )
-                else:
-                    stdout_handler = StdoutHandler(metric_prefix=stdout_prefix)
-                    MetersManager.add_handler(stdout_handler)
+        elif self.config.stdout_enabled:
+            if self.config.stdout_prefix is None:
+                self.logger.warning("Metrics stdout handler cannot be configured because the prefix setting is missing")
             else:
-                self.logger.info("Metrics stdout handler is disabled")
+                MetersManager.add_handler(StdoutHandler(metric_prefix=self.config.stdout_prefix))
+        else:
+            self.logger.info("Metrics stdout handler is disabled")
 
     async def _configure_prometheus_handler(self):
         """Load the Prometheus handler configuration settings and adds the handler to the Meters Manager."""
-        try:
-            enabled = await self.settings.get("handlers.prometheus.enabled")
-        except SettingNotFound:
+        if self.config.prometheus_enabled is None:
             self.logger.warning(
-                "Metrics prometheus handler cannot be configured because the enabled setting is " "missing"
+                "Metrics prometheus handler cannot be configured because the enabled setting is missing"
             )
+        elif self.config.prometheus_enabled:
+            try:
+                prometheus_handler = PrometheusHandler(metric_id_prefix=self.microservice.name)
+                MetersManager.add_handler(prometheus_handler)
+                self.microservice.tamarco_http_report_server.add_endpoint(
+                    uri=PROMETHEUS_METRICS_HTTP_ENDPOINT, endpoint_handler=prometheus_handler.http_handler
+                )
+            except Exception:
+                self.logger.exception("Unexpected exception configuring the Metrics prometheus handler")
         else:
-            if enabled:
-                try:
-                    prometheus_handler = PrometheusHandler(metric_id_prefix=self.microservice.name)
-                    MetersManager.add_handler(prometheus_handler)
-                    self.microservice.tamarco_http_report_server.add_endpoint(
-                        uri=PROMETHEUS_METRICS_HTTP_ENDPOINT, endpoint_handler=prometheus_handler.http_handler
-                    )
-                except Exception:
-                    self.logger.exception("Unexpected exception configuring the Metrics prometheus handler")
-            else:
-                self.logger.info("Metrics prometheus handler is disabled")
+            self.logger.info("Metrics prometheus handler is disabled")
 
     async def _configure_collect_period(self):
         """Load the collect period setting and adds it to the Meters Manager."""
-        try:
-            collect_frequency = await self.settings.get("collect_frequency")
-        except SettingNotFound:
+        if self.config.collect_frequency is None:
             self.logger.warning(
                 f"Metrics collect frequency is not configured because the collect_frequency setting is "
                 f"missing. Using the default value: {MetersManager.default_collect_period}"
             )
         else:
-            self.logger.info(f"Metrics collect frequency configured: {collect_frequency} seconds")
-            MetersManager.configure(config={"collect_period": collect_frequency})
+            self.logger.info(f"Metrics collect frequency configured: {self.config.collect_frequency} seconds")
+            MetersManager.configure(config={"collect_period": self.config.collect_frequency})
 
     async def start(self):
         """Configure the metrics available handlers."""
@@ -2,8 +2,6 @@ import asyncio
 import logging
 import socket
 
-import aio_etcd
-
 from tamarco.core.patterns import Singleton
 from tamarco.core.utils import get_etcd_configuration_from_environment_variables
 from tamarco.resources.bases import BaseResource
@@ -43,7 +41,9 @@ class Registry(BaseResource, metaclass=Singleton):
             self.logger.info("Registry resource disabled")
 
     async def connect_to_etcd(self):
-        self.etcd_client = aio_etcd.Client(**self.etcd_config, loop=self.microservice.loop)
+        from tamarco.core.etcd_client import EtcdClientProvider
+
+        self.etcd_client = EtcdClientProvider().get_client(self.etcd_config, loop=self.microservice.loop)
 
     async def register_coroutine(self):
         try:
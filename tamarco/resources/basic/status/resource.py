@@ -1,12 +1,10 @@
 import asyncio
 import logging
 
-from sanic.response import json
-
 from tamarco.core.patterns import Singleton
 from tamarco.resources.bases import BaseResource
 from tamarco.resources.basic.status.status_codes import StatusCodes
-from .settings import STATUS_HTTP_ENDPOINT
+from .settings import SETTINGS_TRACE_HTTP_ENDPOINT, STARTUP_HTTP_ENDPOINT, STATUS_HTTP_ENDPOINT
 
 logger = logging.getLogger("tamarco.status")
 
@@ -42,6 +40,8 @@ def get_global_status(status):
 
 
 async def sanic_status_endpoint(request):
+    from sanic.response import json
+
     response = {}
     status = StatusResource()
     for name, resource in status.microservice.resources.items():
@@ -50,6 +50,26 @@ async def sanic_status_endpoint(request):
     return json(body=response, status=status)
 
 
+async def sanic_settings_trace_endpoint(request):
+    """Report of the settings reads, the query argument `limit` sets the maximum number of keys."""
+    from sanic.response import json
+
+    tracer = StatusResource().microservice.settings.tracer
+    if tracer is None:
+        return json(body={"error": "The settings tracing is disabled"}, status=404)
+    limit = request.args.get("limit")
+    if limit and not limit.isdecimal():
+        return json(body={"error": f"Invalid limit {limit}, it should be a positive integer"}, status=400)
+    return json(body=tracer.report(int(limit) if limit else None))
+
+
+async def sanic_startup_endpoint(request):
+    """Report of the duration of the startup phases of the microservice and the startup hooks of its resources."""
+    from sanic.response import json
+
+    return json(body=StatusResource().microservice.get_startup_report())
+
+
 class StatusResource(BaseResource, metaclass=Singleton):
     """
     """
@@ -63,22 +83,54 @@ class StatusResource(BaseResource, metaclass=Singleton):
         self.status_codes = StatusCodes
         self.critical_resources = []
         self.resources_to_restart_on_failure = []
+        self.failed_tasks = {}
+        self.check_status_task = None
 
     async def status(self):
+        if self.failed_tasks:
+            return {"status": self.status_codes.FAILED, "status_str": "FAILED", "failed_tasks": self.failed_tasks}
         return {"status": self.status_codes.STARTED, "status_str": "STARTED"}
 
-    async def start(self):
-        await super().start()
+    def report_task_failure(self, name, exception):
+        """Report a supervised task that exceeded the restarts of its restart policy, the status becomes failed.
+
+        Args:
+            name (str): Task name.
+            exception (Exception): Reason of the failure.
+        """
+        self.logger.critical(f"The task {name} of the microservice {self.microservice.name} failed: {exception}")
+        self.failed_tasks[name] = str(exception)
+
+    async def bind(self, microservice, name):
+        """Register the failure callback of the tasks and the endpoints of the report server only once, the start is
+        called again each time that the resource is restarted.
+
+        Args:
+            microservice (Microservice): Microservice instance managing the resource.
+            name (str): Name of the resource instance in the microservice class.
+        """
+        await super().bind(microservice, name)
+        self.microservice.tasks_manager.add_failure_callback(self.report_task_failure)
         self.microservice.tamarco_http_report_server.add_endpoint(
             uri=STATUS_HTTP_ENDPOINT, endpoint_handler=sanic_status_endpoint
         )
+        self.microservice.tamarco_http_report_server.add_endpoint(
+            uri=SETTINGS_TRACE_HTTP_ENDPOINT, endpoint_handler=sanic_settings_trace_endpoint
+        )
+        self.microservice.tamarco_http_report_server.add_endpoint(
+            uri=STARTUP_HTTP_ENDPOINT, endpoint_handler=sanic_startup_endpoint
+        )
+
+    async def start(self):
+        await super().start()
         self.critical_resources = await self.settings.get(
             "restart_policy.resources.restart_microservice_on_failure", []
         )
         self.resources_to_restart_on_failure = await self.settings.get(
             "restart_policy.resources.restart_resource_on_failure", []
         )
-        asyncio.ensure_future(self._check_status_repeatedly())
+        if self.check_status_task is None or self.check_status_task.done():
+            self.check_status_task = asyncio.ensure_future(self._check_status_repeatedly())
 
     async def stop(self):
         self.logger.info(f"Stopping Status resource: {self.name}")
@@ -114,6 +166,9 @@ class StatusResource(BaseResource, metaclass=Singleton):
 
     async def _restart_resource_on_failure(self):
         for name, resource in self.microservice.resources.items():
+            if resource is self and self.failed_tasks:
+                # Restarting the status resource doesn't recover the failed tasks.
+                continue
             if name in self.resources_to_restart_on_failure or "all" in self.resources_to_restart_on_failure:
                 status_response = await resource.status()
                 try:
@@ -1 +1,3 @@
 STATUS_HTTP_ENDPOINT = "/status"
+SETTINGS_TRACE_HTTP_ENDPOINT = "/status/settings"
+STARTUP_HTTP_ENDPOINT = "/status/startup"
@@ -11,8 +11,8 @@ START_PDB_SIGNAL = signal.SIGUSR1
 class PdbResource(BaseResource, metaclass=Singleton):
     async def bind(self, microservice: Microservice, name: str) -> None:
         super().bind(microservice, name)
-        microservice.signals_manager.register_signal(START_PDB_SIGNAL, self.start_pdb)
+        microservice.signals_manager.register_signal(self.start_pdb, START_PDB_SIGNAL)
 
     @staticmethod
-    def start_pdb():
+    def start_pdb(signum, frame):
         pdb.set_trace()
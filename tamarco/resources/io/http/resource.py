@@ -3,13 +3,10 @@ import copy
 import logging
 from collections import OrderedDict
 
-import aiohttp
 import ujson as json
-from cachetools import TTLCache
-from sanic import Sanic
-from sanic_cors import CORS
 
-from tamarco.core.settings.settings import SettingNotFound
+from tamarco.core.settings.schema import SettingField, SettingsSchema
+from tamarco.core.workers import create_reuse_port_socket, get_worker_port
 from tamarco.resources.bases import BaseResource
 from tamarco.resources.basic.status.status_codes import StatusCodes
 
@@ -26,11 +23,20 @@ class HTTPCacheMiddleware:
             ttl (int): Time To Live of the keys in the cache.
             header_keys (header_keys): List of the headers that will be part of the cache key.
         """
-        self.cache = TTLCache(maxsize, ttl)
+        self._cache = None
         self.maxsize = maxsize
         self.ttl = ttl
         self.header_keys = header_keys if isinstance(header_keys, list) else []
 
+    @property
+    def cache(self):
+        """TTL cache of the responses, created the first time it is used because each HTTP server has a middleware."""
+        if self._cache is None:
+            from cachetools import TTLCache
+
+            self._cache = TTLCache(self.maxsize, self.ttl)
+        return self._cache
+
     def _get_cache_key(self, request):
         headers = self._get_json_headers(request)
         return request.url + headers
@@ -77,12 +83,57 @@ class HTTPCacheMiddleware:
 class HTTPServerResource(BaseResource):
     depends_on = []
     loggers_names = ["tamarco.http"]
+    settings_schema = SettingsSchema(
+        host=SettingField(str, default=None),
+        port=SettingField(int, default=None),
+        workers_ports_base=SettingField(int, default=None),
+        debug=SettingField(bool, default=False),
+        keep_alive_connections=SettingField(bool, default=False),
+        cache_enabled=SettingField(bool, default=False),
+        cache_maxsize=SettingField(int, default=None),
+        cache_ttl=SettingField((int, float), default=None),
+        cache_header_keys=SettingField(list, default=None),
+    )
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, shared_between_workers=True, **kwargs):
+        """
+        Args:
+            shared_between_workers (bool): In the worker mode, if True all the workers listen in the same port with
+                SO_REUSEPORT, otherwise each worker listens in its own port (see get_worker_port), starting in the
+                workers_ports_base setting.
+        """
         super().__init__(*args, **kwargs)
-        self.app = Sanic("http_app", log_config=None)
+        self.shared_between_workers = shared_between_workers
+        self._app = None
+        self._pending_endpoints = []
+        self.logger = logging.getLogger("tamarco.http")
+        self._server_task = None
+        self.status_codes = StatusCodes
+        self.middleware_cache = HTTPCacheMiddleware()
+
+    @property
+    def app(self):
+        """Sanic application of the server. Sanic is imported and the application is created the first time that it is
+        used, so the microservices without HTTP server don't pay the import.
+
+        Returns:
+            Sanic: Application of the server.
+        """
+        if self._app is None:
+            self._app = self._create_app()
+            for uri, endpoint_handler in self._pending_endpoints:
+                self._app.route(uri)(endpoint_handler)
+            self._pending_endpoints.clear()
+        return self._app
+
+    @staticmethod
+    def _create_app():
+        from sanic import Sanic
+        from sanic_cors import CORS
+
+        app = Sanic("http_app", log_config=None)
         CORS(
-            self.app,
+            app,
             automatic_options=True,
             origins="*",
             supports_credentials=True,
@@ -101,10 +152,7 @@ class HTTPServerResource(BaseResource):
                 "If-Modified-Since",
             ],
         )
-        self.logger = logging.getLogger("tamarco.http")
-        self._server_task = None
-        self.status_codes = StatusCodes
-        self.middleware_cache = HTTPCacheMiddleware()
+        return app
 
     def set_cache_middleware(self, maxsize=None, ttl=None, header_keys=None):
         if maxsize is not None and maxsize != self.middleware_cache.maxsize:
@@ -129,36 +177,48 @@ class HTTPServerResource(BaseResource):
             raise HTTPErrorCacheMiddlewareEnabled()
 
     async def start(self):
-        self.app.config.KEEP_ALIVE = await self.settings.get("keep_alive_connections", False)
-        try:
+        if self.config.host is None or self.config.port is None:
+            self.logger.error("The HTTP Server resource settings are missing")
+        else:
+            self.app.config.KEEP_ALIVE = self.config.keep_alive_connections
             self._server_task = asyncio.ensure_future(
                 self.app.create_server(
-                    host=await self.settings.get("host"),
-                    port=await self.settings.get("port"),
-                    debug=await self.settings.get("debug"),
-                    return_asyncio_server=True,
+                    **self._get_listen_address(), debug=self.config.debug, return_asyncio_server=True
                 ),
                 loop=self.microservice.loop,
             )
 
-            cache_enabled = await self.settings.get("cache_enabled", False)
-            if cache_enabled:
-                maxsize = await self.settings.get("cache_maxsize", None)
-                ttl = await self.settings.get("cache_ttl", None)
-                header_keys = await self.settings.get("cache_header_keys", None)
-                self.set_cache_middleware(maxsize, ttl, header_keys)
+            if self.config.cache_enabled:
+                self.set_cache_middleware(
+                    self.config.cache_maxsize, self.config.cache_ttl, self.config.cache_header_keys
+                )
                 self.enable_cache_middleware()
-        except SettingNotFound:
-            self.logger.error("The HTTP Server resource settings are missing")
         await super().start()
 
+    def _get_listen_address(self):
+        """Return the address arguments of the server, in the worker mode they depend on the worker.
+
+        Returns:
+            dict: Host and port or listening socket.
+        """
+        worker_index = getattr(self.microservice, "worker_index", None)
+        if worker_index is None:
+            return {"host": self.config.host, "port": self.config.port}
+        if self.shared_between_workers:
+            return {"sock": create_reuse_port_socket(self.config.host, self.config.port)}
+        port = get_worker_port(self.config.port, worker_index, self.config.workers_ports_base)
+        return {"host": self.config.host, "port": port}
+
     def add_endpoint(self, uri, endpoint_handler):
         """
         Args:
             uri (str): Uri of the endpoint.
             endpoint_handler: Handler of the endpoint.
         """
-        self.app.route(uri)(endpoint_handler)
+        if self._app is None:
+            self._pending_endpoints.append((uri, endpoint_handler))
+        else:
+            self._app.route(uri)(endpoint_handler)
 
     async def stop(self):
         self.logger.info(f"Stopping HTTP Server resource: {self.name}")
@@ -182,6 +242,8 @@ class HTTPClientResource(BaseResource):
         self.status_codes = StatusCodes
 
     async def start(self):
+        import aiohttp
+
         self.session = aiohttp.ClientSession(loop=self.microservice.loop)
         await super().start()
 
@@ -4,17 +4,18 @@ from tamarco.core.settings.utils import parse_dir_response
 from tamarco.core.settings.utils.etcd_tool import EtcdTool
 
 
-def write_yml(yml_file, host="127.0.0.1", port=2379):
+def write_yml(yml_file, host="127.0.0.1", port=2379, compare_and_swap=False):
     """Write a yml file to etcd.
 
     Args:
         yml_file (str): Path to the yml file.
         host (str): Etcd host.
         port (int): Etcd port.
+        compare_and_swap (bool): Write only the keys that changed.
     """
     print(f"Writing the yml file {yml_file} in ETCD. Host: {host}. Port: {port}.")
     etcd_tool = EtcdTool(host=host, port=port)
-    etcd_tool.load(yml_file)
+    etcd_tool.load(yml_file, compare_and_swap=compare_and_swap)
     print("Write finished correctly.")
 
 
@@ -0,0 +1,60 @@
+import random
+import time
+
+from tamarco.core.dependency_resolver import resolve_dependency_order
+
+SIZES = [100, 300, 600]
+
+
+def _legacy_resolve_dependency_order(dependency_graph):
+    """Resolver scanning the whole graph until all the nodes are solved, as before."""
+    ordered_deps = []
+    solved_something = True
+    while len(ordered_deps) < len(dependency_graph) and solved_something:
+        solved_something = False
+        for node, dependencies in dependency_graph.items():
+            if not dependencies and node not in ordered_deps:
+                for other_dependencies in dependency_graph.values():
+                    if node in other_dependencies:
+                        other_dependencies.remove(node)
+                ordered_deps.append(node)
+                solved_something = True
+    return ordered_deps
+
+
+def _random_graph(size, max_dependencies=5):
+    rng = random.Random(size)
+    nodes = [f"resource_{index}" for index in range(size)]
+    graph = {}
+    for index, node in enumerate(nodes):
+        graph[node] = rng.sample(nodes[:index], min(index, rng.randint(0, max_dependencies)))
+    # The resolution order shouldn't depend on the declaration order.
+    items = list(graph.items())
+    rng.shuffle(items)
+    return dict(items)
+
+
+def _check_order(graph, order):
+    position = {node: index for index, node in enumerate(order)}
+    assert len(order) == len(graph)
+    for node, dependencies in graph.items():
+        assert all(position[dependency] < position[node] for dependency in dependencies)
+
+
+def test_dependency_resolver_scaling_benchmark():
+    print()
+    for size in SIZES:
+        graph = _random_graph(size)
+
+        start_time = time.perf_counter()
+        order = resolve_dependency_order(graph)
+        kahn_time = time.perf_counter() - start_time
+        _check_order(graph, order)
+
+        legacy_graph = {node: list(dependencies) for node, dependencies in graph.items()}
+        start_time = time.perf_counter()
+        legacy_order = _legacy_resolve_dependency_order(legacy_graph)
+        legacy_time = time.perf_counter() - start_time
+        _check_order(graph, legacy_order)
+
+        print(f"Dependency resolver with {size} resources: legacy {legacy_time:.4f}s, kahn {kahn_time:.4f}s")
@@ -0,0 +1,91 @@
+import asyncio
+import socket
+import time
+
+import pytest
+
+from tamarco.core.event_loop import get_event_loop_policy_class
+
+TASKS_NUMBER = 20000
+HTTP_CLIENTS = 10
+HTTP_REQUESTS_PER_CLIENT = 200
+
+REQUEST = b"GET / HTTP/1.1\r\nHost: 127.0.0.1\r\nConnection: keep-alive\r\n\r\n"
+RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Type: text/plain\r\nContent-Length: 2\r\nConnection: keep-alive\r\n\r\nok"
+
+
+class KeepAliveHTTPProtocol(asyncio.Protocol):
+    """Minimal HTTP/1.1 server answering `ok` to each request, it measures the I/O of the event loop without the
+    parsing of a web framework."""
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.buffer = b""
+
+    def data_received(self, data):
+        self.buffer += data
+        while b"\r\n\r\n" in self.buffer:
+            _, _, self.buffer = self.buffer.partition(b"\r\n\r\n")
+            self.transport.write(RESPONSE)
+
+
+def _free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _new_event_loop(event_loop):
+    if event_loop == "uvloop":
+        pytest.importorskip("uvloop")
+    return get_event_loop_policy_class(event_loop)().new_event_loop()
+
+
+async def _time_tasks():
+    async def tiny_task(number):
+        await asyncio.sleep(0)
+        return number
+
+    start_time = time.perf_counter()
+    results = await asyncio.gather(*(tiny_task(number) for number in range(TASKS_NUMBER)))
+    elapsed_time = time.perf_counter() - start_time
+    assert results == list(range(TASKS_NUMBER))
+    return elapsed_time
+
+
+async def _http_client(port):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for _ in range(HTTP_REQUESTS_PER_CLIENT):
+            writer.write(REQUEST)
+            assert await reader.readexactly(len(RESPONSE)) == RESPONSE
+    finally:
+        writer.close()
+
+
+async def _time_http_requests():
+    port = _free_port()
+    server = await asyncio.get_event_loop().create_server(KeepAliveHTTPProtocol, host="127.0.0.1", port=port)
+    try:
+        start_time = time.perf_counter()
+        await asyncio.gather(*(_http_client(port) for _ in range(HTTP_CLIENTS)))
+        return time.perf_counter() - start_time
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.parametrize("event_loop_implementation", ["asyncio", "uvloop"])
+def test_event_loop_throughput_benchmark(event_loop_implementation):
+    loop = _new_event_loop(event_loop_implementation)
+    try:
+        tasks_time = loop.run_until_complete(_time_tasks())
+        http_time = loop.run_until_complete(_time_http_requests())
+    finally:
+        loop.close()
+
+    http_requests = HTTP_CLIENTS * HTTP_REQUESTS_PER_CLIENT
+    print(
+        f"\nEvent loop {event_loop_implementation}: {TASKS_NUMBER / tasks_time:.0f} tasks/s, "
+        f"{http_requests / http_time:.0f} HTTP requests/s with {HTTP_CLIENTS} keep alive clients"
+    )
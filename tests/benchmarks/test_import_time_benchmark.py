@@ -0,0 +1,57 @@
+import json
+import os
+import subprocess
+import sys
+
+# The import time depends on the machine, the assertion of a budget in seconds is enabled with this variable.
+IMPORT_TIME_BUDGET_ENVIRONMENT_VARIABLE = "TAMARCO_IMPORT_TIME_BUDGET"
+
+LAZY_MODULES = [
+    "aio_etcd",
+    "aiohttp",
+    "cachetools",
+    "etcd",
+    "objgraph",
+    "pyes",
+    "redis",
+    "sanic",
+    "sanic_cors",
+    "tamarco.core.etcd_client",
+]
+
+IMPORT_SCRIPT = f"""
+import json
+import sys
+
+import tamarco.core.microservice
+
+print(json.dumps([module for module in {LAZY_MODULES!r} if module in sys.modules]))
+"""
+
+
+def _import_microservice():
+    """Import the microservice module in a new interpreter with `-X importtime`.
+
+    Returns:
+        tuple: Cumulative import time of the module in seconds and the lazy modules imported with it.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_SCRIPT], capture_output=True, text=True, check=True
+    )
+    cumulative_time = None
+    for line in process.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == "tamarco.core.microservice":
+            cumulative_time = int(fields[1]) / 1_000_000
+    imported_lazy_modules = json.loads(process.stdout.splitlines()[-1])
+    return cumulative_time, imported_lazy_modules
+
+
+def test_microservice_import_time_benchmark():
+    cumulative_time, imported_lazy_modules = _import_microservice()
+
+    print(f"\nImport of tamarco.core.microservice: {cumulative_time * 1000:.0f} ms")
+    assert imported_lazy_modules == []
+    import_time_budget = os.environ.get(IMPORT_TIME_BUDGET_ENVIRONMENT_VARIABLE)
+    if import_time_budget:
+        assert cumulative_time < float(import_time_budget)
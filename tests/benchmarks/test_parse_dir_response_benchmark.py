@@ -0,0 +1,46 @@
+import timeit
+
+import ujson
+from aio_etcd import EtcdResult
+
+from tamarco.core.settings.utils import _format_key_from_etcd, parse_dir_response
+
+NUMBER = 5
+
+
+def _legacy_parse_dir_response(response, queried_key):
+    """Previous implementation, iterating over the leaves and decoding each value apart."""
+    setting = {}
+    for result in response.children:
+        if result.value is None:
+            break
+        sub_key = _format_key_from_etcd(queried_key, result.key)
+        sub_keys = sub_key.split("/")
+        sub_setting = setting
+        for key in sub_keys[:-1]:
+            sub_setting = sub_setting.setdefault(key, {})
+        sub_setting[sub_keys[-1]] = ujson.loads(result.value)
+    return setting
+
+
+def _build_tree(key, width, depth):
+    if depth == 0:
+        return [{"key": f"{key}/key_{index}", "value": ujson.dumps(f"value_{index}")} for index in range(width)]
+    return [
+        {"key": f"{key}/dir_{index}", "dir": True, "nodes": _build_tree(f"{key}/dir_{index}", width, depth - 1)}
+        for index in range(width)
+    ]
+
+
+def test_parse_dir_response_benchmark():
+    # 10 x 10 x 10 directories with 10 keys each, 10000 leaves.
+    response = EtcdResult(None, node={"key": "/system", "dir": True, "nodes": _build_tree("/system", 10, 3)})
+
+    parsed = parse_dir_response(response, "system")
+    assert parsed == _legacy_parse_dir_response(response, "system")
+    assert parsed["dir_9"]["dir_9"]["dir_9"]["key_9"] == "value_9"
+
+    legacy_time = timeit.timeit(lambda: _legacy_parse_dir_response(response, "system"), number=NUMBER) / NUMBER
+    single_pass_time = timeit.timeit(lambda: parse_dir_response(response, "system"), number=NUMBER) / NUMBER
+
+    print(f"\nparse_dir_response of 10000 leaves: legacy {legacy_time:.4f}s, single pass {single_pass_time:.4f}s")
@@ -0,0 +1,48 @@
+import timeit
+
+from tamarco.core.settings.setting_proxy import SettingProxy, resolve_setting_proxy
+from tamarco.core.settings.settings import SettingsNotLoadedYet
+
+NUMBER = 200000
+
+
+def _unchecked_proxy(value):
+    """Proxy resolved as before, only setting the proxied object and keeping the not loaded checks."""
+    proxy = SettingProxy(SettingsNotLoadedYet("No settings yet"))
+    object.__setattr__(proxy, "_obj", value)
+    return proxy
+
+
+def _resolved_proxy(value):
+    proxy = SettingProxy(SettingsNotLoadedYet("No settings yet"))
+    resolve_setting_proxy(proxy, value)
+    return proxy
+
+
+def test_setting_proxy_attribute_access_benchmark():
+    value = "http://127.0.0.1:8080"
+    checked = _unchecked_proxy(value)
+    resolved = _resolved_proxy(value)
+
+    assert checked.startswith("http") and resolved.startswith("http")
+
+    direct_time = timeit.timeit(lambda: value.startswith("http"), number=NUMBER)
+    checked_time = timeit.timeit(lambda: checked.startswith("http"), number=NUMBER)
+    resolved_time = timeit.timeit(lambda: resolved.startswith("http"), number=NUMBER)
+
+    print(
+        f"\nSetting attribute access x{NUMBER}: direct {direct_time:.4f}s, checked proxy {checked_time:.4f}s, "
+        f"resolved proxy {resolved_time:.4f}s"
+    )
+
+
+def test_setting_proxy_special_method_benchmark():
+    value = 8080
+    resolved = _resolved_proxy(value)
+
+    assert resolved + 1 == 8081
+
+    direct_time = timeit.timeit(lambda: value + 1, number=NUMBER)
+    resolved_time = timeit.timeit(lambda: resolved + 1, number=NUMBER)
+
+    print(f"\nSetting special method x{NUMBER}: direct {direct_time:.4f}s, resolved proxy {resolved_time:.4f}s")
@@ -0,0 +1,51 @@
+import asyncio
+import time
+
+from tamarco.core.settings.settings import UNDEFINED, Settings, SettingsView
+
+NUMBER = 20000
+
+
+class LegacySettingsView(SettingsView):
+    """Settings view resolving the microservice settings with two settings gets, as before."""
+
+    async def get(self, key, default=None, raw=False):
+        value = await self.settings.get(f"{self.microservice_prefix}.{key}", UNDEFINED)
+        if value != UNDEFINED:
+            return value
+        return await self.settings.get(f"{self.prefix}.{key}", default)
+
+
+async def _time_gets(view, keys):
+    start_time = time.perf_counter()
+    for _ in range(NUMBER):
+        for key in keys:
+            await view.get(key)
+    return time.perf_counter() - start_time
+
+
+def test_settings_view_get_benchmark():
+    # Bypass the Singleton metaclass to not share state with the rest of the tests.
+    settings = type.__call__(Settings)
+    settings.update_internal(
+        {
+            "system": {
+                "resources": {"amqp": {"host": "127.0.0.1", "port": 5672, "connection": {"heartbeat": 60}}},
+                "microservices": {"test_ms": {"resources": {"amqp": {"port": 5673}}}},
+            }
+        }
+    )
+    keys = ["host", "port", "connection.heartbeat"]
+    legacy_view = LegacySettingsView(settings, "system.resources.amqp", "test_ms")
+    view = SettingsView(settings, "system.resources.amqp", "test_ms")
+
+    loop = asyncio.new_event_loop()
+    try:
+        for key in keys:
+            assert loop.run_until_complete(view.get(key)) == loop.run_until_complete(legacy_view.get(key))
+        legacy_time = loop.run_until_complete(_time_gets(legacy_view, keys))
+        merged_time = loop.run_until_complete(_time_gets(view, keys))
+    finally:
+        loop.close()
+
+    print(f"\nSettings view get x{NUMBER * len(keys)}: two lookups {legacy_time:.4f}s, merged {merged_time:.4f}s")
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from tamarco.core.settings.backends import DictSettingsBackend
+from tamarco.core.settings.settings import Settings, SettingsView
+from tamarco.core.settings.utils.debounce import DebouncedCallback
+from tests.utils import AsyncMock
+
+
+@pytest.mark.asyncio
+async def test_debounced_callback_coalesces_a_burst():
+    calls = []
+
+    async def callback(key, value):
+        calls.append((key, value))
+
+    debounced_callback = DebouncedCallback(callback, debounce=0.05)
+    for value in range(500):
+        await debounced_callback("system.logging.profile", value)
+    await debounced_callback("system.other", "a")
+    await asyncio.sleep(0.01)
+    assert calls == []
+
+    await asyncio.sleep(0.1)
+    assert calls == [("system.logging.profile", 499), ("system.other", "a")]
+
+
+@pytest.mark.asyncio
+async def test_debounced_callback_batch_and_max_wait():
+    calls = []
+
+    async def callback(changes):
+        calls.append(changes)
+
+    debounced_callback = DebouncedCallback(callback, debounce=0.05, batch=True, max_wait=0.1)
+    for value in range(10):
+        await debounced_callback(f"key_{value % 2}", value)
+        await asyncio.sleep(0.02)
+    await asyncio.sleep(0.1)
+
+    assert 1 < len(calls) < 10
+    assert calls[-1] in ({"key_0": 8, "key_1": 9}, {"key_1": 9})
+
+
+@pytest.mark.asyncio
+async def test_settings_view_watch_with_debounce(event_loop):
+    settings = type.__call__(Settings)
+    settings.external_backend = DictSettingsBackend({"system": {"logging": {"profile": "DEVELOP"}}}, loop=event_loop)
+    view = SettingsView(settings, "system.logging", "test_ms")
+    calls = []
+
+    async def callback(changes):
+        calls.append(changes)
+
+    await view.watch("profile", callback, batch=True)
+    await settings.external_backend.set("system.logging.profile", "PRODUCTION")
+    await settings.external_backend.set("system.microservices.test_ms.logging.profile", "TESTING")
+    await asyncio.sleep(0.01)
+
+    assert calls == [
+        {"system.logging.profile": "PRODUCTION", "system.microservices.test_ms.logging.profile": "TESTING"}
+    ]
+    await settings.cancel_watch_tasks()
+
+
+@pytest.mark.asyncio
+async def test_settings_view_watch_with_max_wait(event_loop):
+    settings = type.__call__(Settings)
+    settings.external_backend = DictSettingsBackend({"system": {"logging": {"profile": "DEVELOP"}}}, loop=event_loop)
+    view = SettingsView(settings, "system.logging", "test_ms")
+
+    await view.watch("profile", AsyncMock(), debounce=0.05, max_wait=0.1)
+
+    assert [callback.max_wait for callback in settings.debounced_callbacks] == [0.1]
+    await settings.cancel_watch_tasks()
@@ -0,0 +1,70 @@
+from unittest import mock
+
+import aio_etcd
+import pytest
+import ujson
+
+from tamarco.core.settings.backends.etcd import EtcdSettingsBackend
+from tamarco.core.settings.utils import flatten_settings
+from tests.utils import AsyncMock
+
+
+@pytest.fixture
+def etcd_backend():
+    with mock.patch("tamarco.core.settings.backends.etcd.EtcdClientProvider"):
+        backend = EtcdSettingsBackend({"host": "127.0.0.1"})
+    backend.client.write = AsyncMock()
+    backend.client.read = AsyncMock()
+    return backend
+
+
+def _written(backend):
+    return {call[1]["key"]: call[1] for call in backend.client.write.call_args_list}
+
+
+def test_flatten_settings():
+    leaves, empty_dirs = flatten_settings({"a": {"b": 1, "c": {"d": "e"}}, "f": True, "g": {}}, "/system")
+
+    assert sorted(leaves) == [("/system/a/b", 1), ("/system/a/c/d", "e"), ("/system/f", True)]
+    assert empty_dirs == ["/system/g"]
+
+
+@pytest.mark.asyncio
+async def test_etcd_backend_set_dict(etcd_backend):
+    written_keys = await etcd_backend.set("system.resources", {"http": {"port": 8080, "host": "0.0.0.0"}, "amqp": {}})
+
+    assert written_keys == 3
+    written = _written(etcd_backend)
+    assert written["/system/resources/http/port"]["value"] == "8080"
+    assert written["/system/resources/http/host"]["value"] == '"0.0.0.0"'
+    assert written["/system/resources/amqp"]["dir"]
+    assert "/system/resources/http" not in written
+
+
+@pytest.mark.asyncio
+async def test_etcd_backend_set_dict_compare_and_swap(etcd_backend):
+    current = mock.MagicMock()
+    current.leaves = [
+        mock.MagicMock(key="/system/port", value="8080", dir=False, modifiedIndex=3),
+        mock.MagicMock(key="/system/host", value='"127.0.0.1"', dir=False, modifiedIndex=4),
+    ]
+    etcd_backend.client.read.return_value = current
+
+    written_keys = await etcd_backend.set(
+        "system", {"port": 8080, "host": "0.0.0.0", "debug": True}, compare_and_swap=True
+    )
+
+    assert written_keys == 2
+    written = _written(etcd_backend)
+    assert "/system/port" not in written
+    assert written["/system/host"]["value"] == ujson.dumps("0.0.0.0")
+    assert written["/system/host"]["prevIndex"] == 4
+    assert written["/system/debug"]["prevExist"] is False
+
+
+@pytest.mark.asyncio
+async def test_etcd_backend_compare_and_swap_conflict(etcd_backend):
+    etcd_backend.client.read.side_effect = aio_etcd.EtcdKeyNotFound
+    etcd_backend.client.write.side_effect = aio_etcd.EtcdCompareFailed
+
+    assert await etcd_backend.set("system", {"port": 8080}, compare_and_swap=True) == 0
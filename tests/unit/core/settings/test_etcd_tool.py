@@ -0,0 +1,29 @@
+import threading
+from unittest import mock
+
+from tamarco.core.settings.utils.etcd_tool import EtcdTool
+
+
+def test_load_items_uses_a_client_per_thread():
+    clients_threads = {}
+    lock = threading.Lock()
+
+    def client_factory(*args):
+        client = mock.Mock()
+
+        def write(key, value, **kwargs):
+            with lock:
+                clients_threads.setdefault(id(client), set()).add(threading.get_ident())
+
+        client.write.side_effect = write
+        return client
+
+    with mock.patch("tamarco.core.settings.utils.etcd_tool.etcd.Client", side_effect=client_factory) as client_mock:
+        etcd_tool = EtcdTool(encode="json")
+        settings = {f"key_{index}": {"value": index, "empty": {}} for index in range(100)}
+        written_keys = etcd_tool.load_items(settings, "/settings", concurrency=4)
+
+    assert written_keys == 200
+    assert 1 < client_mock.call_count <= 5
+    assert all(len(threads) == 1 for threads in clients_threads.values())
+    etcd_tool.client.write.assert_not_called()
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from tamarco.core.settings.backends import DictSettingsBackend
+from tamarco.core.settings.settings import SettingNotFound, Settings
+
+
+class SlowBackend(DictSettingsBackend):
+    def __init__(self, dict_settings):
+        super().__init__(dict_settings)
+        self.requests = []
+        self.release = asyncio.Event()
+
+    async def get(self, key, default=None):
+        self.requests.append(key)
+        await self.release.wait()
+        if isinstance(default, Exception):
+            raise default
+        return await super().get(key, default)
+
+
+@pytest.fixture
+def settings():
+    # Bypass the Singleton metaclass to not share state with the rest of the tests.
+    settings = type.__call__(Settings)
+    settings.external_backend = SlowBackend({"system": {"http": {"port": 8080}}})
+    return settings
+
+
+@pytest.mark.asyncio
+async def test_concurrent_gets_share_one_external_request(settings):
+    gets = asyncio.gather(*(settings.get("system.http.port") for _ in range(50)))
+    await asyncio.sleep(0)
+    settings.external_backend.release.set()
+
+    assert await gets == [8080] * 50
+    assert settings.external_backend.requests == ["system.http.port"]
+    assert not settings.external_gets
+    assert await settings.get("system.http.port") == 8080
+    assert settings.external_backend.requests == ["system.http.port"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_gets_of_a_missing_setting(settings):
+    gets = [asyncio.ensure_future(settings.get("system.http.host", default)) for default in ("a", "b")]
+    not_found_get = asyncio.ensure_future(settings.get("system.http.host"))
+    await asyncio.sleep(0)
+    settings.external_backend.release.set()
+
+    assert await asyncio.gather(*gets) == ["a", "b"]
+    with pytest.raises(SettingNotFound):
+        await not_found_get
+    assert settings.external_backend.requests == ["system.http.host"]
+    # The miss is cached, the default of each get isn't.
+    assert await settings.get("system.http.host", "c") == "c"
+    assert settings.external_backend.requests == ["system.http.host"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_get_does_not_cancel_the_other_waiters(settings):
+    first_get = asyncio.ensure_future(settings.get("system.http.port"))
+    second_get = asyncio.ensure_future(settings.get("system.http.port"))
+    await asyncio.sleep(0)
+    first_get.cancel()
+    settings.external_backend.release.set()
+
+    assert await second_get == 8080
+    assert first_get.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_write_during_an_external_get_is_not_overwritten(settings):
+    get = asyncio.ensure_future(settings.get("system.http.port"))
+    await asyncio.sleep(0)
+    await settings.update_internal_settings("system.http.port", 9090)
+    settings.external_backend.release.set()
+
+    assert await get == 8080
+    assert await settings.get("system.http.port") == 9090
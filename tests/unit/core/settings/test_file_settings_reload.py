@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+import yaml
+
+from tamarco.core.settings.backends import DictSettingsBackend, YamlSettingsBackend
+from tamarco.core.settings.settings import Settings
+from tamarco.core.settings.utils import diff_settings
+from tamarco.core.settings.utils.file_watcher import FileWatcher
+
+
+@pytest.fixture
+def settings_file(tmpdir):
+    settings_file = tmpdir.join("settings.yml")
+    settings_file.write(yaml.dump({"system": {"logging": {"profile": "DEVELOP"}, "resources": {"http": {"port": 80}}}}))
+    return settings_file
+
+
+def _update_settings_file(settings_file, settings):
+    settings_file.write(yaml.dump(settings))
+
+
+def test_diff_settings():
+    old = {"a": {"b": 1, "c": {"d": 2}}, "e": 3, "f": {"g": 4}, "h": True}
+    new = {"a": {"b": 1, "c": {"d": 5}}, "e": {"x": 1}, "i": 6, "h": 1}
+
+    assert sorted(diff_settings(old, new)) == ["a.c.d", "e", "f", "h", "i"]
+    assert diff_settings(old, old) == []
+
+
+@pytest.mark.asyncio
+async def test_file_backend_reload_triggers_changed_callbacks(settings_file, event_loop):
+    backend = YamlSettingsBackend(file=str(settings_file), loop=event_loop)
+    calls = []
+
+    async def callback(key, value):
+        calls.append((key, value))
+
+    await backend.watch("system.logging.profile", callback)
+    await backend.watch("system.resources", callback)
+    try:
+        _update_settings_file(
+            settings_file, {"system": {"logging": {"profile": "PRODUCTION"}, "resources": {"http": {"port": 80}}}}
+        )
+        assert await backend.reload() == ["system.logging.profile"]
+        await asyncio.sleep(0)
+
+        assert calls == [("system.logging.profile", "PRODUCTION")]
+        assert await backend.get("system.logging.profile") == "PRODUCTION"
+    finally:
+        backend.cancel_watch_tasks()
+
+
+@pytest.mark.asyncio
+async def test_file_backend_reload_of_an_unchanged_file_with_lists(settings_file, event_loop):
+    settings = {"system": {"hosts": ["a", "b"], "resources": {"http": {"ports": [80, 443]}}}}
+    _update_settings_file(settings_file, settings)
+    backend = YamlSettingsBackend(file=str(settings_file), loop=event_loop)
+    calls = []
+
+    async def callback(key, value):
+        calls.append((key, value))
+
+    await backend.watch("system", callback)
+    try:
+        _update_settings_file(settings_file, settings)
+        assert await backend.reload() == []
+        await asyncio.sleep(0)
+
+        assert calls == []
+    finally:
+        backend.cancel_watch_tasks()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("inotify", [True, False])
+async def test_file_watcher_detects_changes(settings_file, inotify, monkeypatch):
+    changed = asyncio.Event()
+
+    async def callback():
+        changed.set()
+
+    if not inotify:
+        monkeypatch.setattr(FileWatcher, "_start_inotify", lambda self, loop: False)
+    watcher = FileWatcher(str(settings_file), callback, poll_interval=0.01)
+    watcher.start()
+    try:
+        _update_settings_file(settings_file, {"system": {"changed": True, "padding": "file size changes"}})
+        await asyncio.wait_for(changed.wait(), 2)
+    finally:
+        watcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_settings_updated_when_the_file_changes(settings_file, event_loop, monkeypatch):
+    monkeypatch.setenv("TAMARCO_YML_FILE", str(settings_file))
+    settings = type.__call__(Settings)
+    settings.loop = event_loop
+    await settings.start()
+    try:
+        assert await settings.get("system.logging.profile") == "DEVELOP"
+        assert await settings.get("system.resources.http") == {"port": 80}
+
+        _update_settings_file(
+            settings_file, {"system": {"logging": {"profile": "PRODUCTION"}, "resources": {"http": {"port": 8080}}}}
+        )
+        await settings.external_backend.reload()
+
+        assert await settings.get("system.logging.profile") == "PRODUCTION"
+        assert await settings.get("system.resources.http") == {"port": 8080}
+    finally:
+        await settings.stop()
+
+
+@pytest.mark.asyncio
+async def test_settings_reload(settings_file, event_loop, monkeypatch):
+    monkeypatch.setenv("TAMARCO_YML_FILE", str(settings_file))
+    settings = type.__call__(Settings)
+    settings.loop = event_loop
+    await settings.start()
+    try:
+        assert await settings.get("system.logging.profile") == "DEVELOP"
+
+        _update_settings_file(settings_file, {"system": {"logging": {"profile": "PRODUCTION"}}})
+        await settings.reload()
+
+        assert await settings.get("system.logging.profile") == "PRODUCTION"
+    finally:
+        await settings.stop()
+
+
+@pytest.mark.asyncio
+async def test_settings_reload_removes_the_settings_deleted_in_etcd(event_loop):
+    settings = type.__call__(Settings)
+    settings.loop = event_loop
+    settings.update_internal({"system": {"deploy_name": "old_name", "old": 1}})
+    settings.external_backend = DictSettingsBackend({"system": {"deploy_name": "new_name"}})
+    settings.etcd_external = True
+
+    await settings.reload()
+
+    assert await settings.get("system.deploy_name") == "new_name"
+    assert "old" not in settings.cached_settings()["system"]
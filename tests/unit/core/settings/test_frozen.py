@@ -0,0 +1,89 @@
+import copy
+import pickle
+import threading
+
+import pytest
+import ujson
+
+from tamarco.core.settings.backends import DictSettingsBackend
+from tamarco.core.settings.settings import Settings
+from tamarco.core.settings.utils import FrozenDict, FrozenList, freeze, thaw
+
+
+def test_frozen_tree_is_read_only():
+    tree = freeze({"a": {"b": [1, {"c": 2}]}})
+
+    assert isinstance(tree["a"], FrozenDict)
+    assert isinstance(tree["a"]["b"], FrozenList)
+    assert tree == {"a": {"b": [1, {"c": 2}]}}
+    assert ujson.loads(ujson.dumps(tree)) == tree
+    with pytest.raises(TypeError):
+        tree["a"]["x"] = 1
+    with pytest.raises(TypeError):
+        tree["a"].update({"x": 1})
+    with pytest.raises(TypeError):
+        tree["a"]["b"].append(3)
+    with pytest.raises(TypeError):
+        tree["a"]["b"][1]["c"] = 3
+
+
+def test_copy_and_thaw_frozen_tree():
+    tree = freeze({"a": {"b": [1, 2]}})
+
+    assert copy.deepcopy(tree) is tree
+    assert freeze(tree) is tree
+    assert pickle.loads(pickle.dumps(tree)) == tree
+
+    mutable = thaw(tree)
+    mutable["a"]["b"].append(3)
+    assert type(mutable["a"]) is dict
+    assert tree["a"]["b"] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_dict_backend_copy_on_write():
+    backend = DictSettingsBackend({"a": {"b": {"c": 1}}, "x": {"y": 2}})
+    snapshot = backend.settings
+
+    await backend.set("a.b.c", 3)
+    await backend.set("a.d", {"e": 4})
+
+    assert snapshot == {"a": {"b": {"c": 1}}, "x": {"y": 2}}
+    assert backend.settings == {"a": {"b": {"c": 3}, "d": {"e": 4}}, "x": {"y": 2}}
+    # Only the dictionaries in the path of the keys are copied, the rest of the tree is shared.
+    assert backend.settings["x"] is snapshot["x"]
+    assert isinstance(await backend.get("a.d"), FrozenDict)
+
+    await backend.delete("a.b")
+    assert backend.settings == {"a": {"d": {"e": 4}}, "x": {"y": 2}}
+    with pytest.raises(KeyError):
+        await backend.delete("a.b")
+
+
+def test_read_cached_settings_from_threads(event_loop):
+    # Bypass the Singleton metaclass to not share state with the rest of the tests.
+    settings = type.__call__(Settings)
+    settings.update_internal({"system": {"counter": {"value": 0, "double": 0}}})
+    stop = threading.Event()
+    torn_reads = []
+
+    def reader():
+        while not stop.is_set():
+            counter = settings.cached_settings()["system"]["counter"]
+            if counter["double"] != counter["value"] * 2:
+                torn_reads.append(counter)
+
+    async def writer():
+        for value in range(1, 200):
+            await settings.update_internal_settings("system.counter", {"value": value, "double": value * 2})
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    try:
+        event_loop.run_until_complete(writer())
+    finally:
+        stop.set()
+        thread.join()
+
+    assert not torn_reads
+    assert settings.cached_settings()["system"]["counter"] == {"value": 199, "double": 398}
@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+import yaml
+
+from tamarco.core.settings.backends import DictSettingsBackend, EnvironmentSettingsBackend, LayeredSettingsBackend
+from tamarco.core.settings.backends.environment import parse_environment_settings
+from tamarco.core.settings.settings import Settings
+
+
+@pytest.fixture
+def layers():
+    defaults = DictSettingsBackend(
+        {"system": {"logging": {"profile": "DEVELOP", "stdout": True}, "resources": {"http": {"port": 80}}}}
+    )
+    etcd = DictSettingsBackend({"system": {"logging": {"profile": "PRODUCTION"}}})
+    environment = DictSettingsBackend({"system": {"resources": {"http": {"port": 9090}}}})
+    return [defaults, etcd, environment]
+
+
+@pytest.fixture
+def layered_backend(layers, event_loop):
+    backend = LayeredSettingsBackend(layers, "system", write_layer=1, loop=event_loop)
+    event_loop.run_until_complete(backend.load())
+    return backend
+
+
+def test_parse_environment_settings():
+    environ = {
+        "TAMARCO_SETTING__system__logging__profile": "PRODUCTION",
+        "TAMARCO_SETTING__system__resources__http__port": "8080",
+        "TAMARCO_SETTING__system__logging__stdout": "false",
+        "TAMARCO_ETCD_HOST": "127.0.0.1",
+    }
+
+    assert parse_environment_settings(environ) == {
+        "system": {"logging": {"profile": "PRODUCTION", "stdout": False}, "resources": {"http": {"port": 8080}}}
+    }
+
+
+@pytest.mark.asyncio
+async def test_layered_backend_precedence(layered_backend):
+    assert await layered_backend.get("system") == {
+        "logging": {"profile": "PRODUCTION", "stdout": True},
+        "resources": {"http": {"port": 9090}},
+    }
+    assert await layered_backend.get("system.logging.profile") == "PRODUCTION"
+    assert await layered_backend.get("system.unknown", None) is None
+    with pytest.raises(KeyError):
+        await layered_backend.get("system.unknown")
+
+
+@pytest.mark.asyncio
+async def test_layered_backend_get_returns_the_frozen_tree(layered_backend):
+    logging_settings = await layered_backend.get("system.logging")
+
+    assert logging_settings is await layered_backend.get("system.logging")
+    with pytest.raises(TypeError):
+        logging_settings["profile"] = "TESTING"
+
+
+@pytest.mark.asyncio
+async def test_layered_backend_layer_update(layered_backend, layers):
+    calls = []
+
+    async def callback(key, value):
+        calls.append((key, value))
+
+    await layered_backend.watch("system.logging", callback)
+    await layered_backend.watch("system.resources", callback)
+    previous_resources = layered_backend.merged["system"]["resources"]
+    previous_merged = layered_backend.merged
+
+    assert await layered_backend.update_layer(0, "system.logging.stdout", False) == ["system.logging.stdout"]
+    assert await layered_backend.update_layer(0, "system.logging.profile", "TESTING") == []
+    await asyncio.sleep(0)
+
+    assert calls == [("system.logging", {"profile": "PRODUCTION", "stdout": False})]
+    assert layered_backend.merged["system"]["resources"] is previous_resources
+    assert previous_merged["system"]["logging"]["stdout"] is True
+
+    await layered_backend.update_layer(1, "system.logging.profile", None)
+    assert await layered_backend.get("system.logging.profile") == "TESTING"
+
+
+@pytest.mark.asyncio
+async def test_layered_backend_set_and_delete(layered_backend, layers):
+    await layered_backend.set("system.deploy_name", "test")
+
+    assert await layers[1].get("system.deploy_name") == "test"
+    assert await layered_backend.get("system.deploy_name") == "test"
+
+    await layered_backend.delete("system.deploy_name")
+    assert await layered_backend.get("system.deploy_name", None) is None
+
+
+@pytest.mark.asyncio
+async def test_settings_with_environment_overrides(tmpdir, event_loop, monkeypatch):
+    settings_file = tmpdir.join("settings.yml")
+    settings_file.write(
+        yaml.dump({"system": {"logging": {"profile": "DEVELOP", "stdout": True}}, "my_app": {"feature": True}})
+    )
+    monkeypatch.setenv("TAMARCO_YML_FILE", str(settings_file))
+    monkeypatch.setenv("TAMARCO_SETTING__system__logging__profile", "PRODUCTION")
+
+    settings = type.__call__(Settings)
+    settings.loop = event_loop
+    await settings.start()
+    try:
+        assert isinstance(settings.external_backend, LayeredSettingsBackend)
+        assert isinstance(settings.external_backend.layers[-1], EnvironmentSettingsBackend)
+        assert await settings.get("system.logging") == {"profile": "PRODUCTION", "stdout": True}
+        assert await settings.get("my_app.feature") is True
+    finally:
+        await settings.stop()
+
+
+@pytest.mark.asyncio
+async def test_layered_backend_update_with_the_same_list_does_not_change(layered_backend):
+    assert await layered_backend.update_layer(1, "system.hosts", ["a", "b"]) == ["system.hosts"]
+    assert await layered_backend.update_layer(1, "system.hosts", ["a", "b"]) == []
+
+
+@pytest.mark.asyncio
+async def test_layered_backend_keys_outside_the_root_key(layered_backend, layers):
+    await layers[0].set("my_app", {"feature": True, "color": "red"})
+    await layers[2].set("my_app.color", "blue")
+    calls = []
+
+    async def callback(key, value):
+        calls.append((key, value))
+
+    assert await layered_backend.get("my_app") == {"feature": True, "color": "blue"}
+    assert await layered_backend.get("my_app.color") == "blue"
+    assert await layered_backend.get("other_app", None) is None
+
+    await layered_backend.watch("my_app.feature", callback)
+    await layered_backend.update_layer(1, "my_app.feature", False)
+    await asyncio.sleep(0)
+
+    assert await layered_backend.get("my_app.feature") is False
+    assert calls == [("my_app.feature", False)]
@@ -0,0 +1,61 @@
+import pytest
+import ujson
+from aio_etcd import EtcdResult
+
+from tamarco.core.settings.utils import parse_dir_response
+
+
+def _dir_response(key, nodes):
+    return EtcdResult(None, node={"key": key, "dir": True, "nodes": nodes})
+
+
+def test_parse_dir_response():
+    response = _dir_response(
+        "/system",
+        [
+            {"key": "/system/deploy_name", "value": '"test"'},
+            {"key": "/system/empty", "dir": True},
+            {
+                "key": "/system/resources",
+                "dir": True,
+                "nodes": [
+                    {"key": "/system/resources/port", "value": "8080"},
+                    {"key": "/system/resources/hosts", "value": '["a","b"]'},
+                    {"key": "/system/resources/debug", "value": "true"},
+                ],
+            },
+            {"key": "/system/ratio", "value": "0.5"},
+        ],
+    )
+
+    assert parse_dir_response(response, "system") == {
+        "deploy_name": "test",
+        "empty": {},
+        "resources": {"port": 8080, "hosts": ["a", "b"], "debug": True},
+        "ratio": 0.5,
+    }
+
+
+def test_parse_dir_response_empty_dir():
+    assert parse_dir_response(_dir_response("/system", []), "system") == {}
+
+
+def test_parse_dir_response_invalid_value():
+    response = _dir_response("/system", [{"key": "/system/a", "value": "1"}, {"key": "/system/b", "value": "1,2"}])
+
+    with pytest.raises(ValueError):
+        parse_dir_response(response, "system")
+
+    # Joined, these invalid values would be a valid list with one element per key.
+    response = _dir_response("/system", [{"key": "/system/a", "value": "1,[2"}, {"key": "/system/b", "value": "3]"}])
+    with pytest.raises(ValueError):
+        parse_dir_response(response, "system")
+
+    response = _dir_response("/system", [{"key": "/system/a", "value": ujson.dumps("1,2")}])
+    assert parse_dir_response(response, "system") == {"a": "1,2"}
+
+
+def test_parse_dir_response_of_the_root():
+    response = _dir_response("/", [{"key": "/system", "dir": True, "nodes": [{"key": "/system/a", "value": "1"}]}])
+
+    assert parse_dir_response(response, "") == {"system": {"a": 1}}
@@ -0,0 +1,72 @@
+import pytest
+
+from tamarco.core.settings.schema import InvalidSetting, SettingField, SettingsSchema
+from tamarco.core.settings.settings import SettingNotFound, Settings, SettingsView
+
+
+@pytest.fixture
+def settings():
+    # Bypass the Singleton metaclass to not share state with the rest of the tests.
+    settings = type.__call__(Settings)
+    settings.update_internal(
+        {
+            "system": {
+                "resources": {
+                    "http": {"host": "127.0.0.1", "port": "8080", "debug": "true", "handlers": {"file": {"path": "/"}}}
+                },
+                "microservices": {"test_ms": {"resources": {"http": {"port": 9090, "host": "0.0.0.0"}}}},
+            }
+        }
+    )
+    return settings
+
+
+@pytest.mark.asyncio
+async def test_resolve_schema(settings):
+    schema = SettingsSchema(
+        host=SettingField(str),
+        port=SettingField(int),
+        debug=SettingField(bool),
+        file_path=SettingField(str, key="handlers.file.path"),
+        timeout=SettingField(float, default=1.5),
+    )
+    config = await schema.resolve(SettingsView(settings, "system.resources.http"))
+
+    assert config.host == "127.0.0.1"
+    assert config.port == 8080
+    assert config.debug is True
+    assert config.file_path == "/"
+    assert config.timeout == 1.5
+    assert config.as_dict() == {"host": "127.0.0.1", "port": 8080, "debug": True, "file_path": "/", "timeout": 1.5}
+
+
+@pytest.mark.asyncio
+async def test_resolve_schema_microservice_override(settings):
+    schema = SettingsSchema(port=SettingField(int), host=SettingField(str, overridable=False))
+    config = await schema.resolve(SettingsView(settings, "system.resources.http", "test_ms"))
+
+    assert config.port == 9090
+    assert config.host == "127.0.0.1"
+
+
+@pytest.mark.asyncio
+async def test_resolved_settings_are_read_only(settings):
+    schema = SettingsSchema(port=SettingField(int))
+    config = await schema.resolve(SettingsView(settings, "system.resources.http"))
+
+    with pytest.raises(AttributeError):
+        config.port = 1
+    with pytest.raises(AttributeError):
+        config.other = 1
+    assert not hasattr(config, "__dict__")
+
+
+@pytest.mark.asyncio
+async def test_resolve_schema_errors(settings):
+    view = SettingsView(settings, "system.resources.http")
+
+    with pytest.raises(SettingNotFound):
+        await SettingsSchema(user=SettingField(str)).resolve(view)
+
+    with pytest.raises(InvalidSetting):
+        await SettingsSchema(host=SettingField(int)).resolve(view)
@@ -0,0 +1,56 @@
+import pytest
+
+from tamarco.core.settings.setting_proxy import ResolvedSettingProxy, SettingProxy
+from tamarco.core.settings.settings import Settings, SettingsNotLoadedYet
+
+
+@pytest.fixture
+def settings():
+    # Bypass the Singleton metaclass to not share state with the rest of the tests.
+    settings = type.__call__(Settings)
+    settings.update_internal({"system": {"port": 8080, "name": "test", "hosts": ["a", "b"]}})
+    return settings
+
+
+def _promise(settings, key):
+    promised_setting = SettingProxy(SettingsNotLoadedYet("No settings yet"))
+    settings.register_promised_setting(key, promised_setting)
+    return promised_setting
+
+
+def test_register_several_promised_settings(settings):
+    first_port = _promise(settings, "system.port")
+    second_port = _promise(settings, "system.port")
+    name = _promise(settings, "system.name")
+
+    assert settings.promised_settings == {"system.port": [first_port, second_port], "system.name": [name]}
+
+
+def test_promised_setting_before_load(settings):
+    port = _promise(settings, "system.port")
+
+    with pytest.raises(SettingsNotLoadedYet):
+        port.real
+    with pytest.raises(SettingsNotLoadedYet):
+        str(port)
+
+
+@pytest.mark.asyncio
+async def test_promised_settings_resolved(settings):
+    port = _promise(settings, "system.port")
+    other_port = _promise(settings, "system.port")
+    name = _promise(settings, "system.name")
+    hosts = _promise(settings, "system.hosts")
+
+    await settings._resolve_promised_settings()
+
+    assert isinstance(port, ResolvedSettingProxy)
+    assert port + 1 == 8081
+    assert other_port == 8080
+    assert port.real == 8080
+    assert hash(port) == hash(8080)
+    assert name.upper() == "TEST"
+    assert f"{name}" == "test"
+    assert len(hosts) == 2
+    assert hosts[0] == "a"
+    assert list(hosts) == ["a", "b"]
@@ -0,0 +1,96 @@
+import pytest
+
+from tamarco.core.settings.backends import DictSettingsBackend
+from tamarco.core.settings.settings import Settings, SettingsView
+
+
+@pytest.fixture
+def settings():
+    # Bypass the Singleton metaclass to not share state with the rest of the tests.
+    settings = type.__call__(Settings)
+    settings.update_internal(
+        {
+            "system": {
+                "resources": {"http": {"host": "127.0.0.1", "port": 8080, "handlers": {"file": {"path": "/"}}}},
+                "microservices": {"test_ms": {"resources": {"http": {"port": 9090, "handlers": {"debug": True}}}}},
+            }
+        }
+    )
+    return settings
+
+
+@pytest.mark.asyncio
+async def test_view_merges_microservice_settings(settings):
+    view = SettingsView(settings, "system.resources.http", "test_ms")
+
+    assert await view.get("port") == 9090
+    assert await view.get("host") == "127.0.0.1"
+    assert await view.get("handlers") == {"file": {"path": "/"}, "debug": True}
+    assert await view.get("handlers.file.path") == "/"
+    assert await view.get("unknown", "default") == "default"
+
+
+@pytest.mark.asyncio
+async def test_view_merged_settings_are_rebuilt_after_a_change(settings):
+    view = SettingsView(settings, "system.resources.http", "test_ms")
+    assert await view.get("host") == "127.0.0.1"
+    merged_settings = view._get_merged_settings()
+
+    assert await view.get("port") == 9090
+    assert view._get_merged_settings() is merged_settings
+
+    await settings.set("system.microservices.test_ms.resources.http.host", "0.0.0.0")
+    assert await view.get("host") == "0.0.0.0"
+    await settings.delete("system.microservices.test_ms.resources.http.port")
+    assert await view.get("port") == 8080
+
+
+@pytest.mark.asyncio
+async def test_view_reads_the_external_backend_on_a_miss(settings):
+    settings.external_backend = DictSettingsBackend(
+        {"system": {"microservices": {"test_ms": {"resources": {"http": {"timeout": 5}}}}}}
+    )
+    view = SettingsView(settings, "system.resources.http", "test_ms")
+
+    assert await view.get("timeout") == 5
+    assert await view.get("retries", 3) == 3
+    # The misses of the external backend are cached as undefined, they don't hide the general settings.
+    assert await view.get("host") == "127.0.0.1"
+
+
+@pytest.mark.asyncio
+async def test_view_cached_general_setting_does_not_hide_an_uncached_override():
+    settings = type.__call__(Settings)
+    settings.external_backend = DictSettingsBackend(
+        {
+            "system": {
+                "resources": {"http": {"port": 1, "host": "127.0.0.1"}},
+                "microservices": {"test_ms": {"resources": {"http": {"port": 2}}}},
+            }
+        }
+    )
+    view = SettingsView(settings, "system.resources.http", "test_ms")
+
+    assert await settings.get("system.resources.http") == {"port": 1, "host": "127.0.0.1"}
+    assert await view.get("port") == 2
+    assert await view.get("host") == "127.0.0.1"
+    assert await view.get("port") == 2
+
+
+@pytest.mark.asyncio
+async def test_view_merges_the_same_way_before_and_after_caching():
+    settings = type.__call__(Settings)
+    settings.external_backend = DictSettingsBackend(
+        {
+            "system": {
+                "resources": {"http": {"options": {"a": 1, "b": 2}}},
+                "microservices": {"test_ms": {"resources": {"http": {"options": {"a": 3}}}}},
+            }
+        }
+    )
+    view = SettingsView(settings, "system.resources.http", "test_ms")
+
+    uncached_options = await view.get("options")
+    cached_options = await view.get("options")
+
+    assert uncached_options == cached_options == {"a": 3, "b": 2}
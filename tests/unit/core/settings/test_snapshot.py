@@ -0,0 +1,84 @@
+import asyncio
+import os
+from unittest import mock
+
+import pytest
+import ujson
+
+from tamarco.core.settings.settings import Settings
+from tamarco.core.settings.snapshot import SettingsSnapshot
+from tests.utils import AsyncMock
+
+
+@pytest.fixture
+def snapshot_path(tmpdir):
+    return os.path.join(str(tmpdir), "settings_snapshot.json")
+
+
+@pytest.fixture
+def fresh_settings(event_loop):
+    # Bypass the Singleton metaclass to not share state with the rest of the tests.
+    settings = type.__call__(Settings)
+    settings.loop = event_loop
+    yield settings
+    event_loop.run_until_complete(settings.stop())
+
+
+def test_snapshot_save_and_load(snapshot_path):
+    snapshot = SettingsSnapshot(snapshot_path)
+    snapshot.save({"system": {"deploy_name": "test"}}, etcd_index=42)
+
+    assert snapshot.load() == ({"system": {"deploy_name": "test"}}, 42)
+    assert [name for name in os.listdir(os.path.dirname(snapshot_path))] == ["settings_snapshot.json"]
+
+
+def test_snapshot_save_replaces_previous(snapshot_path):
+    snapshot = SettingsSnapshot(snapshot_path)
+    snapshot.save({"system": {"deploy_name": "old"}}, etcd_index=1)
+    snapshot.save({"system": {"deploy_name": "new"}}, etcd_index=2)
+
+    assert snapshot.load() == ({"system": {"deploy_name": "new"}}, 2)
+
+
+def test_snapshot_load_missing_or_corrupted(snapshot_path):
+    snapshot = SettingsSnapshot(snapshot_path)
+    assert snapshot.load() is None
+
+    with open(snapshot_path, "w") as snapshot_file:
+        snapshot_file.write('{"settings": {"system": ')
+    assert snapshot.load() is None
+
+
+@pytest.mark.asyncio
+async def test_settings_served_from_snapshot_when_etcd_is_down(fresh_settings, snapshot_path, monkeypatch):
+    SettingsSnapshot(snapshot_path).save({"system": {"deploy_name": "from_snapshot"}}, etcd_index=7)
+    monkeypatch.setenv("TAMARCO_ETCD_HOST", "127.0.0.1")
+    monkeypatch.setenv("TAMARCO_SETTINGS_SNAPSHOT_FILE", snapshot_path)
+
+    etcd_backend = mock.MagicMock()
+    etcd_backend.check_etcd_health = AsyncMock(side_effect=ConnectionError)
+    with mock.patch("tamarco.core.settings.backends.etcd.EtcdSettingsBackend", return_value=etcd_backend):
+        await fresh_settings.start()
+
+    assert await fresh_settings.get("system.deploy_name") == "from_snapshot"
+    assert fresh_settings.etcd_external
+    assert not fresh_settings.reconcile_task.done()
+
+
+@pytest.mark.asyncio
+async def test_settings_reconcile_with_etcd_saves_snapshot(fresh_settings, snapshot_path, monkeypatch):
+    SettingsSnapshot(snapshot_path).save({"system": {"deploy_name": "from_snapshot", "old": 1}}, etcd_index=7)
+    monkeypatch.setenv("TAMARCO_ETCD_HOST", "127.0.0.1")
+    monkeypatch.setenv("TAMARCO_SETTINGS_SNAPSHOT_FILE", snapshot_path)
+
+    etcd_backend = mock.MagicMock()
+    etcd_backend.check_etcd_health = AsyncMock()
+    etcd_backend.get_with_index = AsyncMock(return_value=({"deploy_name": "from_etcd"}, 8))
+    with mock.patch("tamarco.core.settings.backends.etcd.EtcdSettingsBackend", return_value=etcd_backend):
+        await fresh_settings.start()
+        await asyncio.wait_for(fresh_settings.reconcile_task, 1)
+
+    assert await fresh_settings.get("system.deploy_name") == "from_etcd"
+    assert "old" not in fresh_settings.cached_settings()["system"]
+    with open(snapshot_path) as snapshot_file:
+        assert ujson.load(snapshot_file) == {"etcd_index": 8, "settings": {"system": {"deploy_name": "from_etcd"}}}
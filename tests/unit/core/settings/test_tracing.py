@@ -0,0 +1,70 @@
+import pytest
+
+from tamarco.core.settings.backends import DictSettingsBackend
+from tamarco.core.settings.settings import Settings, SettingsView
+from tamarco.core.settings.tracing import SettingsTracer
+
+
+@pytest.fixture
+def settings():
+    # Bypass the Singleton metaclass to not share state with the rest of the tests.
+    settings = type.__call__(Settings)
+    settings.update_internal({"system": {"resources": {"http": {"port": 8080}}}})
+    settings.external_backend = DictSettingsBackend({"system": {"resources": {"http": {"host": "0.0.0.0"}}}})
+    return settings
+
+
+@pytest.mark.asyncio
+async def test_tracing_disabled_by_default(settings):
+    assert settings.tracer is None
+    assert await settings.get("system.resources.http.port") == 8080
+
+
+@pytest.mark.asyncio
+async def test_trace_settings_view_reads(settings):
+    tracer = settings.enable_tracing()
+    view = SettingsView(settings, "system.resources.http")
+
+    for _ in range(3):
+        assert await view.get("port") == 8080
+    assert await view.get("host") == "0.0.0.0"
+    assert await view.get("host") == "0.0.0.0"
+
+    report = tracer.report()
+    assert report["reads"] == 5
+    assert report["hits"] == 4
+    assert report["misses"] == 1
+
+    port_stats, host_stats = report["keys"]
+    assert port_stats["key"] == "system.resources.http.port"
+    assert port_stats["reads"] == 3
+    assert port_stats["callers"] == {"http": 3}
+    assert host_stats["hits"] == 1
+    assert host_stats["misses"] == 1
+    assert host_stats["external_time"] > 0
+
+
+@pytest.mark.asyncio
+async def test_trace_direct_reads_with_the_caller_module(settings):
+    tracer = settings.enable_tracing()
+
+    assert await settings.get("system.unknown", None) is None
+
+    stats = tracer.report()["keys"][0]
+    assert stats["misses"] == 1
+    assert stats["callers"] == {__name__: 1}
+
+
+def test_tracer_report_limit():
+    tracer = SettingsTracer()
+    tracer.record_hit("a", "http")
+    tracer.record_hit("b", "http")
+    tracer.record_hit("b", "amqp")
+    tracer.record_miss("c", "http", 0.5)
+
+    report = tracer.report(limit=1)
+    assert [stats["key"] for stats in report["keys"]] == ["b"]
+    assert report["keys"][0]["callers"] == {"http": 1, "amqp": 1}
+
+    tracer.reset()
+    assert tracer.report()["reads"] == 0
@@ -1,6 +1,6 @@
 import pytest
 
-from tamarco.core.dependency_resolver import CantSolveDependencies, resolve_dependency_order
+from tamarco.core.dependency_resolver import CantSolveDependencies, resolve_dependency_levels, resolve_dependency_order
 
 
 def test_resolve_dependencies():
@@ -34,3 +34,39 @@ def test_resolve_dependencies_fail():
     with pytest.raises(CantSolveDependencies):
         result = resolve_dependency_order(dependency_graph)
         assert result
+
+
+def test_resolve_dependency_levels():
+    dependency_graph = {
+        "http": [],
+        "settings": [],
+        "metrics": ["http"],
+        "status": ["http"],
+        "amqp": ["settings", "status"],
+    }
+    levels = resolve_dependency_levels(dependency_graph)
+
+    assert [sorted(level) for level in levels] == [["http", "settings"], ["metrics", "status"], ["amqp"]]
+    assert dependency_graph["amqp"] == ["settings", "status"]
+
+
+def test_resolve_dependencies_reports_the_cycle():
+    dependency_graph = {
+        "settings": [],
+        "logging": ["settings", "status"],
+        "metrics": ["logging"],
+        "status": ["metrics"],
+        "amqp": ["status"],
+    }
+
+    with pytest.raises(CantSolveDependencies) as exc_info:
+        resolve_dependency_order(dependency_graph)
+
+    assert exc_info.value.cycle == ["logging", "status", "metrics", "logging"]
+    assert "logging -> status -> metrics -> logging" in str(exc_info.value)
+    assert dependency_graph["logging"] == ["settings", "status"]
+
+
+def test_resolve_dependencies_unknown_node():
+    with pytest.raises(CantSolveDependencies, match="unknown node settings"):
+        resolve_dependency_order({"logging": ["settings"]})
@@ -0,0 +1,89 @@
+import asyncio
+from unittest import mock
+
+import aio_etcd
+import pytest
+
+from tamarco.core.etcd_client import EtcdClientProvider, PooledEtcdClient
+from tests.utils import AsyncMock
+
+
+@pytest.fixture
+def provider(event_loop):
+    # Bypass the Singleton metaclass to not share clients with the rest of the tests.
+    provider = type.__call__(EtcdClientProvider)
+    yield provider
+    event_loop.run_until_complete(provider.close(event_loop))
+
+
+@pytest.mark.asyncio
+async def test_provider_shares_the_client_by_loop_and_configuration(provider, event_loop, monkeypatch):
+    monkeypatch.setenv("TAMARCO_ETCD_POOL_SIZE", "4")
+    client = provider.get_client({"host": "127.0.0.1", "port": 2379}, loop=event_loop)
+
+    assert provider.get_client({"port": 2379, "host": "127.0.0.1"}, loop=event_loop) is client
+    assert provider.get_client({"host": "127.0.0.2", "port": 2379}, loop=event_loop) is not client
+    assert client._client.connector.limit == 4
+    assert provider.pool_stats(event_loop)[str({"host": "127.0.0.1", "port": 2379})] == {
+        "size": 4,
+        "in_flight": 0,
+    }
+
+
+def test_provider_client_by_loop(provider):
+    async def get_client():
+        return provider.get_client({"host": "127.0.0.1", "port": 2379})
+
+    loops = [asyncio.new_event_loop() for _ in range(2)]
+    try:
+        clients = [loop.run_until_complete(get_client()) for loop in loops]
+        assert clients[0] is not clients[1]
+        assert clients[0] is loops[0].run_until_complete(get_client())
+        for loop in loops:
+            loop.run_until_complete(provider.close(loop))
+    finally:
+        for loop in loops:
+            loop.close()
+
+
+@pytest.mark.asyncio
+async def test_pooled_client_request_timeouts_and_round_robin(event_loop):
+    client = PooledEtcdClient(request_timeout=2, watch_timeout=60, round_robin=True, loop=event_loop)
+    client.machines = AsyncMock(return_value=["http://10.0.0.1:2379", "http://10.0.0.2:2379"])
+    used_servers = []
+
+    async def api_execute(self, path, method, params=None, **kw):
+        used_servers.append((self._base_uri, kw["timeout"].total, self.pool_stats()["in_flight"]))
+
+    try:
+        with mock.patch.object(aio_etcd.Client, "api_execute", api_execute):
+            await client.api_execute("/v2/keys/a", client._MGET, params={})
+            await client.api_execute("/v2/keys/a", client._MGET, params={"wait": "true"}, timeout=None)
+            await client.api_execute("/v2/keys/a", client._MGET, params={})
+    finally:
+        await client.close_session()
+
+    assert used_servers == [
+        ("http://10.0.0.1:2379", 2, 1),
+        ("http://10.0.0.2:2379", 60, 1),
+        ("http://10.0.0.1:2379", 2, 1),
+    ]
+    assert client.pool_stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pooled_client_watch_timeout(event_loop):
+    client = PooledEtcdClient(request_timeout=2, watch_timeout=60, loop=event_loop)
+    timeouts = []
+
+    async def api_execute(self, path, method, params=None, **kw):
+        timeouts.append(kw["timeout"])
+        raise asyncio.CancelledError
+
+    try:
+        with mock.patch.object(aio_etcd.Client, "api_execute", api_execute), pytest.raises(asyncio.CancelledError):
+            await client.watch("/a")
+    finally:
+        await client.close_session()
+
+    assert timeouts == [client.watch_timeout]
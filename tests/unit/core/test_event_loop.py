@@ -0,0 +1,82 @@
+import asyncio
+import builtins
+import sys
+
+import pytest
+
+from tamarco.core.event_loop import (
+    EVENT_LOOP_ENVIRONMENT_VARIABLE,
+    LazyEventLoop,
+    get_event_loop_policy_class,
+    install_event_loop_policy,
+)
+
+
+class CustomEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    pass
+
+
+@pytest.fixture
+def restore_policy():
+    policy = asyncio.get_event_loop_policy()
+    yield
+    asyncio.set_event_loop_policy(policy)
+
+
+@pytest.fixture
+def without_uvloop(monkeypatch):
+    original_import = builtins.__import__
+
+    def import_without_uvloop(name, *args, **kwargs):
+        if name == "uvloop":
+            raise ImportError("No module named 'uvloop'")
+        return original_import(name, *args, **kwargs)
+
+    monkeypatch.delitem(sys.modules, "uvloop", raising=False)
+    monkeypatch.setattr(builtins, "__import__", import_without_uvloop)
+
+
+def test_get_event_loop_policy_class():
+    assert get_event_loop_policy_class("asyncio") is asyncio.DefaultEventLoopPolicy
+    assert get_event_loop_policy_class(f"{__name__}:CustomEventLoopPolicy") is CustomEventLoopPolicy
+    assert get_event_loop_policy_class(f"{__name__}.CustomEventLoopPolicy") is CustomEventLoopPolicy
+
+    with pytest.raises(ValueError):
+        get_event_loop_policy_class("CustomEventLoopPolicy")
+
+
+def test_uvloop_falls_back_to_asyncio(without_uvloop):
+    assert get_event_loop_policy_class("uvloop") is asyncio.DefaultEventLoopPolicy
+
+
+def test_install_event_loop_policy(restore_policy, monkeypatch):
+    monkeypatch.delenv(EVENT_LOOP_ENVIRONMENT_VARIABLE, raising=False)
+    assert install_event_loop_policy() is None
+
+    policy = install_event_loop_policy(f"{__name__}:CustomEventLoopPolicy")
+    assert isinstance(policy, CustomEventLoopPolicy)
+    assert asyncio.get_event_loop_policy() is policy
+    assert install_event_loop_policy(f"{__name__}:CustomEventLoopPolicy") is policy
+
+    monkeypatch.setenv(EVENT_LOOP_ENVIRONMENT_VARIABLE, "asyncio")
+    assert type(install_event_loop_policy()) is asyncio.DefaultEventLoopPolicy
+
+
+def test_lazy_event_loop(restore_policy):
+    class LoopOwner:
+        event_loop = f"{__name__}:CustomEventLoopPolicy"
+        loop = LazyEventLoop()
+
+    assert not isinstance(asyncio.get_event_loop_policy(), CustomEventLoopPolicy)
+
+    loop = LoopOwner.loop
+    assert isinstance(asyncio.get_event_loop_policy(), CustomEventLoopPolicy)
+    assert LoopOwner().loop is loop
+
+    owner = LoopOwner()
+    owner.loop = asyncio.new_event_loop()
+    assert owner.loop is not loop
+    assert LoopOwner.loop is loop
+
+    owner.loop.close()
+    loop.close()
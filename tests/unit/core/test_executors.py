@@ -0,0 +1,76 @@
+import os
+import threading
+
+import pytest
+
+from tamarco.core.executors import ExecutorsManager, ManagedExecutor, cpu_bound, run_cpu, run_in_thread
+
+
+def get_pid():
+    return os.getpid()
+
+
+def add(a, b=0):
+    return a + b
+
+
+@cpu_bound
+def multiply(a, b):
+    return a * b
+
+
+@pytest.fixture
+def executors(event_loop):
+    executors = ExecutorsManager()
+    executors.configure(thread_pool_size=2, process_pool_size=1)
+    yield executors
+    event_loop.run_until_complete(executors.stop())
+
+
+@pytest.mark.asyncio
+async def test_run_cpu(executors):
+    assert await run_cpu(add, 1, b=2) == 3
+    assert await run_cpu(get_pid) != os.getpid()
+    assert executors.process_pool.size == 1
+
+
+@pytest.mark.asyncio
+async def test_cpu_bound_decorator(executors):
+    assert await multiply(3, 4) == 12
+    assert multiply.__name__ == "multiply"
+
+
+@pytest.mark.asyncio
+async def test_run_in_thread(executors):
+    assert await run_in_thread(threading.get_ident) != threading.get_ident()
+    assert await run_in_thread(add, 2, b=3) == 5
+
+
+@pytest.mark.asyncio
+async def test_managed_executor_meters(event_loop):
+    executor = ManagedExecutor("thread", size=1)
+    release = threading.Event()
+
+    first = event_loop.create_task(executor.run(release.wait))
+    second = event_loop.create_task(executor.run(add, 1))
+    await event_loop.run_in_executor(None, lambda: None)
+
+    assert executor.utilization_meter.value == 1
+    assert executor.queue_depth_meter.value == 1
+
+    release.set()
+    assert await first is True
+    assert await second == 1
+    assert executor.utilization_meter.value == 0
+    assert executor.queue_depth_meter.value == 0
+    assert executor.queue_wait_time_meter.values
+
+    await executor.stop()
+    assert executor.executor is None
+
+
+@pytest.mark.asyncio
+async def test_executor_exceptions_are_propagated(executors):
+    with pytest.raises(ZeroDivisionError):
+        await run_in_thread(lambda: 1 / 0)
+    assert executors.thread_pool.in_flight == 0
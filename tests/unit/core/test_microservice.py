@@ -1,9 +1,24 @@
 import asyncio
+import os
+import signal
 import time
+from functools import partial
+from unittest import mock
 
 import pytest
 
-from tamarco.core.microservice import MicroserviceContext, task, task_timer
+from tamarco.core.microservice import Microservice, MicroserviceContext, task, task_timer
+from tamarco.core.settings.backends import DictSettingsBackend
+from tamarco.core.settings.settings import Settings
+from tamarco.core.signals import SignalsManager
+from tamarco.core.tasks import RestartPolicy
+from tamarco.core.timers import OVERLAP_QUEUE
+from tamarco.core.workers import WorkersPortsCollision
+from tamarco.resources.bases import BaseResource
+from tamarco.resources.basic.metrics.meters import Gauge
+from tamarco.resources.basic.status.status_codes import StatusCodes
+from tamarco.resources.io.http.resource import HTTPServerResource
+from tests.utils import AsyncMock
 
 
 @pytest.fixture
@@ -214,6 +229,21 @@ async def test_task_timer_oneshot(event_loop):
     await test_microservice_task_one_shot.stop()
 
 
+@pytest.mark.asyncio
+async def test_task_timer_queue_overlap():
+    @task_timer(interval=100, overlap=OVERLAP_QUEUE, max_queued=3)
+    async def queued_timer():
+        pass
+
+    with mock.patch("tamarco.core.microservice.Timer") as timer_class:
+        timer_class.return_value.wait = AsyncMock()
+        await queued_timer()
+
+    assert timer_class.call_args[1]["overlap"] == OVERLAP_QUEUE
+    assert timer_class.call_args[1]["max_queued"] == 3
+    timer_class.return_value.cancel.assert_called_once_with()
+
+
 @pytest.mark.asyncio
 async def test_multiple_task(event_loop):
     test_microservice_multiple_task = TaskMultipleTaskAndTimerTask()
@@ -266,3 +296,219 @@ async def test_multiple_task(event_loop):
     assert test_microservice_multiple_task.check_pass_one_shot, "Not executed task oneshot"
     assert len(test_microservice_multiple_task.time_stamp_exec_one_shot) == 1, "Not executed task once"
     assert test_microservice_multiple_task.time_stamp_exec_one_shot[0] - time_start >= 1.45, "Not executed the first"
+
+
+class SlowResource(BaseResource):
+    def __init__(self, start_time, depends_on=(), lifecycle_timeout=None):
+        super().__init__()
+        self.start_time = start_time
+        self.depends_on = list(depends_on)
+        self.lifecycle_timeout = lifecycle_timeout
+        self.started_at = None
+        self.stopped_at = None
+
+    async def start(self):
+        await asyncio.sleep(self.start_time)
+        self.started_at = time.perf_counter()
+        await super().start()
+
+    async def stop(self):
+        await asyncio.sleep(0.01)
+        self.stopped_at = time.perf_counter()
+        await super().stop()
+
+
+class ParallelStartMicroservice(MicroserviceContext):
+    name = "ParallelStartMicroservice"
+
+    database = SlowResource(0.2)
+    kafka = SlowResource(0.2)
+    http = SlowResource(0.1, depends_on=["database", "kafka"])
+    hanging = SlowResource(10, lifecycle_timeout=0.1)
+
+
+@pytest.mark.asyncio
+async def test_start_resources_by_dependency_levels():
+    microservice = ParallelStartMicroservice()
+    await microservice.bind()
+    assert [sorted(level) for level in microservice.resources_levels] == [
+        ["database", "hanging", "kafka"],
+        ["http"],
+    ]
+
+    start_time = time.perf_counter()
+    await microservice.run_in_all_resources("start")
+    elapsed_time = time.perf_counter() - start_time
+
+    # The first level starts concurrently and the hanging resource is abandoned after its timeout.
+    assert elapsed_time < 0.6
+    assert microservice.http.started_at > max(microservice.database.started_at, microservice.kafka.started_at)
+    assert microservice.hanging.started_at is None
+    started_resources = {name for name, times in microservice.resources_lifecycle_times.items() if "start" in times}
+    assert started_resources == {"database", "kafka", "http"}
+    assert microservice.resources_lifecycle_times["database"]["start"] >= 0.2
+    assert microservice.resources_lifecycle_failures == {"hanging": {"start": "Timeout of 0.1 seconds"}}
+    assert (await microservice.hanging.status())["status"] == StatusCodes.FAILED
+
+
+@pytest.mark.asyncio
+async def test_stop_resources_in_reverse_dependency_order():
+    microservice = ParallelStartMicroservice()
+    await microservice.bind()
+
+    await microservice.run_in_all_resources("stop", reverse=True)
+
+    assert microservice.http.stopped_at < min(microservice.database.stopped_at, microservice.kafka.stopped_at)
+
+
+@pytest.mark.asyncio
+async def test_startup_report():
+    microservice = ParallelStartMicroservice()
+
+    await microservice._run_startup_phase("bind", microservice.bind)
+    await microservice._run_startup_phase("start", partial(microservice.run_in_all_resources, "start"))
+    microservice._log_startup_report()
+
+    report = microservice.get_startup_report()
+    assert list(report["phases"]) == ["bind", "start"]
+    assert report["total"] == pytest.approx(sum(report["phases"].values()))
+    assert report["phases"]["start"] >= 0.3
+    assert report["resources"]["database"]["start"] >= 0.2
+    assert "bind" in report["resources"]["hanging"]
+    assert "start" not in report["resources"]["hanging"]
+    assert report["failures"] == {"hanging": {"start": "Timeout of 0.1 seconds"}}
+    assert Gauge("startup_phase_time", "seconds", labels={"phase": "start"}).value == report["phases"]["start"]
+    assert Gauge("startup_time", "seconds").value == report["total"]
+
+
+class WorkersMicroservice(Microservice):
+    name = "WorkersMicroservice"
+    workers = 2
+
+
+@pytest.mark.asyncio
+async def test_load_settings_for_workers_caches_the_whole_tree(event_loop):
+    microservice = WorkersMicroservice()
+    microservice.loop = event_loop
+    microservice.settings = type.__call__(Settings)
+    microservice.settings.external_backend = DictSettingsBackend(
+        {
+            "system": {
+                "deploy_name": "test",
+                "resources": {"tamarco_http_report_server": {"host": "127.0.0.1", "port": 5747}},
+            }
+        }
+    )
+
+    with mock.patch.object(microservice.settings, "start", AsyncMock()), mock.patch(
+        "tamarco.core.microservice.close_etcd_clients", AsyncMock()
+    ):
+        report_address = await microservice._load_settings_for_workers(2)
+
+    assert report_address == ("127.0.0.1", 5747, None)
+    microservice.settings.external_backend = None
+    assert await microservice.settings.get("system.deploy_name") == "test"
+
+
+class WorkersApiMicroservice(WorkersMicroservice):
+    name = "WorkersApiMicroservice"
+    api = HTTPServerResource()
+
+
+@pytest.mark.asyncio
+async def test_load_settings_for_workers_checks_the_workers_ports(event_loop):
+    microservice = WorkersApiMicroservice()
+    microservice.loop = event_loop
+    microservice.settings = type.__call__(Settings)
+    resources_settings = {
+        "api": {"host": "127.0.0.1", "port": 5748},
+        "tamarco_http_report_server": {"host": "127.0.0.1", "port": 5747},
+    }
+    microservice.settings.external_backend = DictSettingsBackend({"system": {"resources": resources_settings}})
+
+    with mock.patch.object(microservice.settings, "start", AsyncMock()), mock.patch(
+        "tamarco.core.microservice.close_etcd_clients", AsyncMock()
+    ):
+        # The report server of the first worker takes by default the report port plus one, the port of the api.
+        with pytest.raises(WorkersPortsCollision):
+            await microservice._load_settings_for_workers(2)
+
+        resources_settings["tamarco_http_report_server"]["workers_ports_base"] = 5800
+        microservice.settings = type.__call__(Settings)
+        microservice.settings.external_backend = DictSettingsBackend({"system": {"resources": resources_settings}})
+        with mock.patch.object(microservice.settings, "start", AsyncMock()):
+            report_address = await microservice._load_settings_for_workers(2)
+
+    assert report_address == ("127.0.0.1", 5747, 5800)
+
+
+@pytest.mark.asyncio
+async def test_task_decorator_with_name_and_restart_policy():
+    class NamedTaskMicroservice(MicroserviceContext):
+        name = "NamedTaskMicroservice"
+
+        @task("named_task")
+        async def named(self):
+            pass
+
+        @task(restart_policy=RestartPolicy(max_restarts=1))
+        async def supervised(self):
+            pass
+
+    assert NamedTaskMicroservice.named._name == "named_task"
+    assert NamedTaskMicroservice.supervised._mark_task
+    with pytest.raises(Exception):
+        task("not_a_coroutine")(lambda self: None)
+
+
+@pytest.mark.asyncio
+async def test_microservice_signals_handlers(event_loop):
+    class SignalsMicroservice(Microservice):
+        name = "SignalsMicroservice"
+
+    microservice = SignalsMicroservice()
+    microservice.signals_manager.set_loop(event_loop)
+    microservice._register_signals_handlers()
+
+    with mock.patch.object(microservice, "stop_gracefully", AsyncMock()) as stop_gracefully, mock.patch.object(
+        microservice.settings, "reload", AsyncMock()
+    ) as reload, mock.patch.object(microservice.logger, "info") as log_info:
+        for signal_number in (signal.SIGTERM, signal.SIGTERM, signal.SIGHUP, signal.SIGUSR2):
+            os.kill(os.getpid(), signal_number)
+            await asyncio.sleep(0.02)
+        await microservice.stop_task
+        await microservice.reload_task
+
+    assert stop_gracefully.call_count == 1
+    assert reload.called
+    assert any("Thread MainThread" in call[0][0] for call in log_info.call_args_list)
+
+
+@pytest.mark.asyncio
+async def test_microservice_slow_settings_reload_on_signal(event_loop):
+    class SlowReloadMicroservice(Microservice):
+        name = "SlowReloadMicroservice"
+
+    microservice = SlowReloadMicroservice()
+    microservice.signals_manager.set_loop(event_loop)
+    reloaded = []
+
+    async def slow_reload():
+        await asyncio.sleep(0.2)
+        reloaded.append(True)
+
+    # Without the handlers of the microservices of other tests, they share the signals manager and the settings.
+    with mock.patch.object(SignalsManager, "handlers", {}), mock.patch.object(
+        microservice.signals_manager, "async_timeout_seconds", 0.05
+    ), mock.patch.object(microservice.settings, "reload", side_effect=slow_reload) as reload:
+        microservice._register_signals_handlers()
+        os.kill(os.getpid(), signal.SIGHUP)
+        await asyncio.sleep(0.02)
+        # A second signal during the reload doesn't start another one.
+        os.kill(os.getpid(), signal.SIGHUP)
+        await asyncio.sleep(0.02)
+        # The reload outlives the timeout of the signal handlers.
+        await microservice.reload_task
+
+    assert reloaded == [True]
+    assert reload.call_count == 1
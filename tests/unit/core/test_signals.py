@@ -1,12 +1,12 @@
 import asyncio
+import os
 import signal
 import threading
-from time import sleep
 from unittest import mock
 
 import pytest
 
-from tamarco.core.signals import SignalsManager, signal_handler
+from tamarco.core.signals import SignalsManager, format_stacks, signal_handler
 
 
 @pytest.mark.asyncio
@@ -18,7 +18,7 @@ async def test_signal_manager(event_loop):
 
     def sigalrm_handler(signum, frame):
         nonlocal flag1
-        flag1 = True
+        flag1 = threading.current_thread() is threading.main_thread()
 
     async def sigint_handler(signum, frame):
         nonlocal flag2
@@ -35,25 +35,63 @@ async def test_signal_manager(event_loop):
     assert sigint_handler == signals_manager.handlers[signal.SIGALRM][1]
     assert exception_handler == signals_manager.handlers[signal.SIGQUIT][0]
 
-    def use_alarm():
-        signal.alarm(1)
-
-    alarm_thread = threading.Thread(target=use_alarm, name="alarm_thread")
-    alarm_thread.start()
-    sleep(1.1)
-    alarm_thread.join()
+    os.kill(os.getpid(), signal.SIGALRM)
+    await asyncio.sleep(0.05)
     assert flag1
-
-    # Allow asyncio to execute queued tasks, in this case the asynchronous signal_number handler
-    await asyncio.sleep(0)
-    await asyncio.sleep(0)
     assert flag2
 
     with mock.patch("tamarco.core.signals.logger") as mock_logger:
-        signals_manager._dispatch_signal(signal.SIGQUIT, None)
+        await signals_manager._dispatch_signal(signal.SIGQUIT)
         assert mock_logger.warning.called
 
 
+@pytest.mark.asyncio
+async def test_repeated_signals_are_coalesced(event_loop):
+    signals_manager = SignalsManager()
+    signals_manager.set_loop(event_loop)
+    calls = []
+
+    async def slow_handler(signum, frame):
+        calls.append(signum)
+        await asyncio.sleep(0.1)
+
+    signals_manager.register_signal(slow_handler, signal.SIGUSR1)
+    for _ in range(3):
+        os.kill(os.getpid(), signal.SIGUSR1)
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.15)
+    os.kill(os.getpid(), signal.SIGUSR1)
+    await asyncio.sleep(0.01)
+    await signals_manager.dispatch_tasks[signal.SIGUSR1]
+
+    assert calls == [signal.SIGUSR1, signal.SIGUSR1]
+
+
+@pytest.mark.asyncio
+async def test_signal_from_thread_runs_handler_in_loop(event_loop):
+    signals_manager = SignalsManager()
+    signals_manager.set_loop(event_loop)
+    handled = asyncio.Event()
+
+    async def sigwinch_handler(signum, frame):
+        handled.set()
+
+    signals_manager.register_signal(sigwinch_handler, signal.SIGWINCH)
+    sender = threading.Thread(target=os.kill, args=(os.getpid(), signal.SIGWINCH))
+    sender.start()
+    sender.join()
+
+    await asyncio.wait_for(handled.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_format_stacks(event_loop):
+    stacks = format_stacks(event_loop)
+
+    assert "Thread MainThread" in stacks
+    assert "test_format_stacks" in stacks
+
+
 def test_signal_handler():
     @signal_handler(signal.SIGALRM)
     def handler():
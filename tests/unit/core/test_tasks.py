@@ -1,10 +1,18 @@
 import asyncio
 import time
 from threading import current_thread
+from unittest import mock
 
 import pytest
 
-from tamarco.core.tasks import TasksManager
+from tamarco.core.tasks import (
+    RestartPolicy,
+    TaskRestartsExceeded,
+    TasksLimiter,
+    TasksManager,
+    get_task_wrapper,
+    get_thread_wrapper,
+)
 
 
 @pytest.fixture
@@ -80,3 +88,209 @@ async def test_thread_handle(event_loop, tasks_manager):
 
     assert len(tasks_manager.threads) == 0
     assert len(tasks_manager.threads_fns) == 0
+
+
+@pytest.mark.asyncio
+async def test_wait_for_start_task_fifo_admission(event_loop, tasks_manager):
+    tasks_manager.task_limit = 1
+    started = []
+    release_first = event_loop.create_future()
+
+    async def worker(name, wait_for=None):
+        started.append(name)
+        if wait_for is not None:
+            await wait_for
+
+    await tasks_manager.wait_for_start_task("first", worker("first", release_first))
+    waiters = [
+        asyncio.ensure_future(tasks_manager.wait_for_start_task(name, worker(name)), loop=event_loop)
+        for name in ("second", "third", "fourth")
+    ]
+    await asyncio.sleep(0)
+    assert tasks_manager.limiter.queue_depth_meter.value == 3
+    assert started == ["first"]
+
+    release_first.set_result(None)
+    await asyncio.wait_for(asyncio.gather(*waiters), timeout=1)
+    await asyncio.sleep(0)
+
+    assert started == ["first", "second", "third", "fourth"]
+    assert tasks_manager.limiter.queue_depth_meter.value == 0
+
+
+@pytest.mark.asyncio
+async def test_wait_for_start_task_group_limit(event_loop, tasks_manager):
+    tasks_manager.set_group_limit("downloads", 1)
+    release_first = event_loop.create_future()
+
+    async def worker(wait_for):
+        await wait_for
+
+    await tasks_manager.wait_for_start_task("download_1", worker(release_first), group="downloads")
+    waiter = asyncio.ensure_future(
+        tasks_manager.wait_for_start_task("download_2", worker(event_loop.create_future()), group="downloads"),
+        loop=event_loop,
+    )
+    await tasks_manager.wait_for_start_task("other", worker(event_loop.create_future()))
+    await asyncio.sleep(0)
+
+    assert set(tasks_manager.tasks) == {"download_1", "other"}
+    assert not waiter.done()
+
+    release_first.set_result(None)
+    await asyncio.wait_for(waiter, timeout=1)
+    assert "download_2" in tasks_manager.tasks
+
+
+@pytest.mark.asyncio
+async def test_wait_for_start_task_cancelled_waiter(event_loop, tasks_manager):
+    tasks_manager.task_limit = 1
+    release_first = event_loop.create_future()
+
+    async def worker(wait_for):
+        await wait_for
+
+    await tasks_manager.wait_for_start_task("first", worker(release_first))
+    cancelled_coro = worker(event_loop.create_future())
+    cancelled_waiter = asyncio.ensure_future(
+        tasks_manager.wait_for_start_task("cancelled", cancelled_coro), loop=event_loop
+    )
+    waiter = asyncio.ensure_future(
+        tasks_manager.wait_for_start_task("second", worker(event_loop.create_future())), loop=event_loop
+    )
+    await asyncio.sleep(0)
+    cancelled_waiter.cancel()
+    cancelled_coro.close()
+    await asyncio.sleep(0)
+
+    release_first.set_result(None)
+    await asyncio.wait_for(waiter, timeout=1)
+    assert list(tasks_manager.tasks) == ["second"]
+    assert tasks_manager.limiter.running == 1
+
+
+@pytest.mark.asyncio
+async def test_limiter_waiter_cancelled_and_discarded_by_a_release(event_loop):
+    limiter = TasksLimiter("test_cancelled_and_discarded", 1)
+    limiter.take()
+    waiter = asyncio.ensure_future(limiter.acquire(event_loop), loop=event_loop)
+    await asyncio.sleep(0)
+
+    # The release discards the cancelled waiter before the cancellation reaches the acquire.
+    waiter.cancel()
+    limiter.release()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert limiter.running == 0
+    assert not limiter.waiters
+
+
+@pytest.mark.asyncio
+async def test_wait_for_start_task_releases_the_slots_on_an_error(event_loop, tasks_manager):
+    tasks_manager.set_group_limit("downloads", 1)
+    group_limiter = tasks_manager.groups_limiters["downloads"]
+
+    async def worker():
+        pass
+
+    coro = worker()
+    with mock.patch.object(tasks_manager.limiter, "acquire", side_effect=RuntimeError), pytest.raises(RuntimeError):
+        await tasks_manager.wait_for_start_task("download", coro, group="downloads")
+    coro.close()
+
+    assert group_limiter.running == 0
+
+
+@pytest.mark.asyncio
+async def test_thread_stop_event(event_loop, tasks_manager):
+    stopped = []
+
+    def worker(stop_event):
+        while not stop_event.wait(10):
+            pass
+        stopped.append(stop_event)
+
+    tasks_manager.register_thread(name="worker", thread_fn=get_thread_wrapper(worker, "worker"))
+    tasks_manager.start_all()
+    thread = tasks_manager.threads["worker"]
+
+    start_time = time.perf_counter()
+    await tasks_manager.stop_all_gracefully(timeout=1)
+
+    assert time.perf_counter() - start_time < 1
+    assert stopped == [thread.stop_event]
+    assert not thread.is_alive()
+    assert tasks_manager.threads == {}
+
+
+@pytest.mark.asyncio
+async def test_stop_all_gracefully_drains_in_flight_tasks(event_loop, tasks_manager):
+    finished = []
+
+    async def long_running():
+        while True:
+            await asyncio.sleep(0.01)
+
+    async def in_flight(name, seconds):
+        await asyncio.sleep(seconds)
+        finished.append(name)
+
+    tasks_manager.register_task(name="long_running", task_coro=long_running)
+    tasks_manager.start_all()
+    long_running_task = tasks_manager.tasks["long_running"]
+    await tasks_manager.wait_for_start_task("fast", in_flight("fast", 0.05))
+    slow_task = await tasks_manager.wait_for_start_task("slow", in_flight("slow", 10))
+
+    start_time = time.perf_counter()
+    await tasks_manager.stop_all_gracefully(timeout=0.2)
+    await asyncio.sleep(0)
+
+    assert 0.2 <= time.perf_counter() - start_time < 1
+    assert finished == ["fast"]
+    assert long_running_task.cancelled()
+    assert slow_task.cancelled()
+    assert tasks_manager.tasks == {}
+
+
+def test_restart_policy_backoff():
+    restart_policy = RestartPolicy(backoff=0.5, backoff_factor=2, max_backoff=3)
+
+    assert [restart_policy.get_backoff(crashes) for crashes in range(1, 6)] == [0.5, 1, 2, 3, 3]
+
+
+@pytest.mark.asyncio
+async def test_supervised_task_restarts(event_loop, tasks_manager):
+    calls = []
+
+    async def flaky():
+        calls.append(event_loop.time())
+        if len(calls) < 3:
+            raise ValueError
+        return "done"
+
+    restart_policy = RestartPolicy(max_restarts=3, window=60, backoff=0.01)
+    task = tasks_manager.start_task("flaky", get_task_wrapper(flaky, "flaky", restart_policy)())
+
+    assert await asyncio.wait_for(task, timeout=1) == "done"
+    assert len(calls) == 3
+    assert calls[2] - calls[1] >= calls[1] - calls[0] >= 0.01
+
+
+@pytest.mark.asyncio
+async def test_supervised_task_escalates_failure(event_loop, tasks_manager):
+    failures = []
+    tasks_manager.add_failure_callback(lambda name, exception: failures.append((name, exception)))
+
+    async def crashing():
+        raise ValueError
+
+    restart_policy = RestartPolicy(max_restarts=2, window=60, backoff=0.01)
+    task = tasks_manager.start_task("crashing", get_task_wrapper(crashing, "crashing", restart_policy)())
+
+    with pytest.raises(TaskRestartsExceeded):
+        await asyncio.wait_for(task, timeout=1)
+    await asyncio.sleep(0)
+
+    assert [name for name, _ in failures] == ["crashing"]
+    assert isinstance(failures[0][1].__cause__, ValueError)
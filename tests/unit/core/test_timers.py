@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+
+from tamarco.core.timers import (
+    FIXED_DELAY,
+    OVERLAP_CONCURRENT,
+    OVERLAP_QUEUE,
+    OVERLAP_SKIP,
+    Timer,
+    get_timers_scheduler,
+)
+
+INTERVAL = 0.05
+
+
+class Recorder:
+    def __init__(self, loop, duration=0):
+        self.loop = loop
+        self.duration = duration
+        self.starts = []
+        self.concurrent = 0
+        self.max_concurrent = 0
+
+    async def __call__(self):
+        self.starts.append(self.loop.time())
+        self.concurrent += 1
+        self.max_concurrent = max(self.max_concurrent, self.concurrent)
+        try:
+            await asyncio.sleep(self.duration)
+        finally:
+            self.concurrent -= 1
+
+
+async def run_timer(timer, seconds):
+    timer.start()
+    await asyncio.sleep(seconds)
+    timer.cancel()
+
+
+@pytest.mark.asyncio
+async def test_fixed_rate_timer_does_not_drift(event_loop):
+    recorder = Recorder(event_loop, duration=INTERVAL / 2)
+    timer = Timer(recorder, INTERVAL, name="test_fixed_rate")
+    start_time = event_loop.time()
+
+    await run_timer(timer, INTERVAL * 6.5)
+
+    assert len(recorder.starts) == 6
+    for number, call_time in enumerate(recorder.starts, start=1):
+        assert call_time - start_time == pytest.approx(INTERVAL * number, abs=INTERVAL / 2)
+    assert timer.lag_meter.values
+
+
+@pytest.mark.asyncio
+async def test_fixed_delay_timer(event_loop):
+    recorder = Recorder(event_loop, duration=INTERVAL)
+    timer = Timer(recorder, INTERVAL, mode=FIXED_DELAY, name="test_fixed_delay")
+
+    await run_timer(timer, INTERVAL * 6.5)
+
+    assert len(recorder.starts) == 3
+    assert recorder.starts[1] - recorder.starts[0] >= INTERVAL * 2
+
+
+@pytest.mark.asyncio
+async def test_overlap_skip(event_loop):
+    recorder = Recorder(event_loop, duration=INTERVAL * 2.5)
+    timer = Timer(recorder, INTERVAL, overlap=OVERLAP_SKIP, name="test_overlap_skip")
+
+    await run_timer(timer, INTERVAL * 6.5)
+
+    assert len(recorder.starts) == 2
+    assert recorder.max_concurrent == 1
+    assert timer.skipped_meter.counter >= 4
+
+
+@pytest.mark.asyncio
+async def test_overlap_queue(event_loop):
+    recorder = Recorder(event_loop, duration=INTERVAL * 2.2)
+    timer = Timer(recorder, INTERVAL, overlap=OVERLAP_QUEUE, name="test_overlap_queue")
+
+    await run_timer(timer, INTERVAL * 6.5)
+
+    # Each call queues the next deadline and skips the following one, the queue holds a single call.
+    assert len(recorder.starts) == 3
+    assert recorder.max_concurrent == 1
+    assert timer.skipped_meter.counter == 2
+    assert timer.queued == []
+
+
+@pytest.mark.asyncio
+async def test_overlap_concurrent(event_loop):
+    recorder = Recorder(event_loop, duration=INTERVAL * 2.5)
+    timer = Timer(recorder, INTERVAL, overlap=OVERLAP_CONCURRENT, name="test_overlap_concurrent")
+
+    await run_timer(timer, INTERVAL * 6.5)
+
+    assert len(recorder.starts) == 6
+    assert recorder.max_concurrent == 3
+
+
+@pytest.mark.asyncio
+async def test_jitter(event_loop):
+    recorder = Recorder(event_loop)
+    timer = Timer(recorder, INTERVAL, jitter=INTERVAL / 2, name="test_jitter")
+    start_time = event_loop.time()
+
+    await run_timer(timer, INTERVAL * 3.7)
+
+    assert len(recorder.starts) == 3
+    for number, call_time in enumerate(recorder.starts, start=1):
+        assert INTERVAL * number <= call_time - start_time <= INTERVAL * (number + 0.5) + INTERVAL / 4
+
+
+@pytest.mark.asyncio
+async def test_timers_share_one_scheduler_task(event_loop):
+    recorders = [Recorder(event_loop) for _ in range(20)]
+    timers = [Timer(recorder, INTERVAL, name=f"test_shared_{number}") for number, recorder in enumerate(recorders)]
+    tasks_before = len(asyncio.all_tasks(event_loop))
+
+    for timer in timers:
+        timer.start()
+    assert len(asyncio.all_tasks(event_loop)) == tasks_before + 1
+
+    await asyncio.sleep(INTERVAL * 2.5)
+    for timer in timers:
+        timer.cancel()
+
+    assert all(len(recorder.starts) == 2 for recorder in recorders)
+    await asyncio.sleep(INTERVAL * 1.5)
+    assert get_timers_scheduler(event_loop).scheduler_task is None
+
+
+@pytest.mark.asyncio
+async def test_one_shot_and_failing_timers_finish(event_loop):
+    recorder = Recorder(event_loop)
+    one_shot_timer = Timer(recorder, INTERVAL, one_shot=True, name="test_one_shot")
+
+    async def fail():
+        raise ValueError
+
+    failing_timer = Timer(fail, INTERVAL, name="test_failing")
+
+    one_shot_timer.start()
+    failing_timer.start()
+    await asyncio.wait_for(one_shot_timer.wait(), timeout=1)
+    with pytest.raises(ValueError):
+        await asyncio.wait_for(failing_timer.wait(), timeout=1)
+
+    assert len(recorder.starts) == 1
+    assert failing_timer.cancelled
@@ -0,0 +1,151 @@
+import json
+import os
+import socket
+import threading
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from tamarco.core.workers import (
+    WorkersReportServer,
+    WorkersPortsCollision,
+    WorkersSupervisor,
+    aggregate_workers_status,
+    check_workers_ports,
+    create_reuse_port_socket,
+    get_worker_port,
+    merge_prometheus_metrics,
+)
+
+
+def test_merge_prometheus_metrics():
+    worker_metrics = (
+        "# HELP ms_requests units requests\n"
+        "# TYPE ms_requests counter\n"
+        'ms_requests{method="get"} 3\n'
+        "# HELP ms_memory units bytes\n"
+        "# TYPE ms_memory gauge\n"
+        "ms_memory 100\n"
+    )
+
+    merged = merge_prometheus_metrics({0: worker_metrics, 1: worker_metrics.replace("100", "200")})
+
+    assert merged.splitlines() == [
+        "# HELP ms_requests units requests",
+        "# TYPE ms_requests counter",
+        'ms_requests{method="get",worker="0"} 3',
+        'ms_requests{method="get",worker="1"} 3',
+        "# HELP ms_memory units bytes",
+        "# TYPE ms_memory gauge",
+        'ms_memory{worker="0"} 100',
+        'ms_memory{worker="1"} 200',
+    ]
+
+
+@pytest.mark.parametrize(
+    "statuses,global_status",
+    [((200, 200), 200), ((200, 102), 102), ((200, 500), 500), ((200, None), 500)],
+)
+def test_aggregate_workers_status(statuses, global_status):
+    workers_status = {
+        index: (status, {"http": {"status": 3}} if status else None) for index, status in enumerate(statuses)
+    }
+
+    status, report = aggregate_workers_status(workers_status)
+
+    assert status == global_status
+    assert report["0"] == {"http": {"status": 3}}
+
+
+def test_workers_share_the_port_with_reuse_port():
+    first_socket = create_reuse_port_socket("127.0.0.1", 0)
+    port = first_socket.getsockname()[1]
+    second_socket = create_reuse_port_socket("127.0.0.1", port)
+    try:
+        assert second_socket.getsockname()[1] == port
+    finally:
+        first_socket.close()
+        second_socket.close()
+    assert get_worker_port(5747, 0) == 5748
+    assert get_worker_port(5747, 1, ports_base=5800) == 5801
+
+
+def test_check_workers_ports():
+    with pytest.raises(WorkersPortsCollision):
+        check_workers_ports({"api": 5748}, {"tamarco_http_report_server": (5747, None)}, workers=2)
+    with pytest.raises(WorkersPortsCollision):
+        check_workers_ports({"api": 5801}, {"tamarco_http_report_server": (5747, 5800)}, workers=2)
+
+    check_workers_ports({"api": 5748}, {"tamarco_http_report_server": (5747, 5800)}, workers=2)
+    check_workers_ports({"api": 5750}, {"tamarco_http_report_server": (5747, None)}, workers=2)
+
+
+def test_supervisor_restarts_dead_workers():
+    read_fd, write_fd = os.pipe()
+
+    def worker(worker_index):
+        os.write(write_fd, str(worker_index).encode())
+
+    supervisor = WorkersSupervisor(worker, workers=2, restart_delay=0.05, stop_timeout=1)
+    timer = threading.Timer(1, supervisor.stop)
+    timer.start()
+    supervisor.start()
+    supervisor.supervise()
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as pipe:
+        started_workers = pipe.read().decode()
+
+    assert supervisor.restarts >= 2
+    assert started_workers.count("0") >= 2 and started_workers.count("1") >= 2
+    assert supervisor.workers == {}
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _worker_report_server(port, metrics, status):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            code, body = (200, metrics) if self.path == "/metrics" else (status, json.dumps({"http": {"status": 3}}))
+            self.send_response(code)
+            self.end_headers()
+            self.wfile.write(body.encode())
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_workers_report_server():
+    port = _free_port()
+    workers_servers = [
+        _worker_report_server(get_worker_port(port, index), "ms_requests 1\n", status)
+        for index, status in enumerate((200, 500))
+    ]
+    threads = threading.active_count()
+    report_server = WorkersReportServer("127.0.0.1", port, workers=2)
+    report_server.start()
+    try:
+        # The report server runs in its own process, the supervisor stays without threads to fork the workers.
+        assert report_server.pid != os.getpid()
+        assert threading.active_count() == threads
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            assert response.read().decode().splitlines() == ['ms_requests{worker="0"} 1', 'ms_requests{worker="1"} 1']
+
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/status")
+        assert exc_info.value.code == 500
+        assert json.loads(exc_info.value.read()) == {"0": {"http": {"status": 3}}, "1": {"http": {"status": 3}}}
+    finally:
+        report_server.stop()
+        for server in workers_servers:
+            server.shutdown()
+            server.server_close()
@@ -29,6 +29,20 @@ async def test_get_status(status_resource):
     assert isinstance(status_response["status"], int)
 
 
+@pytest.mark.asyncio
+async def test_status_with_failed_task(status_resource):
+    failure = Exception("The task consumer crashed 6 times in 60 seconds")
+    try:
+        with mock.patch.object(status_resource, "microservice", Mock(), create=True):
+            status_resource.report_task_failure("consumer", failure)
+            status_response = await status_resource.status()
+    finally:
+        status_resource.failed_tasks = {}
+
+    assert status_response["status"] == StatusCodes.FAILED
+    assert status_response["failed_tasks"] == {"consumer": "The task consumer crashed 6 times in 60 seconds"}
+
+
 @pytest.mark.parametrize(
     "resources_states,global_status",
     [
@@ -63,6 +77,45 @@ async def test_request_status_endpoint():
         assert isinstance(end_response["http_server"]["status"], int)
 
 
+@pytest.mark.asyncio
+async def test_request_settings_trace_endpoint():
+    from tamarco.core.settings.tracing import SettingsTracer
+    from tamarco.resources.basic.status.resource import sanic_settings_trace_endpoint
+
+    with mock.patch("sanic.request.Request") as mock_request:
+        mock_request.args = {}
+        StatusResource().microservice = Mock()
+        StatusResource().microservice.settings.tracer = None
+        response = await sanic_settings_trace_endpoint(mock_request)
+        assert response.status == 404
+
+        StatusResource().microservice.settings.tracer = SettingsTracer()
+        StatusResource().microservice.settings.tracer.record_hit("system.deploy_name", "tamarco.core.microservice")
+        response = await sanic_settings_trace_endpoint(mock_request)
+        assert response.status == 200
+        end_response = ast.literal_eval(response.body.decode("utf-8"))
+        assert end_response["reads"] == 1
+        assert end_response["keys"][0]["key"] == "system.deploy_name"
+
+        for invalid_limit in ("abc", "-1"):
+            mock_request.args = {"limit": invalid_limit}
+            response = await sanic_settings_trace_endpoint(mock_request)
+            assert response.status == 400
+
+
+@pytest.mark.asyncio
+async def test_request_startup_endpoint():
+    from tamarco.resources.basic.status.resource import sanic_startup_endpoint
+
+    startup_report = {"total": 0.5, "phases": {"bind": 0.1, "start": 0.4}, "resources": {"http_server": {"start": 0.3}}}
+    with mock.patch("sanic.request.Request") as mock_request:
+        StatusResource().microservice = Mock()
+        StatusResource().microservice.get_startup_report.return_value = startup_report
+        response = await sanic_startup_endpoint(mock_request)
+        assert response.status == 200
+        assert ast.literal_eval(response.body.decode("utf-8")) == startup_report
+
+
 class StatusMicroservice(Microservice):
     name = "test"
     http_server = HTTPServerResource()
@@ -142,3 +195,39 @@ async def test_restart_resource_on_failure(status_resource):
                 await status_resource._restart_resource_on_failure()
                 start_mock.assert_called()
                 stop_mock.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_restart_resource_on_failure_skips_the_failed_tasks(status_resource):
+    status_resource.resources_to_restart_on_failure = ["all"]
+    with mock.patch(
+        "tamarco.resources.basic.status.resource.StatusResource.start", new_callable=AsyncMock
+    ) as start_mock, mock.patch(
+        "tamarco.resources.basic.status.resource.StatusResource.stop", new_callable=AsyncMock
+    ) as stop_mock:
+        status_resource.microservice = StatusMicroservice()
+        status_resource.failed_tasks = {"consumer": "The task consumer crashed 6 times in 60 seconds"}
+        try:
+            await status_resource._restart_resource_on_failure()
+        finally:
+            status_resource.failed_tasks = {}
+    start_mock.assert_not_called()
+    stop_mock.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_restarted_status_resource_registers_its_callback_and_endpoints_once(status_resource):
+    microservice = Mock()
+    settings = Mock(get=AsyncMock(return_value=[]))
+    with mock.patch.object(status_resource, "_check_status_repeatedly", new_callable=AsyncMock), mock.patch.object(
+        status_resource, "settings", settings
+    ):
+        await status_resource.bind(microservice, "status")
+        await status_resource.start()
+        check_status_task = status_resource.check_status_task
+        await status_resource.stop()
+        await status_resource.start()
+
+    assert microservice.tamarco_http_report_server.add_endpoint.call_count == 3
+    microservice.tasks_manager.add_failure_callback.assert_called_once_with(status_resource.report_task_failure)
+    assert status_resource.check_status_task is check_status_task
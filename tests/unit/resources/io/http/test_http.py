@@ -1,4 +1,6 @@
 import asyncio
+import socket
+from unittest.mock import Mock
 
 import pytest
 from sanic.response import HTTPResponse
@@ -63,3 +65,26 @@ async def test_http_cache_resource_2():
         http_resource.enable_cache_middleware()
     except HTTPErrorCacheMiddlewareEnabled:
         pytest.fail("Error cache middleware enabled.")
+
+
+def test_http_server_listen_address_in_workers():
+    shared_resource = HTTPServerResource()
+    report_resource = HTTPServerResource(shared_between_workers=False)
+    for resource in (shared_resource, report_resource):
+        resource.microservice = Mock(worker_index=None)
+        resource.config = Mock(host="127.0.0.1", port=5747, workers_ports_base=None)
+
+    assert shared_resource._get_listen_address() == {"host": "127.0.0.1", "port": 5747}
+
+    report_resource.microservice.worker_index = 2
+    assert report_resource._get_listen_address() == {"host": "127.0.0.1", "port": 5750}
+    report_resource.config.workers_ports_base = 5800
+    assert report_resource._get_listen_address() == {"host": "127.0.0.1", "port": 5802}
+
+    shared_resource.microservice.worker_index = 2
+    shared_resource.config.port = 0
+    sock = shared_resource._get_listen_address()["sock"]
+    try:
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT)
+    finally:
+        sock.close()